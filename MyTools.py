@@ -7,7 +7,6 @@ import subprocess
 import contextlib
 import itertools
 from prettytable import PrettyTable
-import wcwidth
 from typing import Literal, Union
 from packaging.version import Version, InvalidVersion
 from shutil import get_terminal_size
@@ -55,6 +54,8 @@ def count_width_per_line(s: str) -> list[int]:
         3. 对于\\v、\\f的行为，以bash终端的垂直下移换行为准
            (win11的Windows terminal则将其视为普通的换行符\\n, 而win10及以下的默认终端则无法正常显示)。
     """
+    import wcwidth  # 延迟导入，避免拖慢程序启动
+
     _TAB_SIZE = 8
     terminal_width = fast_get_terminal_size().columns
 
@@ -175,6 +176,37 @@ def clear_lines_above(num_lines: int):
     print(f"\r\033[{num_lines}A\033[J", end="")
 
 
+def redraw_changed_lines(old_lines: list[str], new_lines: list[str], lines_below: int = 0) -> bool:
+    """在终端原位重绘已打印的 old_lines 中发生变化的行（光标需位于 old_lines 最后一行之下第 lines_below + 1 行）。
+
+    Args:
+        lines_below (int): old_lines 与光标所在行之间已打印的行数，默认为 0。不为 0 时重绘后光标回到原来的位置
+            (包括所在列)，可用于在等待用户输入时更新上方的内容。
+
+    Returns:
+        bool: 是否成功原位重绘；若行数不同、存在折行或超出终端显示区域，则不做任何输出并返回 False。
+
+    Notes:
+        1. 仅重绘内容有变化的行，未变化的行保持不动，以避免整屏闪烁。
+        2. 同 clear_lines_above()，lines_below 为 0 时仅使用受 colorama 支持的转义序列；否则还需使用保存与恢复光标
+           位置的转义序列 (ESC 7 / ESC 8)。
+    """
+    if len(old_lines) != len(new_lines) or len(old_lines) + lines_below >= fast_get_terminal_size().lines:
+        return False
+    if any(get_printed_line_count(line) > 1 for line in old_lines + new_lines):
+        return False
+    num_lines = len(old_lines)
+    for i, (old_line, new_line) in enumerate(zip(old_lines, new_lines)):
+        if old_line != new_line:
+            offset = num_lines - i + lines_below
+            if lines_below:
+                print(f"\0337\033[{offset}A\r\033[K{new_line}\0338", end="")
+            else:
+                print(f"\033[{offset}A\r\033[K{new_line}\033[{offset}B\r", end="")
+    print(end="", flush=True)
+    return True
+
+
 def get_folder_size(folder_path: str, verbose: bool = True) -> int:
     """计算包括所有内容在内的文件夹的总大小。
 
@@ -1,39 +1,48 @@
 """This code is authored by azhan."""
 
+import time
+
+_startup_t0 = time.perf_counter()  # 用于 --profile-startup 统计启动耗时
+
 import argparse
+import atexit
+import csv
+import ctypes
 import os
-import asyncio
 import subprocess
 import re
 import sys
 import json
-import time
+import struct
 from packaging.version import Version
 from glob import glob
 from shutil import rmtree
-from threading import Event, Lock, Thread
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Iterable, Literal, TypedDict, Union
+from stat import S_ISDIR
+from threading import Event, Lock, RLock, Thread
+from bisect import bisect_left
+from array import array
+from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Literal, TypedDict, Union
 from prettytable import PrettyTable
 from ColorStr import *
 from MyTools import *
 
 if os.name == "posix":
     import readline  # 使Linux下的input()函数支持上下左右键
-elif os.name == "nt":
-    import win32api
-    import win32com.client
+# <提示> asyncio、win32api、win32com 等较重的模块均在需要时才于函数内导入，以加快程序启动
 
 USER_HOME = os.path.expanduser("~")
 
 PROGRAM_NAME = "Conda-Environment-Manager"
 PROGRAM_VERSION = "1.8.9"
+STARTUP_BUDGET_SECONDS = 0.3  # --profile-startup 所对照的启动耗时预算 (至显示主界面)
 
 # ***** Global User Settings *****
 # <提示> 这些全局设置以CFG_开头，用于控制程序的默认行为，且在程序运行时*不可*更改。
 # [设置 1] 控制[S]搜索功能在这期间内使用缓存搜索，而不重新联网下载索引（单位：分钟）。
 CFG_SEARCH_CACHE_EXPIRE_MINUTES = 60
-# [设置 2] 如果上次重新统计环境大小的耗时超过此设定，则下次需要手动按[D]以重新统计环境大小（单位：秒）。
+# [设置 2] 如果上次重新统计环境大小的耗时超过此设定，则改为在后台统计环境大小，期间主界面可正常使用（单位：秒）。
 CFG_MAX_ENV_SIZE_CALC_SECONDS = 3
 # [设置 3] 控制 DISPLAY_MODE (int) 的初始值: 主界面环境表格显示模式，主界面按[Tab]键可切换，可以是以下值之一：
 #   1: 显示环境的 最后更新时间 和 磁盘实际使用量。
@@ -46,6 +55,17 @@ CFG_FULL_TERMINAL_CLEAR = True
 CFG_CMD_TRIGGERED_PKGS: str = "matplotlib scikit-learn numba pandas ipykernel"
 # [设置 6] 在[S]搜索功能时，默认启用的 Channel 源，即 Conda 包的搜索范围
 CFG_DEFAULT_SEARCH_CHANNELS: str = "pytorch conda-forge defaults"
+# [设置 7] 统计环境大小的方式，可以是以下值之一：
+#   "auto": Conda 主目录位于网络文件系统 (NFS、SMB 等) 上时使用 "metadata"，否则使用 "scan"。
+#   "scan": 遍历环境中的所有文件统计，结果精确。
+#   "metadata": 根据 conda-meta/*.json 与 pip 的 RECORD 中记录的文件大小估计，只需读取每个包的元数据，适合遍历文件
+#       很慢的网络文件系统；不含包以外的文件，实际磁盘占用按表观大小估计。
+CFG_ENV_SIZE_METHOD: Literal["auto", "scan", "metadata"] = "auto"
+# [设置 8] 程序数据的存储方式，可以是以下值之一：
+#   "json": 存储于 data.json 与 size_tree.json，写入时整体替换文件。
+#   "sqlite": 存储于 SQLite 数据库 data.db (WAL 模式)，每个 (发行版, 数据键) 及目录大小树的每个节点各占一行，适合
+#       同时运行多个本程序 (如多个终端窗格、定时任务中的 --print-only) 的情况。首次使用时自动导入 data.json 中的数据。
+CFG_DATA_BACKEND: Literal["json", "sqlite"] = "json"
 
 
 allowed_release_names = [
@@ -113,10 +133,15 @@ def filter_and_sort_sources_by_priority(
 class ProgramDataManager:
     """负责加载、存储和更新程序在用户计算机上存储的数据文件的类。
 
+    数据文件为 JSON Lines 格式，每行为一个 [conda_home, key, value] 记录，损坏的行只会丢失对应的一个键；
+    CFG_DATA_BACKEND 为 "sqlite" 时则存储于 SQLite 数据库，每个 (conda_home, key) 一行。
+    update_data 只在内存中更新并标记为脏，由 flush 合并写入 (主循环每轮一次，以及程序退出时)。
+
     Attributes:
         localappdata_home (str): 本地应用数据的目录路径，取决于操作系统。
         program_data_home (str): 程序数据的主目录路径。
         data_file (str): 数据文件的路径。
+        db_file (str): SQLite 数据库文件的路径。
     """
 
     if os.name == "nt":
@@ -128,57 +153,216 @@ class ProgramDataManager:
     else:
         program_data_home = os.path.join(USER_HOME, "." + PROGRAM_NAME.lower())
     data_file = os.path.join(program_data_home, "data.json")
+    db_file = os.path.join(program_data_home, "data.db")
 
     def __init__(self):
-        self._all_data = self._load_data()
-        self.env_info_data = self._all_data.get(CONDA_HOME, {})
+        self._data: Union[dict[str, Any], None] = None
+        self._dirty_keys: set[tuple[str, str]] = set()
+        self._lock = RLock()  # _all_data 会在持有锁的 flush、update_data 中被访问，故使用可重入锁
+        self._db: Any = None  # sqlite3.Connection，sqlite3 仅在使用 SQLite 存储时导入
+
+    @property
+    def use_sqlite(self) -> bool:
+        return CFG_DATA_BACKEND == "sqlite"
+
+    def _get_db(self) -> Any:
+        """私有方法，获取 SQLite 数据库连接 (调用方需持有 self._lock)，首次连接时建表并导入 data.json 中的数据。"""
+        import sqlite3
+
+        if self._db is None:
+            os.makedirs(self.program_data_home, exist_ok=True)
+            # 各线程共用一个连接，由 self._lock 串行化；timeout 用于等待其他进程的写事务
+            db = sqlite3.connect(self.db_file, timeout=10, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS data ("
+                    "conda_home TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (conda_home, key))"
+                )
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS size_tree ("
+                    "path TEXT PRIMARY KEY, version INTEGER NOT NULL, node TEXT NOT NULL)"
+                )
+                if db.execute("SELECT 1 FROM data LIMIT 1").fetchone() is None:
+                    db.executemany(
+                        "INSERT OR IGNORE INTO data VALUES (?, ?, ?)",
+                        (
+                            (conda_home, key, json.dumps(value, separators=(",", ":")))
+                            for conda_home, home_data in self._load_json_data().items()
+                            for key, value in home_data.items()
+                        ),
+                    )
+            self._db = db
+        return self._db
+
+    @property
+    def _all_data(self) -> dict[str, Any]:
+        """数据文件中的所有数据，首次访问时才从数据文件加载。"""
+        with self._lock:
+            if self._data is None:
+                self._data = self._load_data()
+            return self._data
+
+    def _load_data(self) -> dict[str, Any]:
+        """私有方法，从数据文件或数据库加载数据。
+
+        Returns:
+            dict: 所有数据，形如 {conda_home: {key: value}}。
+        """
+        if not self.use_sqlite:
+            return self._load_json_data()
+        import sqlite3
+
+        data: dict[str, Any] = {}
+        try:
+            rows = self._get_db().execute("SELECT conda_home, key, value FROM data").fetchall()
+        except sqlite3.Error:
+            return data
+        for conda_home, key, value in rows:
+            try:
+                data.setdefault(conda_home, {})[key] = json.loads(value)
+            except json.JSONDecodeError:
+                continue
+        return data
 
-    def _load_data(self):
+    def _load_json_data(self) -> dict[str, Any]:
         """私有方法，从数据文件加载数据。
 
+        兼容旧版本的数据文件 (整个文件为一个 {conda_home: {key: value}} 对象)。无法解析的行被跳过。
+
         Returns:
-            dict: 数据文件中的所有数据。如果文件不存在或无法解析，则返回空字典。
+            dict: 数据文件中的所有数据，形如 {conda_home: {key: value}}。如果文件不存在，则返回空字典。
         """
+        data: dict[str, Any] = {}
         try:
             with open(self.data_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            os.remove(self.data_file)
-            return {}
-        except:
-            return {}
-
-    def _write_data(self):
-        """私有方法，将当前数据写入数据文件。
+                lines = f.readlines()
+        except (OSError, UnicodeDecodeError):
+            return data
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, list) and len(record) == 3:
+                conda_home, key, value = record
+                data.setdefault(conda_home, {})[key] = value
+            elif isinstance(record, dict):  # 旧格式
+                for conda_home, home_data in record.items():
+                    if isinstance(home_data, dict):
+                        data.setdefault(conda_home, {}).update(home_data)
+        return data
+
+    def _write_data(self, data: dict[str, Any]):
+        """私有方法，将数据写入临时文件后原子地替换数据文件，读取方不会读到写了一半的文件。
 
         如果数据目录不存在，则创建该目录。
         """
-        self._all_data[CONDA_HOME] = self.env_info_data
-        if not os.path.exists(self.program_data_home):
-            os.mkdir(self.program_data_home)
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(self._all_data, f)
+        os.makedirs(self.program_data_home, exist_ok=True)
+        tmp_file = f"{self.data_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for conda_home, home_data in data.items():
+                for key, value in home_data.items():
+                    f.write(json.dumps([conda_home, key, value], separators=(",", ":")) + "\n")
+        os.replace(tmp_file, self.data_file)
+
+    def flush(self):
+        """将自上次写入以来更新过的键写入数据文件。
+
+        写入前重新读取数据文件并只覆盖脏键，以保留同时运行的其他实例写入的其他键。
+        """
+        with self._lock:
+            if not self._dirty_keys:
+                return
+            if self.use_sqlite:  # 各键独立成行，在一个事务中只写入脏键
+                import sqlite3
+
+                try:
+                    with self._get_db() as db:
+                        db.executemany(
+                            "INSERT OR REPLACE INTO data VALUES (?, ?, ?)",
+                            [
+                                (
+                                    conda_home,
+                                    key,
+                                    json.dumps(self._all_data[conda_home][key], separators=(",", ":")),
+                                )
+                                for conda_home, key in self._dirty_keys
+                            ],
+                        )
+                except (OSError, sqlite3.Error):
+                    return
+            else:
+                try:
+                    data = self._load_json_data()
+                    for conda_home, key in self._dirty_keys:
+                        data.setdefault(conda_home, {})[key] = self._all_data[conda_home][key]
+                    self._write_data(data)
+                except OSError:
+                    return
+            self._dirty_keys.clear()
+
+    def load_size_tree(self, version: int) -> dict[str, list]:
+        """从数据库读取目录大小树中版本为 version 的所有节点 (仅用于 SQLite 存储，格式见 _load_size_tree)。
+
+        其他版本的节点已不再可用，读取前先将其删除。
+        """
+        import sqlite3
+
+        with self._lock:
+            try:
+                with self._get_db() as db:
+                    db.execute("DELETE FROM size_tree WHERE version != ?", (version,))
+                rows = self._get_db().execute("SELECT path, node FROM size_tree WHERE version = ?", (version,))
+                return {path: json.loads(node) for path, node in rows}
+            except (sqlite3.Error, json.JSONDecodeError):
+                return {}
+
+    def save_size_tree(self, scanned_paths: Iterable[str], nodes: dict[str, list], version: int):
+        """在一个事务中删除数据库中 scanned_paths 下的旧节点并写入新节点，不影响其他路径的节点。"""
+        import sqlite3
+
+        with self._lock:
+            try:
+                with self._get_db() as db:
+                    for path in scanned_paths:
+                        # 以 [prefix, prefix 的后继) 的范围查询利用主键索引，而非逐行比较前缀
+                        prefix = os.path.join(path, "")
+                        db.execute(
+                            "DELETE FROM size_tree WHERE path = ? OR (path >= ? AND path < ?)",
+                            (path, prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)),
+                        )
+                    db.executemany(
+                        "INSERT OR REPLACE INTO size_tree VALUES (?, ?, ?)",
+                        ((path, version, json.dumps(node, separators=(",", ":"))) for path, node in nodes.items()),
+                    )
+            except sqlite3.Error:
+                pass
 
-    def get_data(self, key: str) -> dict[str, Any]:
+    def get_data(self, key: str, conda_home: Union[str, None] = None) -> dict[str, Any]:
         """根据给定的键返回对应的数据字典。
 
         Args:
             key (str): 数据键，形如*_data，描述一个数据的字典。
+            conda_home (str, optional): 数据所属的发行版路径，默认为当前管理的发行版 CONDA_HOME。
 
         Returns:
             dict: 对应键的数据字典。如果键不存在，则返回空字典。
         """
-        return self.env_info_data.get(key, {})
+        return self._all_data.get(conda_home or CONDA_HOME, {}).get(key, {})
 
-    def update_data(self, key: str, value: dict[str, Any]):
-        """更新指定键的数据并写入文件。
+    def update_data(self, key: str, value: dict[str, Any], conda_home: Union[str, None] = None):
+        """更新指定键的数据，并标记为待写入 (见 flush)。
 
         Args:
             key (str): 数据键，形如*_data，描述一个数据的字典。
             value (dict): 更新的单个数据字典。
+            conda_home (str, optional): 数据所属的发行版路径，默认为当前管理的发行版 CONDA_HOME。
         """
-        self.env_info_data[key] = value
-        self._write_data()
+        with self._lock:
+            self._all_data.setdefault(conda_home or CONDA_HOME, {})[key] = value
+            self._dirty_keys.add((conda_home or CONDA_HOME, key))
 
 
 def is_legal_envname(env_name: str, env_namelist: Iterable[str]) -> bool:
@@ -238,8 +422,211 @@ def get_valid_input(prompt: str, condition_func, error_msg_func=None, max_errors
     return inp
 
 
-def get_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
-    """通过 Python 路径列表获取 Python 版本号列表，并支持异步并行获取。
+class PackageIndex:
+    """单个环境的 Conda 包索引，由一次 scandir conda-meta 目录构建，并按各 json 文件的修改时间增量更新。
+
+    Attributes:
+        env_path (str): 环境路径。
+        conda_meta_path (str): 环境的 conda-meta 目录路径。
+
+    Notes:
+        1. 包名、版本号与构建号直接由 conda-meta/*.json 的文件名 (name-version-build.json) 解析，无需读取文件；
+        2. 渠道、大小与依赖等需读取 json 文件的信息仅在首次访问时解析，并按文件修改时间缓存；
+        3. list_packages() 额外合并 site-packages 中由 Pip 安装的包，可代替 `conda list --json` 子进程；
+        4. 应通过 PackageIndex.of(env_path) 获取实例，同一环境的实例在进程内共享，获取时自动增量更新。
+    """
+
+    _instances: dict[str, "PackageIndex"] = {}
+    _instances_lock = Lock()
+
+    def __init__(self, env_path: str):
+        self.env_path = env_path
+        self.conda_meta_path = os.path.join(env_path, "conda-meta")
+        self._entries: dict[str, tuple[str, str, str, float]] = {}  # name -> (version, build, filename, mtime)
+        self._records: dict[str, tuple[float, dict[str, Any]]] = {}  # filename -> (mtime, record)
+        self._pip_records_cache: tuple[Any, list[dict[str, Any]]] = (None, [])
+        self._lock = Lock()
+
+    @classmethod
+    def of(cls, env_path: str) -> "PackageIndex":
+        """获取环境 env_path 的 Conda 包索引 (已增量更新至最新)。"""
+        env_path = os.path.normpath(env_path)
+        with cls._instances_lock:
+            if (index := cls._instances.get(env_path)) is None:
+                index = cls._instances[env_path] = cls(env_path)
+        index.refresh()
+        return index
+
+    def refresh(self):
+        """重新扫描 conda-meta 目录，仅记录文件名与修改时间，已缓存且未变化的包记录会被保留。"""
+        entries = {}
+        try:
+            with os.scandir(self.conda_meta_path) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json") or len(items := entry.name[:-5].rsplit("-", 2)) != 3:
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    entries[items[0]] = (items[1], items[2], entry.name, mtime)
+        except OSError:
+            pass
+        with self._lock:
+            self._entries = entries
+            filenames = {filename for _, _, filename, _ in entries.values()}
+            for filename in self._records.keys() - filenames:
+                del self._records[filename]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_version(self, name: str) -> Union[str, None]:
+        """获取包 name 的版本号，若未安装则返回 None。"""
+        if entry := self._entries.get(name):
+            return entry[0]
+        return None
+
+    def get_record(self, name: str) -> Union[dict[str, Any], None]:
+        """获取包 name 的详细记录，格式同 `conda list --json` 的输出项，并附加 size 与 depends 字段。
+
+        Returns:
+            dict | None: 包记录，包含 name, version, build_string, build_number, channel, base_url, platform,
+                dist_name, size, depends；若未安装或记录文件无法解析则返回 None。
+        """
+        if (entry := self._entries.get(name)) is None:
+            return None
+        version, build, filename, mtime = entry
+        with self._lock:
+            if (cached := self._records.get(filename)) and cached[0] == mtime:
+                return cached[1]
+        try:
+            with open(os.path.join(self.conda_meta_path, filename), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        subdir = meta.get("subdir", "")
+        base_url = meta.get("channel", "")
+        if subdir and base_url.endswith("/" + subdir):  # 去除末尾的 subdir，如 linux-64
+            base_url = base_url[: -len(subdir) - 1]
+        channel = base_url
+        for channel_alias in ("https://conda.anaconda.org/", "https://repo.anaconda.com/"):
+            if channel.startswith(channel_alias):
+                channel = channel[len(channel_alias) :]
+                break
+        record = {
+            "base_url": base_url,
+            "build_number": meta.get("build_number", 0),
+            "build_string": meta.get("build", build),
+            "channel": channel,
+            "dist_name": filename[:-5],
+            "name": name,
+            "platform": subdir,
+            "version": meta.get("version", version),
+            "size": meta.get("size", 0),
+            "depends": meta.get("depends", []),
+        }
+        with self._lock:
+            self._records[filename] = (mtime, record)
+        return record
+
+    def get_records(self) -> list[dict[str, Any]]:
+        """获取环境中所有 Conda 包的详细记录列表，按包名排序 (同 `conda list --json`)。"""
+        return [record for name in sorted(self._entries) if (record := self.get_record(name))]
+
+    def _get_site_packages_path(self) -> Union[str, None]:
+        """获取环境的 site-packages 目录路径，若不存在则返回 None。"""
+        if os.name == "nt":
+            site_packages_path = os.path.join(self.env_path, "Lib", "site-packages")
+        elif pyver := self.get_version("python"):
+            site_packages_path = os.path.join(
+                self.env_path, "lib", f"python{'.'.join(pyver.split('.')[:2])}", "site-packages"
+            )
+        elif glob_res := glob(os.path.join(self.env_path, "lib", "python*", "site-packages")):
+            site_packages_path = glob_res[0]
+        else:
+            return None
+        return site_packages_path if os.path.isdir(site_packages_path) else None
+
+    def get_pip_records(self) -> list[dict[str, Any]]:
+        """获取环境中由 Pip 安装 (即不受 Conda 管理) 的包记录列表，格式同 `conda list --json` 中 channel 为 pypi 的项。
+
+        Notes:
+            1. 扫描 site-packages 下的 *.dist-info 与 *.egg-info，跳过 INSTALLER 为 conda 或与已安装的同名同版本
+               Conda 包对应的项；
+            2. 结果按 site-packages 与 conda-meta 目录的修改时间缓存。
+        """
+        if (site_packages_path := self._get_site_packages_path()) is None:
+            return []
+        try:
+            cache_key = (os.path.getmtime(site_packages_path), os.path.getmtime(self.conda_meta_path))
+        except OSError:
+            cache_key = None
+        with self._lock:
+            if cache_key is not None and self._pip_records_cache[0] == cache_key:
+                return self._pip_records_cache[1]
+
+        pip_records = []
+        with os.scandir(site_packages_path) as it:
+            for entry in it:
+                if entry.name.endswith(".dist-info"):
+                    metadata_file = "METADATA"
+                elif entry.name.endswith(".egg-info"):
+                    metadata_file = "PKG-INFO" if entry.is_dir() else ""
+                else:
+                    continue
+                name, _, version = entry.name.rsplit(".", 1)[0].partition("-")
+                version = version.split("-")[0]
+                if not version and metadata_file:  # 如开发模式安装的 foo.egg-info
+                    try:
+                        with open(os.path.join(entry.path, metadata_file), "r", encoding="utf-8") as f:
+                            for line in f:
+                                if line.startswith("Version:"):
+                                    version = line.split(":", 1)[1].strip()
+                                    break
+                    except OSError:
+                        pass
+                name = name.lower().replace("_", "-")
+                if self.get_version(name) == version:
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "INSTALLER"), "r", encoding="utf-8") as f:
+                        if f.read().strip() == "conda":
+                            continue
+                except OSError:
+                    pass
+                pip_records.append(
+                    {
+                        "base_url": "https://conda.anaconda.org/pypi",
+                        "build_number": 0,
+                        "build_string": "pypi_0",
+                        "channel": "pypi",
+                        "dist_name": f"{name}-{version}-pypi_0",
+                        "name": name,
+                        "platform": "pypi",
+                        "version": version,
+                    }
+                )
+        pip_records.sort(key=lambda record: record["name"])
+
+        if cache_key is not None:
+            with self._lock:
+                self._pip_records_cache = (cache_key, pip_records)
+        return pip_records
+
+    def list_packages(self) -> list[dict[str, Any]]:
+        """进程内的 `conda list --json` 替代：返回 Conda 包与 Pip 包合并后按包名排序的记录列表。"""
+        return sorted(self.get_records() + self.get_pip_records(), key=lambda record: record["name"])
+
+
+def _probe_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
+    """通过 Python 路径列表获取 Python 版本号列表 (不使用缓存)，并支持异步并行获取。
 
     Args:
         paths (list[str]): Python 路径列表。
@@ -247,10 +634,14 @@ def get_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
     Returns:
         list[str | None]: 获取到的 Python 版本号列表，如果路径无效则为 None。
     """
+    import asyncio
+
     sem = asyncio.Semaphore(5)
     if os.name == "nt":
 
         def get_file_version(file_path: str):
+            import win32api
+
             try:
                 info = win32api.GetFileVersionInfo(file_path, "\\")
                 file_version = ".".join(  # 提取版本号
@@ -269,11 +660,10 @@ def get_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
             probable_env_path = os.path.dirname(pypath)
         else:  # os.name == "posix":
             probable_env_path = os.path.dirname(os.path.dirname(pypath))
-        if os.path.exists(conda_meta_path := os.path.join(probable_env_path, "conda-meta")):
-            if glob_res := glob(os.path.join(conda_meta_path, "python-*.json")):
-                for res in glob_res:
-                    if match := re.search(r"python-(\d\.\d{1,2}\.\d{1,2})", res):
-                        return match[1]
+        if (pyver := PackageIndex.of(probable_env_path).get_version("python")) and re.match(
+            r"\d\.\d{1,2}\.\d{1,2}$", pyver
+        ):
+            return pyver
         async with sem:
             try:
                 proc = await asyncio.create_subprocess_exec(
@@ -294,6 +684,77 @@ def get_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
     return asyncio.run(main())
 
 
+def _get_pyver_cache_key(pypath: str) -> Union[list[float], None]:
+    """获取 Python 版本缓存的校验键 [conda-meta 修改时间, 解释器修改时间]，若解释器不存在则返回 None。"""
+    try:
+        pypath_mtime = os.stat(pypath).st_mtime
+    except OSError:
+        return None
+    if os.name == "nt":
+        probable_env_path = os.path.dirname(pypath)
+    else:  # os.name == "posix":
+        probable_env_path = os.path.dirname(os.path.dirname(pypath))
+    try:
+        conda_meta_mtime = os.stat(os.path.join(probable_env_path, "conda-meta")).st_mtime
+    except OSError:
+        conda_meta_mtime = 0
+    return [conda_meta_mtime, pypath_mtime]
+
+
+def resolve_pyvers_from_paths(pypathlist: Iterable[str]) -> tuple[list[str | None], list[bool]]:
+    """批量获取 Python 版本号，优先使用保存在程序数据中的缓存，并报告各解释器是否命中缓存。
+
+    Args:
+        pypathlist (Iterable[str]): Python 解释器路径列表。
+
+    Returns:
+        tuple: 包含以下信息的元组：
+            - pyvers (list[str | None]): 获取到的 Python 版本号列表，如果路径无效则为 None。
+            - cache_hits (list[bool]): 对应解释器的版本号是否直接取自缓存。
+
+    Notes:
+        1. 缓存以解释器路径为键，并以 conda-meta 目录与解释器本身的修改时间校验，故命中缓存时仅需 stat 调用；
+        2. 仅未命中缓存的解释器才会交由 _probe_pyvers_from_paths 解析 (必要时启动子进程)。
+    """
+    pypathlist = list(pypathlist)
+    pyvers_data = data_manager.get_data("pyvers_data")
+    cache_keys = [_get_pyver_cache_key(pypath) for pypath in pypathlist]
+    pyvers: list[str | None] = [None] * len(pypathlist)
+    cache_hits = [False] * len(pypathlist)
+    missed_indices = []
+    for i, (pypath, cache_key) in enumerate(zip(pypathlist, cache_keys)):
+        if cache_key is None:  # 解释器不存在
+            continue
+        if (record := pyvers_data.get(pypath)) and record["key"] == cache_key:
+            pyvers[i] = record["pyver"]
+            cache_hits[i] = True
+        else:
+            missed_indices.append(i)
+
+    if missed_indices:
+        for i, pyver in zip(missed_indices, _probe_pyvers_from_paths([pypathlist[i] for i in missed_indices])):
+            pyvers[i] = pyver
+        new_pyvers_data = {pypath: record for pypath, record in pyvers_data.items() if os.path.exists(pypath)}
+        for i in missed_indices:
+            if pyvers[i]:
+                new_pyvers_data[pypathlist[i]] = {"key": cache_keys[i], "pyver": pyvers[i]}
+        data_manager.update_data("pyvers_data", new_pyvers_data)
+
+    return pyvers, cache_hits
+
+
+def get_pyvers_from_paths(pypathlist: Iterable[str]) -> list[str | None]:
+    """通过 Python 路径列表获取 Python 版本号列表 (带持久化缓存，见 resolve_pyvers_from_paths)。
+
+    Args:
+        paths (list[str]): Python 路径列表。
+
+    Returns:
+        list[str | None]: 获取到的 Python 版本号列表，如果路径无效则为 None。
+    """
+    return resolve_pyvers_from_paths(pypathlist)[0]
+
+
 def get_conda_homes(detect_mode=False) -> list[str]:
     """获取受支持的 conda 发行版的安装路径去重列表。
 
@@ -322,6 +783,8 @@ def get_conda_homes(detect_mode=False) -> list[str]:
         else:
 
             def get_shortcut_arguments(shortcut_path: str):
+                import win32com.client
+
                 try:
                     shell = win32com.client.Dispatch("WScript.Shell")
                     shortcut = shell.CreateShortCut(shortcut_path)
@@ -432,7 +895,18 @@ def detect_conda_mamba_infos(conda_home: str):
             3. mamba_version (str | None): Mamba 的版本号，如果未安装则为 None。
             4. libmamba_solver_version (str | None): conda-libmamba-solver 的版本号，如果未安装则为 None。
             5. conda_version (str | None): Conda 的版本号，如果未安装则为 None。
+
+    Note:
+        检测结果按 conda-meta 目录的修改时间保存在该发行版的程序数据中，未变化时无需再扫描 conda-meta。
     """
+    try:
+        conda_meta_mtime = os.stat(os.path.join(conda_home, "conda-meta")).st_mtime
+    except OSError:
+        conda_meta_mtime = 0
+    conda_infos_data = data_manager.get_data("conda_infos_data", conda_home)
+    if conda_infos_data.get("conda_meta_mtime") == conda_meta_mtime and conda_infos_data.get("infos"):
+        return tuple(conda_infos_data["infos"])
+
     conda_exe_path = (
         os.path.join(conda_home, "Scripts", "conda.exe")
         if os.name == "nt"
@@ -443,27 +917,25 @@ def detect_conda_mamba_infos(conda_home: str):
         if os.name == "nt"
         else os.path.exists(os.path.join(conda_home, "bin", "mamba"))
     )
-    mamba_version = None
-    if is_mamba:
-        if glob_res := glob(os.path.join(conda_home, "conda-meta", "mamba-*.json")):
-            for res in glob_res:
-                if match := re.search(r"mamba-(\d+\.\d+(?:\.\d+)?)", res):
-                    mamba_version = match[1]
-                    break
-    libmamba_solver_version = None
-    if glob_res := glob(os.path.join(conda_home, "conda-meta", "conda-libmamba-solver-*.json")):
-        for res in glob_res:
-            if match := re.search(r"conda-libmamba-solver-(\d+\.\d+(?:\.\d+)?)", res):
-                libmamba_solver_version = match[1]
-                break
-    conda_version = None
-    if glob_res := glob(os.path.join(conda_home, "conda-meta", "conda-*.json")):
-        for res in glob_res:
-            if match := re.search(r"conda-(\d+\.\d+(?:\.\d+)?)", res):
-                conda_version = match[1]
-                break
+    package_index = PackageIndex.of(conda_home)
 
-    return conda_exe_path, is_mamba, mamba_version, libmamba_solver_version, conda_version
+    def get_pkg_version(pkg_name: str) -> Union[str, None]:
+        if (version := package_index.get_version(pkg_name)) and (
+            match := re.match(r"\d+\.\d+(?:\.\d+)?", version)
+        ):
+            return match[0]
+        return None
+
+    mamba_version = get_pkg_version("mamba") if is_mamba else None
+    libmamba_solver_version = get_pkg_version("conda-libmamba-solver")
+    conda_version = get_pkg_version("conda")
+
+    conda_infos = (conda_exe_path, is_mamba, mamba_version, libmamba_solver_version, conda_version)
+    if conda_meta_mtime:
+        data_manager.update_data(
+            "conda_infos_data", {"conda_meta_mtime": conda_meta_mtime, "infos": conda_infos}, conda_home
+        )
+    return conda_infos
 
 
 def should_show_other_envs(other_envs: list[str]):
@@ -513,41 +985,52 @@ def detect_conda_installation(prior_release_name: str = ""):
     return conda_home, conda_exe_path, is_mamba, mamba_version, libmamba_solver_version, conda_version
 
 
+def init_conda_installation(prefix: Union[str, None] = None, distribution_name: Union[str, None] = None):
+    """检测 Conda 安装情况，并设置当前管理的发行版的全局信息 (CONDA_HOME 等)。
+
+    Args:
+        prefix (str, optional): 指定的发行版安装路径，若无效则使用默认发行版。
+        distribution_name (str, optional): 优先检测的发行版名称。
+    """
+    global CONDA_HOME, CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION
+    if prefix is not None:
+        if is_valid_env(prefix):
+            CONDA_HOME = os.path.realpath(prefix)
+            CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION = (
+                detect_conda_mamba_infos(CONDA_HOME)
+            )
+            return
+        print(YELLOW(f'[提示] 未在指定路径"{prefix}"检测到对应发行版，将使用默认发行版'))
+    CONDA_HOME, CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION = (
+        detect_conda_installation(distribution_name or "")
+    )
+    if distribution_name is not None and os.path.split(CONDA_HOME)[1].lower() != distribution_name.lower():
+        print(YELLOW(f"[提示] 未检测到指定的发行版 ({distribution_name})，将使用默认发行版"))
+
+
 # ***** Global Literals & Control Variables *****
-CONDA_HOME, CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION = (
-    detect_conda_installation()
-)
-data_manager = ProgramDataManager()
+data_manager = ProgramDataManager()  # 数据文件在首次读写时才加载
+atexit.register(data_manager.flush)
+# 以下发行版信息在程序入口处 (init_conda_installation) 才检测，导入本模块不会产生任何检测开销
+CONDA_HOME: str = "error"
+CONDA_EXE_PATH: str = "error"
+IS_MAMBA: bool = False
+MAMBA_VERSION: Union[str, None] = None
+LIBMAMBA_SOLVER_VERSION: Union[str, None] = None
+CONDA_VERSION: Union[str, None] = None
 main_display_mode = CFG_DEFAULT_DISPLAY_MODE
 env_size_recalc_force_enable = False
-env_size_recalc_need_confirm = False
 action_status: Literal[0, 1] = 1  # 存储 do_action 函数执行后的状态，0 为退出，1 为继续
 
 
 def detect_conda_libmamba_solver_enabled() -> bool:
-    """通过 .condarc 文件检测是否启用了libmamba求解器"""
+    """通过 .condarc 配置 (见 load_condarc) 检测是否启用了libmamba求解器"""
     if not LIBMAMBA_SOLVER_VERSION:
         return False
-    user_condarc_path = os.path.join(USER_HOME, ".condarc")
-    sys_condarc_path = os.path.join(CONDA_HOME, ".condarc")
-    if os.path.exists(user_condarc_path):
-        with open(user_condarc_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            for line in lines:
-                if match := re.match(r"(?:solver|experimental_solver)\s*:\s+(\w+)", line):
-                    if match[1] == "libmamba":
-                        return True
-                    elif match[1] == "classic":
-                        return False
-    if os.path.exists(sys_condarc_path):
-        with open(sys_condarc_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            for line in lines:
-                if match := re.match(r"(?:solver|experimental_solver)\s*:\s+(\w+)", line):
-                    if match[1] == "libmamba":
-                        return True
-                    elif match[1] == "classic":
-                        return False
+    if (solver := load_condarc()["solver"]) == "libmamba":
+        return True
+    elif solver == "classic":
+        return False
     if CONDA_VERSION and Version(CONDA_VERSION) >= Version("23.10"):
         return True
     return False
@@ -604,6 +1087,28 @@ def _get_envpath_last_modified_time(path: str, pyver: str):
     return max(path_mtime, conda_meta_mtime), site_packages_mtime
 
 
+def _get_env_fingerprint(env_path: str) -> list[float]:
+    """获取环境的指纹，即 conda-meta、conda-meta/history 及 site-packages 目录的最后修改时间列表。
+
+    Note:
+        指纹未变化的环境，其 Python 版本、安装日期与最后更新日期均无需重新获取。
+    """
+    conda_meta_path = os.path.join(env_path, "conda-meta")
+    meta_history_path = os.path.join(conda_meta_path, "history")
+    if os.name == "nt":
+        site_packages_paths = [os.path.join(env_path, "Lib", "site-packages")]
+    else:  # os.name == "posix":
+        site_packages_paths = glob(os.path.join(env_path, "lib", "python*", "site-packages"))
+
+    fingerprint = []
+    for path in (conda_meta_path, meta_history_path, *site_packages_paths):
+        try:
+            fingerprint.append(os.path.getmtime(path))
+        except OSError:
+            fingerprint.append(0)
+    return fingerprint
+
+
 def _get_base_env_modified_info():
     """获取 base 环境的(pkgs_item_count, pkgs_mtime)信息，用于判断是否需要重新计算所有环境大小"""
     pkgs_path = os.path.join(CONDA_HOME, "pkgs")
@@ -624,7 +1129,12 @@ def _get_base_env_modified_info():
 
 
 def get_paths_totalsize_list(pathlist: Iterable[str]) -> list[int]:
-    """根据 文件夹路径列表 获取对应的 文件夹大小列表。"""
+    """根据 文件夹路径列表 获取对应的 文件夹大小 (表观大小) 列表。"""
+    if os.name == "posix":
+        return [get_paths_sizes_linux([path])[1][0] for path in pathlist]
+
+    import asyncio
+
     sem = asyncio.Semaphore(8)
 
     async def get_folder_size_with_semaphore(path):
@@ -638,150 +1148,790 @@ def get_paths_totalsize_list(pathlist: Iterable[str]) -> list[int]:
     return asyncio.run(get_sizes_async())
 
 
-def _get_envsizes_linux(pathlist: list[str]):
-    """Linux下获取各环境的磁盘占用情况。
+_size_tree_lock = Lock()
+_size_tree_cache: Union[dict[str, list], None] = None
+_size_tree_log_lines: Union[int, None] = None  # 大小树文件中的记录行数，为 None 时下次保存需重写整个文件
+# 首行为 {"version": SIZE_TREE_VERSION}，其后每行为一条 [目录路径, 节点] 记录 (节点为 null 表示已删除)，后出现的覆盖先出现的
+SIZE_TREE_FILE = os.path.join(ProgramDataManager.program_data_home, "size_tree.json")
+SIZE_TREE_VERSION = 5  # 节点格式变化时递增，旧版本的文件将被忽略
+_scan_progress_lock = Lock()
+
+
+def _load_size_tree() -> dict[str, list]:
+    """加载持久化的目录大小树，每个进程只读取一次文件。
 
     Returns:
-        tuple: 包含以下信息的元组：
-            - real_usage_list (list[int]): 环境实际磁盘占用大小列表。
-            - total_size_list (list[int]): 环境表观总大小列表。
-            - disk_usage (int): Conda 环境总磁盘占用大小。
+        dict: {目录路径: [st_mtime_ns, st_dev, real, apparent, 子目录名列表, 硬链接文件列表, 文件数, 链接戳,
+            硬链接文件名列表]}，其中 real 与 apparent 为该目录本身及其中非目录、仅有一个硬链接的项的大小之和；硬链接文件
+            列表为展平的 [st_ino, st_blocks, st_size, st_nlink, ...]，其文件名按相同顺序记录于硬链接文件名列表；文件数为
+            其中非目录项的个数；链接戳为列出该目录 (或上次确认其硬链接数未变) 时的链接戳，见 get_paths_sizes_linux。
     """
+    global _size_tree_cache, _size_tree_log_lines
+    with _size_tree_lock:
+        if _size_tree_cache is None and data_manager.use_sqlite:
+            _size_tree_cache = data_manager.load_size_tree(SIZE_TREE_VERSION)
+        elif _size_tree_cache is None:
+            size_tree: dict[str, list] = {}
+            log_lines = 0
+            try:
+                with open(SIZE_TREE_FILE, "r", encoding="utf-8") as f:
+                    header = json.loads(f.readline())
+                    if not isinstance(header, dict) or header["version"] != SIZE_TREE_VERSION:
+                        raise ValueError
+                    for line in f:
+                        if not line.endswith("\n"):  # 写入时被中断，下次保存时重写整个文件
+                            raise ValueError
+                        log_lines += 1
+                        try:
+                            path, node = json.loads(line)
+                        except (ValueError, TypeError):
+                            continue
+                        if node is None:
+                            size_tree.pop(path, None)
+                        else:
+                            size_tree[path] = node
+                _size_tree_log_lines = log_lines
+            except (OSError, ValueError, KeyError):
+                _size_tree_log_lines = None
+            _size_tree_cache = size_tree
+        return _size_tree_cache
 
-    class ProgressBar(Thread):
-        def __init__(self, calc_cost_time: int):
-            super().__init__(daemon=True)
-            self.is_running = Event()
-            self.calc_cost_time = calc_cost_time
-            self.bar_length = 30
-
-        def run(self):
-            while True:
-                if not self.is_running.is_set():
-                    break
-                self._show_process()
-                time.sleep(0.02)
 
-        def start(self):
-            self.last_print_str = ""
-            self.start_time = time.time()
-            self.is_running.set()  # 设置运行信号
-            super().start()
+def _save_size_tree(scanned_paths: Iterable[str], nodes: dict[str, list]):
+    """用本次扫描得到的节点替换 scanned_paths 下的旧节点 (其中已删除的目录随之移除)，并写回文件或数据库。
 
-        def stop(self):
-            self.is_running.clear()  # 清除运行信号
+    Note:
+        文件存储时只在文件末尾追加有变化的节点与已删除的目录；追加的记录过多 (超过有效节点数的两倍) 时才重写整个文件。
+    """
+    global _size_tree_cache, _size_tree_log_lines
+    scanned_paths = list(scanned_paths)
+    prefixes = tuple(os.path.join(path, "") for path in scanned_paths)
+    with _size_tree_lock:
+        last_size_tree = _size_tree_cache or {}
+        size_tree = {
+            path: node
+            for path, node in last_size_tree.items()
+            if not (path.startswith(prefixes) or os.path.join(path, "") in prefixes)
+        }
+        size_tree.update(nodes)
+        _size_tree_cache = size_tree
+        if data_manager.use_sqlite:
+            data_manager.save_size_tree(scanned_paths, nodes, SIZE_TREE_VERSION)
+            return
+        changes = [(path, node) for path, node in size_tree.items() if last_size_tree.get(path) != node]
+        changes.extend((path, None) for path in last_size_tree if path not in size_tree)
+        try:
+            if (
+                _size_tree_log_lines is None
+                or _size_tree_log_lines + len(changes) > 2 * len(size_tree) + 1000
+                or not os.path.isfile(SIZE_TREE_FILE)
+            ):
+                os.makedirs(os.path.dirname(SIZE_TREE_FILE), exist_ok=True)
+                tmp_file = f"{SIZE_TREE_FILE}.{os.getpid()}.tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(json.dumps({"version": SIZE_TREE_VERSION}) + "\n")
+                    for path, node in size_tree.items():
+                        f.write(json.dumps([path, node], separators=(",", ":")) + "\n")
+                os.replace(tmp_file, SIZE_TREE_FILE)
+                _size_tree_log_lines = len(size_tree)
+            elif changes:
+                with open(SIZE_TREE_FILE, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(change, separators=(",", ":")) + "\n" for change in changes))
+                _size_tree_log_lines += len(changes)
+        except OSError:
+            pass
 
-        def _show_process(self):
-            elapsed_time = time.time() - self.start_time
 
-            percentage_str = f"{elapsed_time / self.calc_cost_time :>5.0%}"
+def _get_dir_size_node(
+    dir_path: str, st: os.stat_result, last_nodes: dict[str, list], links_stamp: int = 0, in_pkgs: bool = False
+) -> Union[list, None]:
+    """获取目录 dir_path 的大小树节点，格式见 _load_size_tree。
 
-            num_blocks = int(elapsed_time / self.calc_cost_time * self.bar_length)
-            if num_blocks <= self.bar_length:
-                num_dots = self.bar_length - num_blocks - 1
-                bar = "[" + "=" * num_blocks + ">" * min(1, num_dots + 1) + "." * num_dots + "]"
+    Note:
+        目录内增删、重命名任一项都会更新目录的 mtime，故 mtime 与链接戳 links_stamp 均未变时直接复用上次的节点，
+        不再列出该目录；其子目录是否变化由子目录各自的 mtime 判断。其他目录中增删硬链接不会改变本目录的 mtime，故
+        链接戳变化时：包缓存中 (in_pkgs) 的目录重新列出 (其中仅有一个硬链接的文件可能已被链接到环境)；其余目录只重新
+        lstat 节点中记录的各硬链接文件，其 st_nlink 均未变时复用节点并更新其链接戳，否则重新列出该目录。
+    """
+    node = last_nodes.get(dir_path)
+    if node is not None and node[0] == st.st_mtime_ns and node[1] == st.st_dev:
+        if node[7] == links_stamp:
+            return node
+        if not in_pkgs:
+            node_hardlinks = node[5]
+            for i, name in enumerate(node[8]):
+                try:
+                    link_st = os.lstat(os.path.join(dir_path, name))
+                except OSError:
+                    break
+                if link_st.st_ino != node_hardlinks[i * 4] or link_st.st_nlink != node_hardlinks[i * 4 + 3]:
+                    break
             else:
-                num_blocks %= self.bar_length
-                num_dots = self.bar_length - num_blocks - 1
-                bar = "[" + "=" * num_blocks + ">" + "=" * num_dots + "]"
-
-            elapsed_mins, elapsed_secs = map(int, divmod(elapsed_time, 60))
-            elapsed_time_str = f"{elapsed_mins:02d}:{elapsed_secs:02d}"
+                return node[:7] + [links_stamp] + node[8:]  # last_nodes 由多个线程共享，不原地修改
+
+    real, apparent = st.st_blocks * 512, st.st_size
+    subdir_names = []
+    hardlinks = []
+    hardlink_names = []
+    file_count = 0
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdir_names.append(entry.name)
+                    continue
+                try:
+                    entry_st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                file_count += 1
+                if entry_st.st_nlink > 1:
+                    hardlinks.extend((entry_st.st_ino, entry_st.st_blocks, entry_st.st_size, entry_st.st_nlink))
+                    hardlink_names.append(entry.name)
+                else:
+                    real += entry_st.st_blocks * 512
+                    apparent += entry_st.st_size
+    except OSError:
+        return None
+
+    return [
+        st.st_mtime_ns,
+        st.st_dev,
+        real,
+        apparent,
+        subdir_names,
+        hardlinks,
+        file_count,
+        links_stamp,
+        hardlink_names,
+    ]
 
-            if elapsed_time < self.calc_cost_time:
-                remaining_time = self.calc_cost_time - elapsed_time
-                remaining_mins, remaining_secs = map(int, divmod(remaining_time, 60))
-                remaining_time_str = f"{remaining_mins:02d}:{remaining_secs:02d}"
-            else:
-                remaining_time_str = "--:--"
 
-            print_str = f"{percentage_str} {bar} {elapsed_time_str}<{remaining_time_str}"
-            if print_str != self.last_print_str:
-                self.last_print_str = print_str
-                print(print_str, end="\r", flush=True)
+def _scan_dir_sizes(
+    dir_path: str,
+    exclude_paths: frozenset[str],
+    last_nodes: dict[str, list],
+    recursive: bool = True,
+    cancel_event: Union[Event, None] = None,
+    progress: Union[list[int], None] = None,
+    links_stamp: int = 0,
+    in_pkgs: bool = False,
+) -> tuple[int, int, dict[tuple[int, int], list[int]], dict[str, list]]:
+    """遍历目录 dir_path (不跟随符号链接，跳过 exclude_paths 中的目录)，统计其中所有项的大小。
 
-    if calc_cost_time := data_manager.get_data("envs_size_data").get("calc_cost_time"):
-        progress_bar = ProgressBar(calc_cost_time)
-        progress_bar.start()
+    Args:
+        dir_path (str): 目录路径，也可以是文件路径。
+        exclude_paths (frozenset[str]): 不统计的目录路径。
+        last_nodes (dict[str, list]): 上次保存的目录大小树，mtime 未变的目录直接复用其中的节点。
+        recursive (bool): 是否统计子目录，为 False 时只统计 dir_path 本身及其中的非目录项。
+        cancel_event (Event, optional): 被设置后立即停止遍历，返回的统计结果不完整，但 nodes 中的节点仍然有效。
+        progress (list[int], optional): 进度计数 [文件数, 字节数 (表观大小), 目录数]，每统计完一个目录即累加，
+            可由多个线程共享。
+        links_stamp (int): 链接戳，见 get_paths_sizes_linux 与 _get_dir_size_node。
+        in_pkgs (bool): dir_path 是否位于包缓存目录中。
 
-    disk_usage = 0
-    real_usage_list = [0] * len(pathlist)
+    Returns:
+        tuple: 包含以下信息的元组：
+            - real (int): 仅有一个硬链接的项 (含目录本身与符号链接) 的实际磁盘占用 (st_blocks * 512) 之和。
+            - apparent (int): 同上各项的表观大小 (st_size) 之和。
+            - hardlinks (dict): 有多个硬链接的文件，{(st_dev, st_ino): [st_blocks * 512, st_size, st_nlink, 遍历中
+              遇到的链接数]}，由调用方按 inode 去重后再累加。
+            - nodes (dict): 本次遍历到的目录的大小树节点。
+    """
+    real = apparent = 0
+    hardlinks: dict[tuple[int, int], list[int]] = {}
+    nodes: dict[str, list] = {}
+    try:
+        st = os.lstat(dir_path)
+    except OSError:
+        return 0, 0, {}, {}
+    if not S_ISDIR(st.st_mode):
+        if progress is not None:
+            with _scan_progress_lock:
+                progress[0] += 1
+                progress[1] += st.st_size
+        if st.st_nlink > 1:
+            return 0, 0, {(st.st_dev, st.st_ino): [st.st_blocks * 512, st.st_size, st.st_nlink, 1]}, {}
+        return st.st_blocks * 512, st.st_size, {}, {}
+
+    stack = [(dir_path, st)]
+    while stack:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        path, st = stack.pop()
+        if st is None:
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+        if (node := _get_dir_size_node(path, st, last_nodes, links_stamp, in_pkgs)) is None:
+            continue
+        nodes[path] = node
+        _, dev, node_real, node_apparent, subdir_names, node_hardlinks, node_file_count, _, _ = node
+        real += node_real
+        apparent += node_apparent
+        node_bytes = node_apparent
+        for i in range(0, len(node_hardlinks), 4):
+            node_bytes += node_hardlinks[i + 2]
+            if (link := hardlinks.get(key := (dev, node_hardlinks[i]))) is not None:
+                link[3] += 1
+            else:
+                hardlinks[key] = [node_hardlinks[i + 1] * 512, node_hardlinks[i + 2], node_hardlinks[i + 3], 1]
+        if progress is not None:
+            with _scan_progress_lock:
+                progress[0] += node_file_count
+                progress[1] += node_bytes
+                progress[2] += 1
+        if recursive:
+            for name in subdir_names:
+                if (subdir_path := os.path.join(path, name)) not in exclude_paths:
+                    stack.append((subdir_path, None))
 
-    dirs = []
-    for direntry in os.scandir(CONDA_HOME):
-        if direntry.is_dir() and direntry.name != "envs":
-            dirs.append(direntry.path)
-        elif direntry.is_file():
-            disk_usage += direntry.stat().st_size
-    dirs.extend([path for path in pathlist if path != CONDA_HOME])
+    return real, apparent, hardlinks, nodes
 
-    command = ["du", "-cd", "0", *dirs]
-    du_result = subprocess.run(command, capture_output=True, text=True).stdout
-    lines = du_result.splitlines()
-    disk_usage = int(lines[-1].strip().split("\t")[0]) * 1024
 
-    for line in lines[:-1]:
-        size, path = line.strip().split("\t")
-        size = int(size) * 1024
+PROCESS_SCAN_MIN_FILES = 2_000_000  # 上次统计的文件数达到此值时，改为在进程池中遍历
+_process_cancel_event = None  # 进程模式下各子进程中的取消信号，见 _init_scan_process
 
-        try:
-            index = pathlist.index(path)
-            real_usage_list[index] = size
-        except ValueError:
-            pass
 
-    base_index = pathlist.index(CONDA_HOME)
-    real_usage_list[base_index] = disk_usage - sum(real_usage_list)
+def _init_scan_process(cancel_event):
+    """进程池中各子进程的初始化函数，multiprocessing 的 Event 只能在创建子进程时传入。"""
+    global _process_cancel_event
+    _process_cancel_event = cancel_event
 
-    total_size_list = get_paths_totalsize_list(pathlist[:base_index] + pathlist[base_index + 1 :])
-    total_size_list.insert(base_index, real_usage_list[base_index])
 
-    if "progress_bar" in locals():
-        progress_bar.stop()
+def _scan_dir_sizes_in_process(
+    dir_path: str, exclude_paths: frozenset[str], last_nodes: dict[str, list], links_stamp: int, in_pkgs: bool
+) -> tuple[int, int, dict[tuple[int, int], list[int]], dict[str, list]]:
+    """在子进程中递归执行 _scan_dir_sizes。"""
+    return _scan_dir_sizes(
+        dir_path, exclude_paths, last_nodes, True, _process_cancel_event, None, links_stamp, in_pkgs
+    )
 
-    return real_usage_list, total_size_list, disk_usage
 
+def get_paths_sizes_linux(
+    pathlist: list[str],
+    exclude_paths: Iterable[str] = (),
+    pkgs_paths: Iterable[str] = (),
+    on_path_done: Union[Callable[[int, int, int, int], None], None] = None,
+    cancel_event: Union[Event, None] = None,
+    on_progress: Union[Callable[[int, int, int], None], None] = None,
+    use_processes: bool = False,
+) -> tuple[list[int], list[int], int, list[tuple[int, int, int]]]:
+    """Linux下单次遍历获取各路径的实际磁盘占用与表观大小，硬链接按 (st_dev, st_ino) 去重。
 
-def _get_envsizes_windows(pathlist: list[str]):
-    """Windows下获取各环境的磁盘占用情况。
+    Args:
+        pathlist (list[str]): 路径列表；其中某路径若位于另一路径之内，则只计入其自身。
+        exclude_paths (Iterable[str]): 不统计的目录路径。
+        pkgs_paths (Iterable[str]): 包缓存目录 (如 pkgs)，须为 pathlist 中某路径的一级子目录；其大小照常计入所在
+            路径，但不参与 sharing_list 的统计。
+        on_path_done (Callable, optional): 按 pathlist 的顺序，每个路径的实际磁盘占用与表观大小确定后以
+            (索引, real_usage, total_size, 文件数) 调用的回调函数。
+        cancel_event (Event, optional): 被设置后尽快停止统计，此时各返回列表只包含已完成的路径，sharing_list 为空，
+            已遍历目录的大小树节点仍会保存，以便下次继续。
+        on_progress (Callable, optional): 统计期间约每 0.1 秒以目前已统计的 (文件数, 字节数, 目录数) 调用的回调
+            函数，在调用本函数的线程中调用；复用大小树节点的目录同样计入。
+        use_processes (bool): 是否在进程池 (而非线程池) 中遍历，适用于文件数以百万计、stat 受 GIL 限制的情况；
+            各进程返回自己的统计值、硬链接与节点，与线程模式一样在最后合并。此时进度只在每个任务完成时更新。
 
     Returns:
         tuple: 包含以下信息的元组：
-            - real_usage_list (list[int]): 环境实际磁盘占用大小列表。
-            - total_size_list (list[int]): 环境表观总大小列表。
-            - disk_usage (int): Conda 环境总磁盘占用大小。
+            - real_usage_list (list[int]): 各路径的实际磁盘占用，已在排序更靠前的路径中统计过的硬链接不再计入
+              (同 `du -c` 对多个路径的处理)。
+            - total_size_list (list[int]): 各路径的表观总大小，仅在同一路径内对硬链接去重 (同 `du -s --apparent-size`)。
+            - disk_usage (int): 所有路径的总磁盘占用。
+            - sharing_list (list[tuple[int, int, int]]): 各路径 (不含 pkgs_paths) 的 (独占, 仅与包缓存等共享,
+              与其他路径共享) 磁盘占用。独占指文件的所有硬链接都在该路径内，即删除该路径实际可释放的空间。
+
+    Note:
+        1. 各路径的一级 (进程模式下为二级) 子目录作为独立任务并行遍历，每个任务单独累计大小与硬链接，最后按
+           pathlist 的顺序合并硬链接，故结果与遍历顺序无关。
+        2. 每个目录的统计结果以目录大小树的形式持久化，再次计算时只重新列出 mtime 变化了的目录，其余目录只需一次 lstat。
+        3. 文件被链接到其他目录或其他链接被删除时，其硬链接数改变而所在目录的 mtime 不变；故各节点还记录了由各路径
+           conda-meta 目录与各包缓存目录的 mtime 组成的链接戳。conda 在任一路径中安装或删除包后链接戳随之改变，
+           此时包缓存中的目录被重新列出，其余目录重新 lstat 其中的硬链接文件 (见 _get_dir_size_node)；链接戳不变时
+           未变化的目录仍只需一次 lstat。conda 以外的方式增删的硬链接在链接戳改变前不会被察觉。
     """
+    last_nodes = _load_size_tree()
+    exclude_paths = frozenset(os.path.normpath(path) for path in (*exclude_paths, *pathlist))
+    pkgs_paths = frozenset(os.path.normpath(path) for path in pkgs_paths)
+    stamp_mtimes = []
+    for path in [os.path.join(path, "conda-meta") for path in pathlist] + sorted(pkgs_paths):
+        try:
+            stamp_mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp_mtimes.append(0)
+    # 整数元组的 hash 在各进程间一致，故可持久化
+    links_stamp = hash(tuple(sorted(stamp_mtimes)))
+    path_tasks: list[list] = [[] for _ in pathlist]  # [(是否为包缓存目录, 任务或结果), ...]
+    path_progresses = [[0, 0, 0] for _ in pathlist]  # 各路径的 [文件数, 字节数, 目录数]
+
+    if use_processes:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # forkserver/spawn 不会继承本进程中其他线程持有的锁，fork 则可能因此死锁
+        mp_context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        process_cancel_event = mp_context.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=mp_context,
+            initializer=_init_scan_process,
+            initargs=(process_cancel_event,),
+        )
+        sorted_node_paths = sorted(last_nodes)
+        shard_depth = 2  # 进程间传输有开销，分得更细以使各进程的负载更均衡
+    else:
+        process_cancel_event = None
+        executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+        shard_depth = 1
+
+    def _get_task_result(task) -> tuple:
+        if isinstance(task, tuple):
+            return task
+        while (on_progress is not None or process_cancel_event is not None) and not wait([task], timeout=0.1).done:
+            if process_cancel_event is not None and cancel_event is not None and cancel_event.is_set():
+                process_cancel_event.set()
+            if on_progress is not None:
+                on_progress(*(sum(counts) for counts in zip(*path_progresses)))
+        return task.result()
+
+    def _add_process_task_progress(task, progress: list[int]):
+        """子进程无法更新 progress，故在其任务完成时由返回的节点累加。"""
+        if task.cancelled() or task.exception() is not None:
+            return
+        task_nodes = task.result()[3]
+        with _scan_progress_lock:
+            for node in task_nodes.values():
+                progress[0] += node[6]
+                progress[1] += node[3] + sum(node[5][2::4])
+                progress[2] += 1
+
+    def _submit(idx: int, dir_path: str, is_pkgs: bool, path_exclude_paths: frozenset[str], depth: int):
+        """将 dir_path 分为任务：depth 为 0 时整体作为一个任务，否则本目录的文件直接统计，子目录继续拆分。"""
+        if depth > 0:
+            dir_result = _scan_dir_sizes(
+                dir_path,
+                path_exclude_paths,
+                last_nodes,
+                False,
+                cancel_event,
+                path_progresses[idx],
+                links_stamp,
+                is_pkgs,
+            )
+            path_tasks[idx].append((is_pkgs, dir_result))
+            if (dir_node := dir_result[3].get(dir_path)) is None:
+                return
+            for name in dir_node[4]:
+                if (subdir_path := os.path.join(dir_path, name)) not in path_exclude_paths:
+                    _submit(idx, subdir_path, is_pkgs or subdir_path in pkgs_paths, path_exclude_paths, depth - 1)
+        elif use_processes:
+            # 只传入该目录下的旧节点，以减少进程间传输的数据量
+            prefix = os.path.join(dir_path, "")
+            lo = bisect_left(sorted_node_paths, prefix)
+            hi = bisect_left(sorted_node_paths, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+            task_last_nodes = {path: last_nodes[path] for path in sorted_node_paths[lo:hi]}
+            if dir_path in last_nodes:
+                task_last_nodes[dir_path] = last_nodes[dir_path]
+            task = executor.submit(
+                _scan_dir_sizes_in_process,
+                dir_path,
+                path_exclude_paths,
+                task_last_nodes,
+                links_stamp,
+                is_pkgs,
+            )
+            task.add_done_callback(
+                lambda task, progress=path_progresses[idx]: _add_process_task_progress(task, progress)
+            )
+            path_tasks[idx].append((is_pkgs, task))
+        else:
+            task = executor.submit(
+                _scan_dir_sizes,
+                dir_path,
+                path_exclude_paths,
+                last_nodes,
+                True,
+                cancel_event,
+                path_progresses[idx],
+                links_stamp,
+                is_pkgs,
+            )
+            path_tasks[idx].append((is_pkgs, task))
+
+    with executor:
+        for idx, path in enumerate(pathlist):
+            _submit(idx, path, False, exclude_paths - {os.path.normpath(path)}, shard_depth)
+
+        real_usage_list = []
+        total_size_list = []
+        nodes: dict[str, list] = {}
+        seen_hardlinks: set[tuple[int, int]] = set()
+        # 各路径 (不含包缓存目录) 中仅有一个硬链接的项的总占用，及其中有多个硬链接的文件 {inode: [..., 链接数]}
+        env_single_reals: list[int] = []
+        env_hardlinks_list: list[dict[tuple[int, int], list[int]]] = []
+        for idx in range(len(pathlist)):
+            real = apparent = env_single_real = 0
+            path_hardlinks: dict[tuple[int, int], list[int]] = {}
+            env_hardlinks: dict[tuple[int, int], list[int]] = {}
+            for is_pkgs, task in path_tasks[idx]:
+                task_real, task_apparent, task_hardlinks, task_nodes = _get_task_result(task)
+                real += task_real
+                apparent += task_apparent
+                path_hardlinks.update(task_hardlinks)
+                nodes.update(task_nodes)
+                if is_pkgs:
+                    continue
+                env_single_real += task_real
+                for key, link in task_hardlinks.items():
+                    if (env_link := env_hardlinks.get(key)) is not None:
+                        env_link[3] += link[3]
+                    else:
+                        env_hardlinks[key] = link
+            for key, (blocks_size, size, _, _) in path_hardlinks.items():
+                apparent += size
+                if key not in seen_hardlinks:
+                    real += blocks_size
+            if cancel_event is not None and cancel_event.is_set():  # 此路径的统计可能不完整
+                for tasks in path_tasks[idx + 1 :]:
+                    for _, task in tasks:
+                        nodes.update(_get_task_result(task)[3])
+                _save_size_tree((), nodes)
+                return real_usage_list, total_size_list, sum(real_usage_list), []
+            seen_hardlinks.update(path_hardlinks)
+            real_usage_list.append(real)
+            total_size_list.append(apparent)
+            env_single_reals.append(env_single_real)
+            env_hardlinks_list.append(env_hardlinks)
+            if on_path_done is not None:
+                on_path_done(idx, real, apparent, path_progresses[idx][0])
+
+    # 统计每个有多个硬链接的 inode 出现在几个路径中，以区分与其他路径共享和仅与包缓存等共享的部分
+    inode_path_counts: dict[tuple[int, int], int] = {}
+    for env_hardlinks in env_hardlinks_list:
+        for key in env_hardlinks:
+            inode_path_counts[key] = inode_path_counts.get(key, 0) + 1
+    sharing_list = []
+    for env_single_real, env_hardlinks in zip(env_single_reals, env_hardlinks_list):
+        exclusive, shared_pkgs, shared_envs = env_single_real, 0, 0
+        for key, (blocks_size, _, nlink, links) in env_hardlinks.items():
+            if links >= nlink:
+                exclusive += blocks_size
+            elif inode_path_counts[key] > 1:
+                shared_envs += blocks_size
+            else:
+                shared_pkgs += blocks_size
+        sharing_list.append((exclusive, shared_pkgs, shared_envs))
 
-    class ProgressBar(Thread):
-        """进度条线程类，用于Windows下显示计算conda环境磁盘占用大小的进度信息。"""
+    if on_progress is not None:
+        on_progress(*(sum(counts) for counts in zip(*path_progresses)))
+    _save_size_tree(pathlist, nodes)
 
-        def __init__(self, num_files: Union[None, int] = None):
-            super().__init__(daemon=True)
-            self.is_running = Event()  # 默认处于非运行状态
-            self.lock = Lock()
-            self.num_files = num_files
-            self.bar_length = 10
+    return real_usage_list, total_size_list, sum(real_usage_list), sharing_list
 
-        def run(self):
-            while True:
-                if not self.is_running.is_set():
-                    break
-                self._show_process()
-                time.sleep(1)
 
-        def start(self):
-            if self.num_files is None:
-                self.idx = 0
-            self.count = 0
+QUICK_ESTIMATE_SECONDS = 0.3  # 首次统计环境大小前，抽样估计所用的时间预算
+
+
+def estimate_paths_sizes(
+    pathlist: list[str],
+    exclude_paths: Iterable[str] = (),
+    pkgs_paths: Iterable[str] = (),
+    time_budget: float = QUICK_ESTIMATE_SECONDS,
+) -> tuple[list[tuple[int, int, int, int]], float]:
+    """在约 time_budget 秒内抽样估计各路径的实际磁盘占用与表观大小及其置信区间，无需遍历所有文件。
+
+    Notes:
+        1. 每个路径下的一级子目录各为一层 (按深度分层)，层内使用 Knuth 随机下降估计：从该子目录开始，每次随机进入
+           一个子目录直至没有子目录，途经各目录的大小乘以沿途各级子目录数之积，即为该层总大小的一个无偏估计；
+           各层的估计值与方差分别求均值后相加，路径本身的文件则直接统计。
+        2. 每层至少抽样一次，其后每次抽样使估计方差下降最多的层，直至用完时间预算。
+        3. 有多个硬链接的文件只在包缓存目录 (pkgs_paths) 中计入实际磁盘占用，含包缓存目录的路径 (即 base 环境)
+           中其余的硬链接文件也不计入表观大小，以与 get_paths_sizes_linux 的结果相近；置信区间只反映抽样误差，
+           不含这一近似带来的偏差。
+
+    Args:
+        pathlist (list[str]): 路径列表。
+        exclude_paths (Iterable[str]): 不统计的路径，同 get_paths_sizes_linux。
+        pkgs_paths (Iterable[str]): 包缓存目录，同 get_paths_sizes_linux。
+        time_budget (float): 时间预算 (秒)，每层的第一次抽样不受此限制。
+
+    Returns:
+        tuple: 包含以下信息的元组：
+            - estimates (list[tuple[int, int, int, int]]): 各路径的 (实际磁盘占用, 表观大小, 实际磁盘占用的 95%
+              置信区间半宽, 表观大小的 95% 置信区间半宽)。
+            - predicted_seconds (float): 按抽样时的速度，单线程完整遍历这些路径预计所需的秒数。
+    """
+    import random
+
+    deadline = time.perf_counter() + time_budget
+    exclude_paths = frozenset(os.path.normpath(path) for path in (*exclude_paths, *pathlist))
+    pkgs_paths = frozenset(os.path.normpath(path) for path in pkgs_paths)
+    listings: dict[str, tuple[int, int, int, list[str]]] = {}
+    listing_stats = [0, 0.0]  # [已列出的项数, 耗时]
+
+    def _list_dir(
+        dir_path: str, path_exclude_paths: frozenset[str], in_pkgs: bool, skip_links: bool
+    ) -> tuple[int, int, int, list[str]]:
+        """返回目录中各项的 (实际占用, 表观大小, 项数, 子目录列表)，子目录自身的大小计入其中。"""
+        if (listing := listings.get(dir_path)) is not None:
+            return listing
+        start_time = time.perf_counter()
+        real = apparent = count = 0
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    count += 1
+                    if S_ISDIR(st.st_mode):
+                        if os.path.normpath(entry.path) in path_exclude_paths:
+                            continue
+                        subdirs.append(entry.path)
+                    elif st.st_nlink > 1 and not in_pkgs:
+                        if not skip_links:
+                            apparent += st.st_size
+                        continue
+                    blocks = getattr(st, "st_blocks", None)  # Windows 下没有 st_blocks
+                    real += blocks * 512 if blocks is not None else st.st_size
+                    apparent += st.st_size
+        except OSError:
+            pass
+        listing_stats[0] += count
+        listing_stats[1] += time.perf_counter() - start_time
+        listings[dir_path] = (real, apparent, count, subdirs)
+        return listings[dir_path]
+
+    rng = random.Random()
+    path_totals = []  # 各路径本身直接统计的 [实际占用, 表观大小, 项数]
+    strata = []  # 各层的 {"idx", "path", "args", "samples": [(实际占用, 表观大小, 项数), ...], "exact"}
+    for idx, path in enumerate(pathlist):
+        path_exclude_paths = exclude_paths - {os.path.normpath(path)}
+        has_pkgs = any(os.path.dirname(pkgs_path) == os.path.normpath(path) for pkgs_path in pkgs_paths)
+        real, apparent, count, subdirs = _list_dir(path, path_exclude_paths, False, has_pkgs)
+        try:
+            st = os.lstat(path)
+            blocks = getattr(st, "st_blocks", None)
+            real += blocks * 512 if blocks is not None else st.st_size
+            apparent += st.st_size
+        except OSError:
+            pass
+        path_totals.append([real, apparent, count])
+        for subdir in subdirs:
+            in_pkgs = os.path.normpath(subdir) in pkgs_paths
+            args = (path_exclude_paths, in_pkgs, has_pkgs and not in_pkgs)
+            strata.append({"idx": idx, "path": subdir, "args": args, "samples": [], "exact": False})
+
+    def _sample(stratum: dict[str, Any]):
+        dir_path, weight, exact = stratum["path"], 1, True
+        sample = [0, 0, 0]
+        while True:
+            real, apparent, count, subdirs = _list_dir(dir_path, *stratum["args"])
+            sample[0] += weight * real
+            sample[1] += weight * apparent
+            sample[2] += weight * count
+            if not subdirs:
+                break
+            exact = exact and len(subdirs) == 1
+            weight *= len(subdirs)
+            dir_path = rng.choice(subdirs)
+        stratum["samples"].append(tuple(sample))
+        stratum["exact"] = exact  # 沿途都只有一个子目录，即已遍历整层
+
+    def _mean_var(samples: list[tuple[int, int, int]], col: int, exact: bool) -> tuple[float, float]:
+        """返回该层第 col 项的估计值 (样本均值) 及其方差，只有一个样本时保守地以估计值的平方作为方差。"""
+        n = len(samples)
+        mean = sum(sample[col] for sample in samples) / n
+        if exact:
+            return mean, 0.0
+        if n == 1:
+            return mean, mean**2
+        return mean, sum((sample[col] - mean) ** 2 for sample in samples) / (n - 1) / n
+
+    for stratum in strata:
+        _sample(stratum)
+    while strata and time.perf_counter() < deadline:
+        # 再抽样一次时表观大小的方差预计下降 var * n / (n + 1) 中的 var / (n + 1)
+        candidates = [s for s in strata if not s["exact"]]
+        if not candidates:
+            break
+        _sample(max(candidates, key=lambda s: _mean_var(s["samples"], 1, False)[1] / (len(s["samples"]) + 1)))
+
+    estimates = []
+    total_count = sum(count for _, _, count in path_totals)
+    for idx, (real, apparent, _) in enumerate(path_totals):
+        real_var = apparent_var = 0.0
+        for stratum in strata:
+            if stratum["idx"] != idx:
+                continue
+            mean, var = _mean_var(stratum["samples"], 0, stratum["exact"])
+            real, real_var = real + mean, real_var + var
+            mean, var = _mean_var(stratum["samples"], 1, stratum["exact"])
+            apparent, apparent_var = apparent + mean, apparent_var + var
+            total_count += _mean_var(stratum["samples"], 2, stratum["exact"])[0]
+        estimates.append(
+            (round(real), round(apparent), round(1.96 * real_var**0.5), round(1.96 * apparent_var**0.5))
+        )
+    listed_count, listing_time = listing_stats
+    predicted_seconds = total_count / listed_count * listing_time if listed_count else 0
+
+    return estimates, predicted_seconds
+
+
+def _get_envsizes_linux(
+    pathlist: list[str],
+    quiet: bool = False,
+    on_env_done: Union[Callable[[int, int, int, int], None], None] = None,
+    cancel_event: Union[Event, None] = None,
+    scan_history: tuple[int, float] = (0, 0),
+):
+    """Linux下获取各环境的磁盘占用情况。
+
+    Args:
+        pathlist (list[str]): 环境路径列表。
+        quiet (bool): 是否不显示进度条，默认为 False。
+        on_env_done (Callable, optional): 每个环境统计完成时以 (在 pathlist 中的索引, real_usage, total_size, 文件数)
+            调用。
+        cancel_event (Event, optional): 见 get_paths_sizes_linux，取消时未完成的环境大小为 0，sharing_list 为空。
+        scan_history (tuple[int, float]): 上次统计这些环境时的 (总文件数, 耗时秒数)，用于显示进度及剩余时间；
+            为 (0, 0) 时进度条只显示已统计的数量与速度。总文件数达到 PROCESS_SCAN_MIN_FILES 时在进程池中遍历。
+
+    Returns:
+        tuple: 包含以下信息的元组：
+            - real_usage_list (list[int]): 环境实际磁盘占用大小列表。
+            - total_size_list (list[int]): 环境表观总大小列表。
+            - disk_usage (int): Conda 环境总磁盘占用大小。
+            - sharing_list (list[tuple[int, int, int]]): 各环境的 (独占, 仅与 pkgs 共享, 与其他环境共享) 磁盘占用，
+              见 get_paths_sizes_linux。
+    """
+
+    class ProgressBar:
+        """按已统计的文件数显示进度的进度条，由 get_paths_sizes_linux 的 on_progress 回调驱动。"""
+
+        def __init__(self, expected_files: int, expected_seconds: float):
+            self.expected_files = expected_files
+            self.history_rate = expected_files / expected_seconds if expected_seconds > 0 else 0
+            self.bar_length = 20
+            self.idx = 0
+            self.last_print_str = ""
+            self.start_time = time.time()
+
+        def update(self, num_files: int, num_bytes: int, num_dirs: int):
+            elapsed_time = time.time() - self.start_time
+            # 统计开始时速度波动较大，先沿用上次统计的速度
+            files_per_sec = num_files / elapsed_time if elapsed_time > 0.3 else self.history_rate
+            bytes_per_sec = num_bytes / elapsed_time if elapsed_time > 0.3 else 0
+
+            if self.expected_files:
+                fraction = min(num_files / self.expected_files, 0.99)
+                num_blocks = int(fraction * self.bar_length)
+                num_dots = self.bar_length - num_blocks - 1
+                bar = "[" + "=" * num_blocks + ">" + "." * num_dots + "]"
+                percentage_str = f"{fraction:>4.0%}"
+            else:  # 没有历史记录，无法得知总量
+                bar = "[" + "." * self.idx + "<=>" + "." * (self.bar_length - self.idx - 3) + "]"
+                self.idx = (self.idx + 1) % (self.bar_length - 2)
+                percentage_str = " --%"
+
+            elapsed_mins, elapsed_secs = map(int, divmod(elapsed_time, 60))
+            elapsed_time_str = f"{elapsed_mins:02d}:{elapsed_secs:02d}"
+            if self.expected_files > num_files and files_per_sec > 0:
+                remaining_time = (self.expected_files - num_files) / files_per_sec
+                remaining_mins, remaining_secs = map(int, divmod(remaining_time, 60))
+                remaining_time_str = f"{remaining_mins:02d}:{remaining_secs:02d}"
+            else:
+                remaining_time_str = "--:--"
+
+            print_str = (
+                f"{percentage_str} {bar} {elapsed_time_str}<{remaining_time_str} | Files: {num_files:,}"
+                f" ({files_per_sec:,.0f}/s) | Dirs: {num_dirs:,} | Size: {format_size(num_bytes)}"
+                f" ({format_size(bytes_per_sec)}/s)"
+            )
+            print_str = print_str[: fast_get_terminal_size().columns - 1]  # 折行后 \r 无法回到行首
+            if print_str != self.last_print_str:
+                self.last_print_str = print_str
+                print(f"\r{print_str}\033[K", end="", flush=True)
+
+    progress_bar = None if quiet else ProgressBar(*scan_history)
+
+    # base 环境 (含 pkgs 等，不含 envs) 排在最前，使共享的硬链接优先计入 base 环境
+    order = sorted(range(len(pathlist)), key=lambda i: pathlist[i] != CONDA_HOME)
+    ordered_real_usage_list, ordered_total_size_list, disk_usage, ordered_sharing_list = get_paths_sizes_linux(
+        [pathlist[i] for i in order],
+        exclude_paths=[os.path.join(CONDA_HOME, "envs")],
+        pkgs_paths=[os.path.join(CONDA_HOME, "pkgs")],
+        on_path_done=(lambda i, *sizes: on_env_done(order[i], *sizes)) if on_env_done is not None else None,
+        cancel_event=cancel_event,
+        on_progress=progress_bar.update if progress_bar is not None else None,
+        use_processes=scan_history[0] >= PROCESS_SCAN_MIN_FILES and (os.cpu_count() or 1) > 1,
+    )
+    real_usage_list = [0] * len(pathlist)
+    total_size_list = [0] * len(pathlist)
+    sharing_list = [(0, 0, 0)] * len(pathlist) if ordered_sharing_list else []
+    for idx, real_usage, total_size in zip(order, ordered_real_usage_list, ordered_total_size_list):
+        real_usage_list[idx] = real_usage
+        total_size_list[idx] = total_size
+    for idx, sharing in zip(order, ordered_sharing_list):
+        sharing_list[idx] = sharing
+
+    if progress_bar is not None:
+        print("\r", end="")
+
+    return real_usage_list, total_size_list, disk_usage, sharing_list
+
+
+def _get_envsizes_windows(pathlist: list[str], quiet: bool = False):
+    """Windows下获取各环境的磁盘占用情况。
+
+    Args:
+        pathlist (list[str]): 环境路径列表。
+        quiet (bool): 是否不显示进度条，默认为 False。
+
+    Returns:
+        tuple: 包含以下信息的元组：
+            - real_usage_list (list[int]): 环境实际磁盘占用大小列表。
+            - total_size_list (list[int]): 环境表观总大小列表。
+            - disk_usage (int): Conda 环境总磁盘占用大小。
+    """
+
+    class ProgressBar(Thread):
+        """进度条线程类，用于Windows下显示计算conda环境磁盘占用大小的进度信息。"""
+
+        def __init__(self, num_files: Union[None, int] = None):
+            super().__init__(daemon=True)
+            self.is_running = Event()  # 默认处于非运行状态
+            self.lock = Lock()
+            self.num_files = num_files
+            self.bar_length = 10
+            self.count = 0
+            self.size = 0
+
+        def run(self):
+            while True:
+                if not self.is_running.is_set():
+                    break
+                self._show_process()
+                time.sleep(1)
+
+        def start(self):
+            if self.num_files is None:
+                self.idx = 0
+            self.count = 0
             self.last_count = 0
             self.size = 0
             self.start_time = time.time()
             self.is_running.set()  # 设置运行信号
             super().start()
 
-        def add(self, new_size):
+        def add(self, new_size, count=1):
             with self.lock:
-                self.count += 1
+                self.count += count
                 self.size += new_size
 
         def stop(self):
@@ -849,30 +1999,39 @@ def _get_envsizes_windows(pathlist: list[str]):
 
     last_num_files = data_manager.get_data("num_files_data").get("num_files")
     progress_bar = ProgressBar(num_files=last_num_files)
-    progress_bar.start()
+    if not quiet:
+        progress_bar.start()
 
     def get_disk_usage(env_path, root, nondirs):
         nonlocal num_files
 
+        # 先在本任务内累计，每个目录只加锁合并一次，而非每个文件加锁一次
+        dir_size = 0
+        dir_count = 0  # 成功获取信息的文件数，无法访问的文件不计入
+        dir_usages = {}  # {inode: 占用}
         for f in nondirs:
             try:
                 stat = os.lstat(root + os.sep + f)
-                size = stat.st_size
-                inode = stat.st_ino
             except OSError:
-                size = 0
-                inode = 0
+                continue
+            size = stat.st_size
+            inode = stat.st_ino
+            dir_count += 1
 
             if size > 500:  # 估算，存在误差，(或者试试 size>382)
                 usage = (size + cluster_size - 1) // cluster_size * cluster_size  # 按簇向上对齐
             else:
                 usage = 0  # 由于NTFS对过小的文件直接保存在MFT中，不占用簇
 
-            progress_bar.add(new_size=size)
+            dir_size += size
+            dir_usages.setdefault(inode, usage)
+
+        progress_bar.add(new_size=dir_size, count=dir_count)
 
-            with lock:
-                num_files += 1
-                total_size_list[path_corresponding_index[env_path]] += size
+        with lock:
+            num_files += dir_count
+            total_size_list[path_corresponding_index[env_path]] += dir_size
+            for inode, usage in dir_usages.items():
                 if inode not in seen_inodes:
                     seen_inodes.add(inode)
                     real_usage_list[path_corresponding_index[env_path]] += usage
@@ -893,7 +2052,8 @@ def _get_envsizes_windows(pathlist: list[str]):
                 for root, _, nondirs in os.walk(path, followlinks=True):
                     executor.submit(get_disk_usage, path, root, nondirs)
 
-    progress_bar.stop()
+    if not quiet:
+        progress_bar.stop()
     data_manager.update_data("num_files_data", {"num_files": num_files})
 
     disk_usage = sum(real_usage_list)
@@ -901,12 +2061,1425 @@ def _get_envsizes_windows(pathlist: list[str]):
     return real_usage_list, total_size_list, disk_usage
 
 
-def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str]):
+NETWORK_FILESYSTEM_TYPES = frozenset(
+    {
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smb3",
+        "smbfs",
+        "afs",
+        "9p",
+        "lustre",
+        "gpfs",
+        "beegfs",
+        "ceph",
+        "glusterfs",
+        "davfs",
+        "fuse.sshfs",
+        "fuse.glusterfs",
+        "fuse.cephfs",
+        "fuse.rclone",
+    }
+)
+METADATA_SIZE_SAMPLES = 64  # 抽样核对元数据中文件大小的文件数
+METADATA_SIZE_MAX_MISMATCH = 0.1  # 抽样中大小不符的比例超过此值时，改为遍历文件统计
+
+
+def is_network_filesystem(path: str) -> bool:
+    """判断路径是否位于网络文件系统 (NFS、SMB 等) 上，无法判断时返回 False。"""
+    if os.name == "nt":
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        if drive.startswith("\\\\"):  # UNC 路径
+            return True
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4  # DRIVE_REMOTE
+
+    real_path = os.path.realpath(path)
+    mount_point, fs_type = "", ""
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = fields[1].replace("\\040", " ")
+                if (real_path == mount or real_path.startswith(mount.rstrip("/") + "/")) and len(mount) >= len(
+                    mount_point
+                ):
+                    mount_point, fs_type = mount, fields[2]
+    except OSError:  # 非 Linux 的 posix 系统
+        return False
+    return fs_type in NETWORK_FILESYSTEM_TYPES
+
+
+def _get_env_size_method() -> Literal["scan", "metadata"]:
+    """根据 CFG_ENV_SIZE_METHOD 确定统计环境大小的方式。"""
+    if CFG_ENV_SIZE_METHOD == "auto":
+        return "metadata" if is_network_filesystem(CONDA_HOME) else "scan"
+    return CFG_ENV_SIZE_METHOD
+
+
+class PackageSizeDict(TypedDict):
+    name: str
+    version: str
+    source: Literal["conda", "pypi"]
+    size: int  # 包中各文件的表观大小之和
+    copied: int  # 其中安装时复制或改写 (而非硬链接自 pkgs) 的部分
+    dist_dir: str  # 硬链接的来源，即 pkgs 中已解压的包目录，pip 包为空字符串
+
+
+def _read_pkg_paths(dist_dir: str) -> Union[dict[str, dict[str, Any]], None]:
+    """读取 pkgs 中已解压的包的 info/paths.json，返回 {相对路径: 文件信息}，包目录不存在时返回 None。"""
+    try:
+        with open(os.path.join(dist_dir, "info", "paths.json"), encoding="utf-8") as f:
+            return {entry["_path"]: entry for entry in json.load(f).get("paths", [])}
+    except (OSError, ValueError, KeyError):
+        return None if not os.path.isdir(dist_dir) else {}
+
+
+def _lstat_size(path: str) -> int:
+    try:
+        return os.lstat(path).st_size
+    except OSError:
+        return 0
+
+
+def _get_env_package_sizes(
+    env_path: str,
+    pyver: str,
+    pkg_paths_cache: Union[dict[str, Union[dict[str, dict[str, Any]], None]], None] = None,
+) -> tuple[list[PackageSizeDict], int, list[tuple[str, int]]]:
+    """根据 conda-meta/*.json 与 pip 的 *.dist-info/RECORD 统计环境中各包的大小，只需读取每个包的元数据。
+
+    Notes:
+        conda-meta 中的 paths_data 只记录安装时有改动的文件 (替换了前缀的文件、编译的 pyc 等)，其余文件的大小取自
+        pkgs 中对应包的 info/paths.json；两者都没有记录大小的文件 (如 pyc、以文本方式替换了前缀的文件) 才 stat。
+
+    Args:
+        env_path (str): 环境路径。
+        pyver (str): 环境的 Python 版本，用于定位 site-packages。
+        pkg_paths_cache (dict, optional): {pkgs 中的包目录: _read_pkg_paths 的结果}，在多个环境间共享以避免重复读取。
+
+    Returns:
+        tuple: (各包的大小信息列表, 文件数, 大小取自元数据的 [(文件路径, 记录的大小), ...]，用于抽样核对)。
+    """
+    if pkg_paths_cache is None:
+        pkg_paths_cache = {}
+    packages: list[PackageSizeDict] = []
+    file_count = 0
+    recorded_files: list[tuple[str, int]] = []
+    if os.name == "nt":
+        site_packages_rel, scripts_rel = "Lib/site-packages", "Scripts"
+    else:  # os.name == "posix":
+        site_packages_rel, scripts_rel = f"lib/python{'.'.join(pyver.split('.')[:2])}/site-packages", "bin"
+    site_packages_path = os.path.join(env_path, *site_packages_rel.split("/"))
+
+    def _to_noarch_path(rel_path: str) -> str:
+        """noarch: python 包的元数据中的路径以 site-packages/、python-scripts/ 开头，安装时才映射到实际位置。"""
+        if rel_path.startswith(site_packages_rel + "/"):
+            return "site-packages" + rel_path[len(site_packages_rel) :]
+        if rel_path.startswith(scripts_rel + "/"):
+            return "python-scripts" + rel_path[len(scripts_rel) :]
+        return rel_path
+
+    conda_meta_path = os.path.join(env_path, "conda-meta")
+    try:
+        meta_names = [name for name in os.listdir(conda_meta_path) if name.endswith(".json")]
+    except OSError:
+        meta_names = []
+    for meta_name in meta_names:
+        try:
+            with open(os.path.join(conda_meta_path, meta_name), encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            continue
+        dist_dir = os.path.normpath(record["extracted_package_dir"]) if record.get("extracted_package_dir") else ""
+        if dist_dir not in pkg_paths_cache:
+            pkg_paths_cache[dist_dir] = _read_pkg_paths(dist_dir) if dist_dir else None
+        pkg_paths = pkg_paths_cache[dist_dir] or {}
+        record_paths = {entry["_path"]: entry for entry in record.get("paths_data", {}).get("paths", [])}
+        is_hardlinked = record.get("link", {}).get("type", 1) == 1  # 1: hardlink, 2: softlink, 3: copy
+        is_noarch_python = record.get("noarch") == "python"
+        size = copied = 0
+        for rel_path in record.get("files", []):
+            meta_path = _to_noarch_path(rel_path) if is_noarch_python else rel_path
+            entry = record_paths.get(meta_path) or pkg_paths.get(meta_path) or {}
+            path_type = entry.get("path_type", "hardlink")
+            if path_type in ("softlink", "directory"):
+                continue
+            file_path = os.path.join(env_path, rel_path)
+            if "size_in_bytes" in entry and not (
+                "prefix_placeholder" in entry and entry.get("file_mode") == "text"
+            ):
+                file_size = entry["size_in_bytes"]
+                recorded_files.append((file_path, file_size))
+            else:
+                file_size = _lstat_size(file_path)
+            size += file_size
+            file_count += 1
+            if (
+                not is_hardlinked
+                or not entry
+                or path_type != "hardlink"
+                or "prefix_placeholder" in entry
+                or entry.get("no_link")
+            ):
+                copied += file_size
+        packages.append(
+            {
+                "name": record.get("name", meta_name),
+                "version": record.get("version", ""),
+                "source": "conda",
+                "size": size,
+                "copied": copied,
+                "dist_dir": dist_dir,
+            }
+        )
+
+    try:
+        dist_info_entries = [
+            entry for entry in os.scandir(site_packages_path) if entry.name.endswith(".dist-info")
+        ]
+    except OSError:
+        dist_info_entries = []
+    for entry in dist_info_entries:
+        try:
+            with open(os.path.join(entry.path, "INSTALLER"), encoding="utf-8") as f:
+                installer = f.read().strip()
+        except OSError:
+            installer = ""
+        if installer == "conda":  # 已在 conda-meta 中统计
+            continue
+        size = 0
+        try:
+            with open(os.path.join(entry.path, "RECORD"), encoding="utf-8", newline="") as f:
+                rows = list(csv.reader(f))
+        except (OSError, csv.Error):
+            rows = []
+        for row in rows:
+            if not row:
+                continue
+            file_path = os.path.normpath(os.path.join(site_packages_path, row[0]))
+            if len(row) > 2 and row[2].isdigit():
+                file_size = int(row[2])
+                recorded_files.append((file_path, file_size))
+            else:  # RECORD 自身及安装时编译的 pyc 没有记录大小
+                file_size = _lstat_size(file_path)
+            size += file_size
+            file_count += 1
+        name, _, version = entry.name[: -len(".dist-info")].partition("-")
+        packages.append(
+            {"name": name, "version": version, "source": "pypi", "size": size, "copied": size, "dist_dir": ""}
+        )
+
+    return packages, file_count, recorded_files
+
+
+def get_env_package_sizes(env_path: str, pyver: str) -> list[PackageSizeDict]:
+    """根据包的元数据统计环境中各包的大小，按大小降序排列，见 _get_env_package_sizes。"""
+    return sorted(_get_env_package_sizes(env_path, pyver)[0], key=lambda pkg: pkg["size"], reverse=True)
+
+
+def _get_pkgs_dir_metadata_size(
+    pkgs_path: str, pkg_paths_cache: dict[str, Union[dict[str, dict[str, Any]], None]]
+) -> int:
+    """根据已解压的包的 info/paths.json 估计 pkgs 目录的大小，压缩包、cache 等其余文件直接 stat。"""
+    total_size = 0
+    try:
+        entries = list(os.scandir(pkgs_path))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                total_size += entry.stat(follow_symlinks=False).st_size
+            elif entry.name == "cache":
+                total_size += sum(item.stat(follow_symlinks=False).st_size for item in os.scandir(entry.path))
+            else:
+                dist_dir = os.path.normpath(entry.path)
+                if dist_dir not in pkg_paths_cache:
+                    pkg_paths_cache[dist_dir] = _read_pkg_paths(dist_dir)
+                total_size += sum(
+                    info.get("size_in_bytes", 0)
+                    for info in (pkg_paths_cache[dist_dir] or {}).values()
+                    if info.get("path_type", "hardlink") not in ("softlink", "directory")
+                )
+        except OSError:
+            continue
+    return total_size
+
+
+def _get_envsizes_metadata(pathlist: list[str], pyverlist: list[str], quiet: bool = False):
+    """根据包的元数据 (而非遍历文件) 估计各环境的磁盘占用情况，适合遍历文件很慢的网络文件系统。
+
+    Notes:
+        1. 只统计包中的文件，磁盘占用按表观大小估计；硬链接自 pkgs 中仍存在的包目录的文件计入 pkgs (即 base 环境)，
+           与 get_paths_sizes_linux 的计入方式一致。
+        2. 随机抽取 METADATA_SIZE_SAMPLES 个大小取自元数据的文件 stat 核对，大小不符的比例超过
+           METADATA_SIZE_MAX_MISMATCH 时 (如文件被改动过) 返回 None，由调用者改为遍历文件统计。
+
+    Returns:
+        tuple | None: (real_usage_list, total_size_list, disk_usage, sharing_list, file_count_list)，前四项同
+            _get_envsizes_linux。
+    """
+    import random
+
+    pkg_paths_cache: dict[str, Union[dict[str, dict[str, Any]], None]] = {}
+    env_packages_list = []
+    file_count_list = []
+    recorded_files: list[tuple[str, int]] = []
+    for path, pyver in zip(pathlist, pyverlist):
+        packages, file_count, env_recorded_files = _get_env_package_sizes(path, pyver, pkg_paths_cache)
+        env_packages_list.append(packages)
+        file_count_list.append(file_count)
+        recorded_files.extend(env_recorded_files)
+
+    samples = random.sample(recorded_files, min(METADATA_SIZE_SAMPLES, len(recorded_files)))
+    with ThreadPoolExecutor(max_workers=16) as executor:  # 网络文件系统上 stat 的延迟较高
+        actual_sizes = list(executor.map(lambda sample: _lstat_size(sample[0]), samples))
+    num_mismatches = sum(actual != recorded for (_, recorded), actual in zip(samples, actual_sizes))
+    if samples and num_mismatches / len(samples) > METADATA_SIZE_MAX_MISMATCH:
+        if not quiet:
+            print(
+                LIGHT_YELLOW(
+                    f"[警告] 抽样核对的 {len(samples)} 个文件中有 {num_mismatches} 个与元数据记录的大小不符，改为遍历文件统计"
+                )
+            )
+        return None
+
+    # 统计每个 pkgs 中的包目录被几个环境硬链接，以区分与其他环境共享和仅与 pkgs 共享的部分
+    dist_env_counts: dict[str, int] = {}
+    for packages in env_packages_list:
+        for dist_dir in {pkg["dist_dir"] for pkg in packages if pkg["size"] > pkg["copied"]}:
+            dist_env_counts[dist_dir] = dist_env_counts.get(dist_dir, 0) + 1
+
+    pkgs_path = os.path.join(CONDA_HOME, "pkgs")
+    pkgs_size = _get_pkgs_dir_metadata_size(pkgs_path, pkg_paths_cache)
+    real_usage_list = []
+    total_size_list = []
+    sharing_list = []
+    counted_dists = set()  # pkgs 中已不存在、已计入前面环境的包目录
+    # base 环境 (含 pkgs) 排在最前，与 _get_envsizes_linux 的计入顺序一致
+    order = sorted(range(len(pathlist)), key=lambda i: pathlist[i] != CONDA_HOME)
+    ordered_results = {}
+    for idx in order:
+        total_size = real_usage = exclusive = shared_pkgs = shared_envs = 0
+        for pkg in env_packages_list[idx]:
+            linked = pkg["size"] - pkg["copied"]
+            total_size += pkg["size"]
+            real_usage += pkg["copied"]
+            exclusive += pkg["copied"]
+            if not linked:
+                continue
+            in_pkgs = pkg_paths_cache.get(pkg["dist_dir"]) is not None
+            if dist_env_counts[pkg["dist_dir"]] > 1:
+                shared_envs += linked
+            elif in_pkgs:
+                shared_pkgs += linked
+            else:
+                exclusive += linked
+            if not in_pkgs and pkg["dist_dir"] not in counted_dists:
+                real_usage += linked
+            elif in_pkgs and pathlist[idx] == CONDA_HOME:  # 与 pkgs 中的文件为同一 inode，表观大小只计一次
+                total_size -= linked
+        counted_dists.update(pkg["dist_dir"] for pkg in env_packages_list[idx])
+        if pathlist[idx] == CONDA_HOME:
+            real_usage += pkgs_size
+            total_size += pkgs_size
+        ordered_results[idx] = (real_usage, total_size, (exclusive, shared_pkgs, shared_envs))
+    for idx in range(len(pathlist)):
+        real_usage, total_size, sharing = ordered_results[idx]
+        real_usage_list.append(real_usage)
+        total_size_list.append(total_size)
+        sharing_list.append(sharing)
+
+    return real_usage_list, total_size_list, sum(real_usage_list), sharing_list, file_count_list
+
+
+class PkgsIndexEntryDict(TypedDict):
+    size: int  # 包目录的实际占用 (字节)
+    linked: bool  # 是否仍有文件被某个环境硬链接 (st_nlink > 1)
+    referenced: bool  # 是否仍被某个环境的 conda-meta 记录引用 (如以软链接或复制方式安装的包)
+    mtime: float  # 包目录的修改时间
+
+
+def _scan_pkg_dir(pkg_path: str) -> tuple[int, bool]:
+    """遍历 pkgs 中一个已解压的包目录，返回 (实际占用, 是否仍有文件被硬链接)。"""
+    size = 0
+    linked = False
+    dir_stack = [pkg_path]
+    while dir_stack:
+        try:
+            with os.scandir(dir_stack.pop()) as entries:
+                for entry in entries:
+                    try:  # Windows 上 DirEntry.stat() 的 st_nlink 始终为 0，需单独 lstat
+                        st = os.lstat(entry.path) if os.name == "nt" else entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    size += st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+                    if S_ISDIR(st.st_mode):
+                        dir_stack.append(entry.path)
+                    elif st.st_nlink > 1:
+                        linked = True
+        except OSError:
+            pass
+    return size, linked
+
+
+def get_pkgs_index(env_pathlist: Iterable[str]) -> dict[str, PkgsIndexEntryDict]:
+    """获取各包缓存目录 (见 _get_conda_pkgs_dirs) 中已解压包目录的索引 {包目录路径: PkgsIndexEntryDict}。
+
+    每个包目录只遍历一次。结果按各包缓存目录及各环境 conda-meta 目录的修改时间缓存：环境被删除或增删包时，包缓存中
+    文件的 st_nlink 会变化而包缓存目录本身不变，故需一并作为缓存键。
+
+    Args:
+        env_pathlist (Iterable[str]): 所有环境的路径，用于读取 conda-meta 中的包记录。
+    """
+    pkgs_paths = []
+    cache_key: list[Any] = []
+    for pkgs_path in _get_conda_pkgs_dirs():
+        try:
+            cache_key.append([pkgs_path, os.stat(pkgs_path).st_mtime_ns])
+        except OSError:
+            continue
+        pkgs_paths.append(pkgs_path)
+    if not pkgs_paths:
+        return {}
+    referenced_dists = set()
+    for env_path in sorted(env_pathlist):
+        conda_meta_path = os.path.join(env_path, "conda-meta")
+        try:
+            cache_key.append([env_path, os.stat(conda_meta_path).st_mtime_ns])
+            # conda-meta 中的记录文件名即为 pkgs 中对应的包目录名 (name-version-build)
+            referenced_dists.update(name[:-5] for name in os.listdir(conda_meta_path) if name.endswith(".json"))
+        except OSError:
+            continue
+
+    pkgs_index_data = data_manager.get_data("pkgs_index_data")
+    if pkgs_index_data.get("key") == cache_key:
+        return pkgs_index_data["packages"]
+
+    pkg_dirs = {}
+    for pkgs_path in pkgs_paths:
+        try:
+            with os.scandir(pkgs_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and os.path.isdir(os.path.join(entry.path, "info")):
+                        try:
+                            pkg_dirs[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        scan_results = executor.map(_scan_pkg_dir, pkg_dirs)
+        packages: dict[str, PkgsIndexEntryDict] = {
+            path: {
+                "size": size,
+                "linked": linked,
+                "referenced": os.path.basename(path) in referenced_dists,
+                "mtime": mtime,
+            }
+            for (path, mtime), (size, linked) in zip(pkg_dirs.items(), scan_results)
+        }
+    data_manager.update_data("pkgs_index_data", {"key": cache_key, "packages": packages})
+    return packages
+
+
+def get_orphaned_pkgs(env_pathlist: Iterable[str]) -> list[tuple[str, int]]:
+    """获取各包缓存目录中已不被任何环境使用 (无硬链接且无 conda-meta 记录) 的包目录，按可回收大小降序排列。
+
+    Returns:
+        list[tuple[str, int]]: [(包目录路径, 可回收字节数), ...]
+    """
+    orphaned_pkgs = [
+        (path, info["size"])
+        for path, info in get_pkgs_index(env_pathlist).items()
+        if not info["linked"] and not info["referenced"]
+    ]
+    return sorted(orphaned_pkgs, key=lambda x: x[1], reverse=True)
+
+
+CONDA_PACKAGE_EXTENSIONS = (".conda", ".tar.bz2", ".conda.part", ".tar.bz2.part")
+CONDA_TEMP_EXTENSIONS = (".c~", ".trash", ".conda_trash")
+
+
+class CacheInventoryDict(TypedDict):
+    index_cache_size: int  # 各包缓存目录下 cache 中的索引缓存
+    tarballs_size: int  # 各包缓存目录中的压缩包 (含未下载完的 *.part)
+    orphaned_pkgs: list[tuple[str, int]]  # 未使用的包目录，见 get_orphaned_pkgs
+    logs_and_temps_size: int  # 各包缓存目录下 .logs 中的日志与残留的临时文件
+    pip_cache_dir: Union[str, None]  # pip 缓存目录，被禁用时为 None
+    pip_cache_size: int
+
+
+def get_pip_cache_dir() -> Union[str, None]:
+    """不启动 pip 子进程，按 pip 的配置优先级 (平台默认值 < 配置文件 < 环境变量) 定位 pip 的缓存目录。
+
+    Returns:
+        str | None: pip 缓存目录的路径；若缓存被 no-cache-dir 禁用，则返回 None。
+    """
+    import configparser
+
+    if os.name == "nt":
+        cache_dir = os.path.join(
+            os.environ.get("LOCALAPPDATA", os.path.join(USER_HOME, "AppData", "Local")), "pip", "Cache"
+        )
+        appdata = os.environ.get("APPDATA", os.path.join(USER_HOME, "AppData", "Roaming"))
+        config_files = [
+            os.path.join(os.environ.get("ProgramData", "C:\\ProgramData"), "pip", "pip.ini"),
+            os.path.join(USER_HOME, "pip", "pip.ini"),
+            os.path.join(appdata, "pip", "pip.ini"),
+            os.path.join(CONDA_HOME, "pip.ini"),
+        ]
+    elif sys.platform == "darwin":
+        cache_dir = os.path.join(USER_HOME, "Library", "Caches", "pip")
+        config_files = [
+            "/Library/Application Support/pip/pip.conf",
+            os.path.join(USER_HOME, ".pip", "pip.conf"),
+            os.path.join(USER_HOME, "Library", "Application Support", "pip", "pip.conf"),
+            os.path.join(USER_HOME, ".config", "pip", "pip.conf"),
+            os.path.join(CONDA_HOME, "pip.conf"),
+        ]
+    else:
+        cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(USER_HOME, ".cache")), "pip")
+        xdg_config_dirs = os.environ.get("XDG_CONFIG_DIRS", "/etc/xdg").split(os.pathsep)
+        config_files = [os.path.join(d, "pip", "pip.conf") for d in xdg_config_dirs] + [
+            "/etc/pip.conf",
+            os.path.join(USER_HOME, ".pip", "pip.conf"),
+            os.path.join(os.environ.get("XDG_CONFIG_HOME", os.path.join(USER_HOME, ".config")), "pip", "pip.conf"),
+            os.path.join(CONDA_HOME, "pip.conf"),
+        ]
+    if pip_config_file := os.environ.get("PIP_CONFIG_FILE"):
+        config_files = [] if pip_config_file == os.devnull else config_files + [pip_config_file]
+
+    no_cache = False
+    for config_file in config_files:
+        parser = configparser.RawConfigParser()
+        try:
+            parser.read(config_file, encoding="utf-8")
+        except (configparser.Error, UnicodeDecodeError):
+            continue
+        if parser.has_option("global", "cache-dir"):
+            cache_dir = os.path.expanduser(parser.get("global", "cache-dir"))
+        if parser.has_option("global", "no-cache-dir"):
+            no_cache = True  # 与 pip 一致，no-cache-dir 取任何值均表示禁用缓存
+    if "PIP_CACHE_DIR" in os.environ:
+        cache_dir = os.path.expanduser(os.environ["PIP_CACHE_DIR"])
+    if "PIP_NO_CACHE_DIR" in os.environ:
+        no_cache = True
+
+    return None if no_cache else cache_dir
+
+
+def get_cache_inventory(env_pathlist: Iterable[str]) -> CacheInventoryDict:
+    """在进程内一次性统计 [C] 菜单所列的各项缓存的大小，各项并发统计，无需调用 conda clean --dry-run 或 pip。
+
+    与 conda clean 一样统计所有包缓存目录 (见 _get_conda_pkgs_dirs)。残留的临时文件仅在包缓存目录与各环境的根目录中
+    查找，而非像 conda clean --tempfiles 一样遍历整个环境。
+    """
+    env_pathlist = list(env_pathlist)
+    pkgs_paths = [path for path in _get_conda_pkgs_dirs() if os.path.isdir(path)]
+
+    def _file_size(path: str) -> int:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return 0
+        return st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+
+    def _get_index_cache_size() -> int:
+        return sum(_scan_pkg_dir(os.path.join(pkgs_path, "cache"))[0] for pkgs_path in pkgs_paths)
+
+    def _get_tarballs_size() -> int:
+        size = 0
+        for pkgs_path in pkgs_paths:
+            try:
+                with os.scandir(pkgs_path) as entries:
+                    size += sum(
+                        _file_size(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(CONDA_PACKAGE_EXTENSIONS) and entry.is_file(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+        return size
+
+    def _get_logs_and_temps_size() -> int:
+        size = sum(_scan_pkg_dir(os.path.join(pkgs_path, ".logs"))[0] for pkgs_path in pkgs_paths)
+        for dir_path in pkgs_paths + env_pathlist:
+            try:
+                with os.scandir(dir_path) as entries:
+                    temp_paths = [entry.path for entry in entries if entry.name.endswith(CONDA_TEMP_EXTENSIONS)]
+            except OSError:
+                continue
+            size += sum(_file_size(path) for path in temp_paths)
+        return size
+
+    pip_cache_dir = get_pip_cache_dir()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        index_cache_future = executor.submit(_get_index_cache_size)
+        tarballs_future = executor.submit(_get_tarballs_size)
+        orphaned_pkgs_future = executor.submit(get_orphaned_pkgs, env_pathlist)
+        logs_and_temps_future = executor.submit(_get_logs_and_temps_size)
+        pip_cache_future = executor.submit(lambda: _scan_pkg_dir(pip_cache_dir)[0] if pip_cache_dir else 0)
+        return {
+            "index_cache_size": index_cache_future.result(),
+            "tarballs_size": tarballs_future.result(),
+            "orphaned_pkgs": orphaned_pkgs_future.result(),
+            "logs_and_temps_size": logs_and_temps_future.result(),
+            "pip_cache_dir": pip_cache_dir,
+            "pip_cache_size": pip_cache_future.result(),
+        }
+
+
+def _get_history_dist_times(env_pathlist: Iterable[str]) -> dict[str, float]:
+    """解析各环境的 conda-meta/history，获取每个包 (name-version-build) 最后一次出现在事务中的时间戳。"""
+    dist_times: dict[str, float] = {}
+    for env_path in env_pathlist:
+        try:
+            with open(
+                os.path.join(env_path, "conda-meta", "history"), "r", encoding="utf-8", errors="ignore"
+            ) as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        transaction_time = 0.0
+        for line in lines:
+            if line.startswith("==>") and (match := re.search(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", line)):
+                transaction_time = time.mktime(time.strptime(match.group(0), "%Y-%m-%d %H:%M:%S"))
+            elif line[:1] in ("+", "-"):  # 形如 "+defaults/linux-64::numpy-1.26.4-py312h2809609_0"
+                dist = line[1:].strip().split("::")[-1]
+                dist_times[dist] = max(dist_times.get(dist, 0.0), transaction_time)
+    return dist_times
+
+
+def plan_pkgs_eviction(env_pathlist: Iterable[str], budget: int) -> tuple[list[tuple[str, float, int]], int]:
+    """按最近最少使用 (LRU) 的顺序，规划需要从各包缓存目录中删除的包，使其总大小不超过 budget。
+
+    可删除的项为所有压缩包 (*.conda, *.tar.bz2) 以及不再被任何环境使用的已解压包目录 (见 get_orphaned_pkgs)。
+    最近使用时间取其访问时间 (atime) 与最后一次引用该包的 conda 事务时间中较晚者。
+
+    Args:
+        env_pathlist (Iterable[str]): 所有环境的路径。
+        budget (int): 包缓存目录的目标总大小 (字节)。
+
+    Returns:
+        tuple: (plan, pkgs_size)
+            - plan (list[tuple[str, float, int]]): [(路径, 最近使用时间戳, 可回收字节数), ...]，按删除顺序排列。
+            - pkgs_size (int): 当前各包缓存目录的实际总占用 (字节)。
+    """
+    env_pathlist = list(env_pathlist)
+    pkgs_index = get_pkgs_index(env_pathlist)
+    dist_times = _get_history_dist_times(env_pathlist)
+
+    pkgs_entries = []
+    for pkgs_path in _get_conda_pkgs_dirs():
+        try:
+            with os.scandir(pkgs_path) as entries:
+                pkgs_entries.extend(entries)
+        except OSError:
+            continue
+    pkgs_size = 0
+    candidates = []
+    for entry in pkgs_entries:
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        if entry.path in pkgs_index:
+            size = pkgs_index[entry.path]["size"]
+            dist = entry.name
+            evictable = not pkgs_index[entry.path]["linked"] and not pkgs_index[entry.path]["referenced"]
+        elif S_ISDIR(st.st_mode):
+            size = _scan_pkg_dir(entry.path)[0]
+            evictable = False
+        else:
+            size = st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+            dist = re.sub(r"(\.conda|\.tar\.bz2)$", "", entry.name)
+            evictable = dist != entry.name
+        pkgs_size += size
+        if evictable:
+            candidates.append((entry.path, max(st.st_atime, dist_times.get(dist, 0.0)), size))
+
+    plan = []
+    remaining_size = pkgs_size
+    for candidate in sorted(candidates, key=lambda x: x[1]):
+        if remaining_size <= budget:
+            break
+        plan.append(candidate)
+        remaining_size -= candidate[2]
+    return plan, pkgs_size
+
+
+def evict_pkgs(plan: list[tuple[str, float, int]]) -> int:
+    """并行删除 plan_pkgs_eviction 规划的包，返回实际释放的字节数。"""
+
+    def _remove(item: tuple[str, float, int]) -> int:
+        path, _, size = item
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                rmtree(path)
+            else:
+                os.remove(path)
+        except OSError as e:
+            print(LIGHT_RED(f"[错误] 删除 {path} 失败：{e}"))
+            return 0
+        return size
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return sum(executor.map(_remove, plan))
+
+
+CONDA_SUBDIRS = frozenset(
+    {
+        "linux-32",
+        "linux-64",
+        "linux-aarch64",
+        "linux-armv6l",
+        "linux-armv7l",
+        "linux-ppc64le",
+        "linux-s390x",
+        "noarch",
+        "osx-64",
+        "osx-arm64",
+        "win-32",
+        "win-64",
+        "win-arm64",
+    }
+)
+_DEFAULTS_CHANNEL_NAMES = ("main", "free", "r", "pro", "msys2")
+
+
+def get_platform_subdir() -> str:
+    """获取当前平台对应的 Conda 子目录 (subdir)，如 linux-64、osx-arm64、win-64，可被 CONDA_SUBDIR 环境变量覆盖。"""
+    import platform
+
+    if subdir := os.environ.get("CONDA_SUBDIR"):
+        return subdir
+    os_name = {"linux": "linux", "darwin": "osx", "win32": "win"}.get(sys.platform, sys.platform)
+    machine = platform.machine().lower()
+    if machine in ("x86_64", "amd64"):
+        arch = "64"
+    elif machine in ("i386", "i686", "x86"):
+        arch = "32"
+    elif machine in ("aarch64", "arm64"):
+        arch = "arm64" if os_name in ("osx", "win") else "aarch64"
+    else:
+        arch = machine
+    return f"{os_name}-{arch}"
+
+
+def _parse_channel_url(url: str) -> tuple[str, str]:
+    """从 repodata 的 URL (形如 https://conda.anaconda.org/conda-forge/label/dev/linux-64) 解析出 (源名称, 子目录)。
+
+    源名称为主机之后、子目录之前的完整路径 (如 conda-forge/label/dev)，镜像源的源名称因此含有镜像的路径前缀 (见
+    _channel_matches)；Anaconda 的 main、free、r 等默认源 (pkgs/main 等) 统一归为 "defaults"。不含子目录的 URL 或
+    源名称同样适用，此时子目录为空字符串。
+    """
+    url = url.rstrip("/").removesuffix("/repodata.json")
+    if "://" in url:
+        url = url.split("://", 1)[1].partition("/")[2]
+    parts = [part for part in url.split("/") if part]
+    subdir = parts.pop() if parts and parts[-1] in CONDA_SUBDIRS else ""
+    if parts and parts[-1] in _DEFAULTS_CHANNEL_NAMES and (len(parts) == 1 or parts[-2] == "pkgs"):
+        return "defaults", subdir
+    return "/".join(parts), subdir
+
+
+def _normalize_channel_name(channel: str) -> str:
+    """将 -c 参数或 .condarc 中的源 (名称或 URL) 规范为 _parse_channel_url 所返回的源名称。"""
+    return _parse_channel_url(channel)[0]
+
+
+def _channel_matches(channel_name: str, source_channel: str) -> bool:
+    """判断规范后的源名称 channel_name 是否指向 repodata 缓存的源 source_channel。
+
+    镜像源的源名称含有镜像的路径前缀 (如 anaconda/cloud/conda-forge)，故按完整的路径后缀匹配；但 conda-forge 与 dev
+    均不匹配 conda-forge/label/dev。
+    """
+    if source_channel == channel_name:
+        return True
+    if not source_channel.endswith("/" + channel_name):
+        return False
+    return source_channel[: -len(channel_name) - 1].rsplit("/", 1)[-1] != "label"
+
+
+class RepodataSourceDict(TypedDict):
+    path: str  # pkgs/cache 中的 repodata 缓存文件
+    url: str  # 该缓存对应的 repodata URL (不含 /repodata.json)
+    channel: str
+    subdir: str
+    refresh_time: float  # 最后一次从网络检查更新的时间
+    mtime_ns: int
+    size: int
+
+
+def list_repodata_sources() -> list[RepodataSourceDict]:
+    """列出各包缓存目录 (见 _get_conda_pkgs_dirs) 的 cache 中当前平台及 noarch 子目录的 repodata 缓存文件。
+
+    缓存对应的 URL 优先从 conda 写入的 *.info.json / *.state.json 中读取，否则从 repodata 开头的 "_url" 字段读取
+    (旧版 conda 及 mamba)，两者都不存在的文件被忽略。
+    """
+    subdirs = (get_platform_subdir(), "noarch")
+    sources = []
+    entries = []
+    for pkgs_path in _get_conda_pkgs_dirs():
+        try:
+            with os.scandir(os.path.join(pkgs_path, "cache")) as it:
+                entries.extend(entry for entry in it if re.fullmatch(r"[0-9a-f]{8}\.json", entry.name))
+        except OSError:
+            continue
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        url = ""
+        refresh_time = st.st_mtime
+        for sidecar_ext in (".state.json", ".info.json"):
+            try:
+                with open(entry.path[:-5] + sidecar_ext, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            url = state.get("url", "")
+            refresh_time = max(refresh_time, state.get("refresh_ns", 0) / 1e9)
+            break
+        if not url:
+            try:
+                with open(entry.path, "rb") as f:
+                    head = f.read(4096)
+            except OSError:
+                continue
+            if match := re.search(rb'"_url"\s*:\s*"([^"]+)"', head):
+                url = match.group(1).decode()
+        if not url:
+            continue
+        channel, subdir = _parse_channel_url(url)
+        if subdir in subdirs:
+            sources.append(
+                {
+                    "path": entry.path,
+                    "url": url.rstrip("/").removesuffix("/repodata.json"),
+                    "channel": channel,
+                    "subdir": subdir,
+                    "refresh_time": refresh_time,
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                }
+            )
+    return sources
+
+
+def split_repodata_channels(
+    channels: Iterable[str], sources: list[RepodataSourceDict], channel_refresh_times: dict[str, float]
+) -> tuple[list[str], list[str]]:
+    """将源分为 本地索引缓存仍有效的源 与 需要调用 conda 刷新的源 两部分。
+
+    当前平台子目录的缓存存在，且该源所有缓存文件在 CFG_SEARCH_CACHE_EXPIRE_MINUTES 内检查过更新的源，视为有效。
+
+    Args:
+        channels (Iterable[str]): 需要搜索的源。
+        sources (list[RepodataSourceDict]): list_repodata_sources 的结果。
+        channel_refresh_times (dict[str, float]): 本程序上次通过 conda 刷新各源的时间。
+    """
+    expire_time = time.time() - CFG_SEARCH_CACHE_EXPIRE_MINUTES * 60
+    platform_subdir = get_platform_subdir()
+    fresh_channels = []
+    stale_channels = []
+    for channel in channels:
+        channel_name = _normalize_channel_name(channel)
+        channel_sources = [source for source in sources if _channel_matches(channel_name, source["channel"])]
+        if any(source["subdir"] == platform_subdir for source in channel_sources) and all(
+            max(source["refresh_time"], channel_refresh_times.get(channel_name, 0)) >= expire_time
+            for source in channel_sources
+        ):
+            fresh_channels.append(channel)
+        else:
+            stale_channels.append(channel)
+    return fresh_channels, stale_channels
+
+
+def _parse_match_spec(spec: str) -> tuple[Union[str, None], str, str, str]:
+    """解析 Name=Version=Build 形式的搜索语法 (亦支持 "Name Version Build"、"channel::Name" 与 Name>=1.0,<2 等)。
+
+    Returns:
+        tuple: (源名称或 None, 包名模式, 版本约束, 构建字符串模式)，后两项为空字符串时表示不限。
+    """
+    spec = spec.strip()
+    channel = None
+    if "::" in spec:
+        channel, spec = spec.split("::", 1)
+    if " " in spec:
+        name, version, build = (spec.split() + ["", ""])[:3]
+        return channel, name.lower(), version, build
+    match = re.match(r"([^=<>!~]+)(.*)", spec)
+    if not match:
+        return channel, spec.lower(), "", ""
+    name, rest = match.group(1).lower(), match.group(2)
+    if rest.startswith("=") and not rest.startswith("=="):
+        version, _, build = rest[1:].partition("=")
+        # conda 中 Name=1.17 表示 1.17.*，而 Name==1.17 才表示精确匹配
+        if version and not re.search(r"[*<>!=~,|]", version):
+            version += ".*"
+        return channel, name, version, build
+    return channel, name, rest, ""
+
+
+REPODATA_INDEX_DIR = os.path.join(ProgramDataManager.program_data_home, "repodata_index")  # 每个缓存文件一个快照
+REPODATA_INDEX_VERSION = 2  # 二进制格式或其中的源名称规则变化时递增，旧版本的文件将被重建
+_REPODATA_INDEX_MAGIC = b"CEMRIDX\0"
+_REPODATA_INDEX_HEADER = struct.Struct("<8sII")  # 魔数, 格式版本, 元数据 (JSON) 的字节数
+# 各列的名称与 array/memoryview 的类型码；string_blob 为所有驻留字符串的 UTF-8 拼接，string_offsets 为其起始偏移
+_REPODATA_INDEX_COLUMNS = (
+    ("string_offsets", "Q"),
+    ("string_blob", "B"),
+    ("names", "I"),
+    ("name_offsets", "I"),
+    ("version_ids", "I"),
+    ("build_ids", "I"),
+    ("build_numbers", "I"),
+    ("timestamps", "q"),
+    ("sizes", "q"),
+    ("source_ids", "H"),
+    ("is_conda_format", "B"),
+    ("depends_offsets", "I"),
+    ("depends_ids", "I"),
+    ("constrains_offsets", "I"),
+    ("constrains_ids", "I"),
+)
+
+
+def _get_repodata_source_keys(sources: list[RepodataSourceDict]) -> list[list]:
+    """索引快照的有效性键：各 repodata 缓存文件的 [路径, mtime_ns, 大小, URL]，任一变化时重建快照。"""
+    return [[source["path"], source["mtime_ns"], source["size"], source["url"]] for source in sources]
+
+
+class RepodataIndex:
+    """pkgs/cache 中 repodata 缓存的列式索引，用于在进程内回答 [S] 的 Name=Version=Build 搜索。
+
+    每条包记录在各列中占一个位置，记录按包名排序分组存放，第 k 个包名的记录位于 [name_offsets[k], name_offsets[k+1])。
+    包名、版本、构建字符串与依赖项均驻留为字符串表中的编号；depends/constrains 以扁平的编号数组加每条记录的
+    起始偏移存储。
+
+    索引以版本化的二进制格式 (头部 + JSON 元数据 + 按 8 字节对齐的各列) 保存于 REPODATA_INDEX_DIR，通过 mmap
+    打开后各列均为直接指向映射内存的 memoryview，无需解析；多个进程共享操作系统页缓存中的同一份数据。
+    每个 repodata 缓存文件单独保存为一个快照 (见 get_repodata_index)，但本类同样可以索引多个源。
+    """
+
+    def __init__(self, buffer):
+        """从 serialize 的结果 (bytes 或 mmap) 打开索引，格式或字节序不符时引发 ValueError。"""
+        magic, version, meta_len = _REPODATA_INDEX_HEADER.unpack_from(buffer)
+        if magic != _REPODATA_INDEX_MAGIC or version != REPODATA_INDEX_VERSION:
+            raise ValueError("incompatible repodata index")
+        meta = json.loads(bytes(buffer[_REPODATA_INDEX_HEADER.size : _REPODATA_INDEX_HEADER.size + meta_len]))
+        if meta["byteorder"] != sys.byteorder:
+            raise ValueError("incompatible repodata index")
+        self.buffer = buffer  # 保持映射存活
+        self.source_keys: list[list] = meta["source_keys"]
+        self.sources: list[tuple[str, str, str]] = [tuple(source) for source in meta["sources"]]
+        self._view = memoryview(buffer)
+        for name, typecode in _REPODATA_INDEX_COLUMNS:
+            offset, nbytes = meta["columns"][name]
+            setattr(self, name, self._view[offset : offset + nbytes].cast(typecode))
+
+    def close(self):
+        """释放各列的 memoryview 与快照的映射，此后不可再使用本索引。
+
+        Windows 上被映射的文件无法被替换，故重建快照前须先关闭打开该快照的旧索引。
+        """
+        for name, _ in _REPODATA_INDEX_COLUMNS:
+            getattr(self, name).release()
+        self._view.release()
+        if hasattr(self.buffer, "close"):
+            self.buffer.close()
+
+    @staticmethod
+    def serialize(sources: list[RepodataSourceDict]) -> bytes:
+        """解析各 repodata 缓存文件，构建索引并序列化为二进制格式。"""
+        strings = {}
+
+        def intern(s: str) -> int:
+            if (string_id := strings.get(s)) is None:
+                string_id = strings[s] = len(strings)
+            return string_id
+
+        records_by_name: dict[str, list[tuple]] = {}
+        for source_id, source in enumerate(sources):
+            try:
+                with open(source["path"], "rb") as f:
+                    repodata = json.load(f)
+            except (OSError, ValueError):
+                continue
+            seen = set()  # 同时存在 .conda 与 .tar.bz2 格式时，与 conda 一样只保留 .conda
+            for key, is_conda_format in (("packages.conda", 1), ("packages", 0)):
+                for fn, record in repodata.get(key, {}).items():
+                    dist = fn.removesuffix(".conda").removesuffix(".tar.bz2")
+                    if dist in seen or "name" not in record:
+                        continue
+                    seen.add(dist)
+                    timestamp = record.get("timestamp", 0)
+                    if timestamp > 253402300799:  # 毫秒时间戳
+                        timestamp //= 1000
+                    records_by_name.setdefault(record["name"], []).append(
+                        (
+                            intern(record.get("version", "")),
+                            intern(record.get("build", "")),
+                            record.get("build_number", 0),
+                            int(timestamp),
+                            record.get("size", 0),
+                            source_id,
+                            is_conda_format,
+                            [intern(dep) for dep in record.get("depends", [])],
+                            [intern(dep) for dep in record.get("constrains", [])],
+                        )
+                    )
+            del repodata
+
+        columns = {name: array(typecode) for name, typecode in _REPODATA_INDEX_COLUMNS}
+        columns["name_offsets"].append(0)
+        columns["depends_offsets"].append(0)
+        columns["constrains_offsets"].append(0)
+        for name in sorted(records_by_name):
+            columns["names"].append(intern(name))
+            for record in records_by_name[name]:
+                version_id, build_id, build_number, timestamp, size, source_id, is_conda_format, deps, cons = (
+                    record
+                )
+                columns["version_ids"].append(version_id)
+                columns["build_ids"].append(build_id)
+                columns["build_numbers"].append(build_number)
+                columns["timestamps"].append(timestamp)
+                columns["sizes"].append(size)
+                columns["source_ids"].append(source_id)
+                columns["is_conda_format"].append(is_conda_format)
+                columns["depends_ids"].extend(deps)
+                columns["depends_offsets"].append(len(columns["depends_ids"]))
+                columns["constrains_ids"].extend(cons)
+                columns["constrains_offsets"].append(len(columns["constrains_ids"]))
+            columns["name_offsets"].append(len(columns["version_ids"]))
+        string_blob = bytearray()
+        for s in strings:  # dict 保持插入顺序，即编号顺序
+            columns["string_offsets"].append(len(string_blob))
+            string_blob += s.encode("utf-8")
+        columns["string_offsets"].append(len(string_blob))
+        columns["string_blob"] = array("B", string_blob)
+
+        meta = {
+            "byteorder": sys.byteorder,
+            "source_keys": _get_repodata_source_keys(sources),
+            "sources": [(source["url"], source["channel"], source["subdir"]) for source in sources],
+            "columns": {name: [0, 0] for name, _ in _REPODATA_INDEX_COLUMNS},
+        }
+        # 元数据中的列偏移依赖元数据自身的长度，故预留足够的长度后以空格补齐
+        meta_len = len(json.dumps(meta)) + 32 * len(_REPODATA_INDEX_COLUMNS)
+        offset = _REPODATA_INDEX_HEADER.size + meta_len
+        for name, _ in _REPODATA_INDEX_COLUMNS:
+            offset = (offset + 7) // 8 * 8
+            nbytes = len(columns[name]) * columns[name].itemsize
+            meta["columns"][name] = [offset, nbytes]
+            offset += nbytes
+        meta_bytes = json.dumps(meta).encode().ljust(meta_len)
+
+        data = bytearray(_REPODATA_INDEX_HEADER.pack(_REPODATA_INDEX_MAGIC, REPODATA_INDEX_VERSION, meta_len))
+        data += meta_bytes
+        for name, _ in _REPODATA_INDEX_COLUMNS:
+            data += bytes(meta["columns"][name][0] - len(data))
+            data += columns[name].tobytes()
+        return bytes(data)
+
+    def _string(self, string_id: int) -> str:
+        return str(self.string_blob[self.string_offsets[string_id] : self.string_offsets[string_id + 1]], "utf-8")
+
+    def _match_name_ids(self, name_pattern: str) -> list[int]:
+        if "*" in name_pattern:
+            return [k for k in range(len(self.names)) if fnmatchcase(self._string(self.names[k]), name_pattern)]
+        lo, hi = 0, len(self.names)  # 包名已排序，二分查找
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(self.names[mid]) < name_pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return [lo] if lo < len(self.names) and self._string(self.names[lo]) == name_pattern else []
+
+    def search(self, spec: str, channels: Iterable[str]) -> list[dict[str, Any]]:
+        """在指定的源中搜索匹配 spec 的包，返回与 conda repoquery search --json 的 result.pkgs 格式相同的记录。"""
+        spec_channel, name_pattern, version_spec, build_pattern = _parse_match_spec(spec)
+        channel_names = {_normalize_channel_name(channel) for channel in channels}
+        if spec_channel is not None:
+            channel_names &= {_normalize_channel_name(spec_channel)}
+        allowed_sources = {
+            i
+            for i, (_, channel, _) in enumerate(self.sources)
+            if any(_channel_matches(channel_name, channel) for channel_name in channel_names)
+        }
+        if not allowed_sources:
+            return []
+        version_matches: dict[int, bool] = {}
+        build_matches: dict[int, bool] = {}
+
+        def match_version(version_id: int) -> bool:
+            if (matched := version_matches.get(version_id)) is None:
+                try:
+                    matched = is_version_within_constraints(self._string(version_id), version_spec)
+                except Exception:
+                    matched = False
+                version_matches[version_id] = matched
+            return matched
+
+        def match_build(build_id: int) -> bool:
+            if (matched := build_matches.get(build_id)) is None:
+                matched = build_matches[build_id] = fnmatchcase(self._string(build_id), build_pattern)
+            return matched
+
+        results = []
+        for name_id in self._match_name_ids(name_pattern):
+            name = self._string(self.names[name_id])
+            for i in range(self.name_offsets[name_id], self.name_offsets[name_id + 1]):
+                if self.source_ids[i] not in allowed_sources:
+                    continue
+                if version_spec and not match_version(self.version_ids[i]):
+                    continue
+                if build_pattern and not match_build(self.build_ids[i]):
+                    continue
+                results.append(self._get_record(i, name))
+        return results
+
+    def _get_record(self, i: int, name: str) -> dict[str, Any]:
+        url, channel, subdir = self.sources[self.source_ids[i]]
+        version = self._string(self.version_ids[i])
+        build = self._string(self.build_ids[i])
+        fn = f"{name}-{version}-{build}" + (".conda" if self.is_conda_format[i] else ".tar.bz2")
+        depends_ids = self.depends_ids[self.depends_offsets[i] : self.depends_offsets[i + 1]]
+        constrains_ids = self.constrains_ids[self.constrains_offsets[i] : self.constrains_offsets[i + 1]]
+        return {
+            "name": name,
+            "version": version,
+            "build": build,
+            "build_number": self.build_numbers[i],
+            "channel": channel,
+            "subdir": subdir,
+            "fn": fn,
+            "url": f"{url}/{fn}",
+            "depends": [self._string(dep_id) for dep_id in depends_ids],
+            "constrains": [self._string(dep_id) for dep_id in constrains_ids],
+            "timestamp": self.timestamps[i],
+            "size": self.sizes[i],
+        }
+
+
+class RepodataIndexSet:
+    """多个 RepodataIndex 的集合 (见 get_repodata_index)，搜索结果为各索引的搜索结果之和。"""
+
+    def __init__(self, indexes: list[RepodataIndex]):
+        self.indexes = indexes
+
+    def search(self, spec: str, channels: Iterable[str]) -> list[dict[str, Any]]:
+        """同 RepodataIndex.search。"""
+        channels = list(channels)
+        return [record for index in self.indexes for record in index.search(spec, channels)]
+
+
+def _get_repodata_index_snapshot_file(source_path: str) -> str:
+    """获取 repodata 缓存文件 source_path 的索引快照路径 (以其路径的哈希命名，不同包缓存目录中的同名文件互不冲突)。"""
+    import hashlib
+
+    return os.path.join(REPODATA_INDEX_DIR, hashlib.md5(source_path.encode()).hexdigest() + ".bin")
+
+
+def _open_repodata_index_snapshot(snapshot_file: str) -> Union[RepodataIndex, None]:
+    """以只读 mmap 打开索引快照 snapshot_file，文件不存在或格式不兼容时返回 None。"""
+    import mmap
+
+    try:
+        with open(snapshot_file, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return RepodataIndex(buffer)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+
+_repodata_indexes: dict[str, RepodataIndex] = {}  # 本进程中已打开的索引，{repodata 缓存文件路径: 索引}
+
+
+def _get_source_repodata_index(source: RepodataSourceDict) -> RepodataIndex:
+    """获取单个 repodata 缓存文件的索引，依次复用本进程中已打开的索引与磁盘上的快照，均已过期时才重新解析。
+
+    新快照先写入临时文件再重命名替换，不影响其他进程正在映射的旧快照；替换前先关闭本进程对旧快照的映射。无法写入
+    快照时 (如 Windows 上旧快照正被其他进程映射) 直接使用内存中的索引。
+    """
+    source_keys = _get_repodata_source_keys([source])
+    if (index := _repodata_indexes.get(source["path"])) is not None and index.source_keys == source_keys:
+        return index
+    snapshot_file = _get_repodata_index_snapshot_file(source["path"])
+    if index is None:
+        index = _open_repodata_index_snapshot(snapshot_file)
+        if index is not None and index.source_keys == source_keys:
+            _repodata_indexes[source["path"]] = index
+            return index
+    if index is not None:
+        _repodata_indexes.pop(source["path"], None)
+        index.close()
+
+    buffer = RepodataIndex.serialize([source])
+    tmp_file = f"{snapshot_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(REPODATA_INDEX_DIR, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            f.write(buffer)
+        os.replace(tmp_file, snapshot_file)
+        index = _open_repodata_index_snapshot(snapshot_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        index = None
+    if index is None or index.source_keys != source_keys:
+        index = RepodataIndex(buffer)
+    _repodata_indexes[source["path"]] = index
+    return index
+
+
+def get_repodata_index(sources: list[RepodataSourceDict]) -> RepodataIndexSet:
+    """获取 sources 的 repodata 索引。
+
+    每个 repodata 缓存文件单独索引并保存快照，故某个源的缓存文件的 mtime 或大小变化时只需重新解析该文件。
+    本进程中已不在 sources 中的缓存文件的索引随之关闭。
+    """
+    source_paths = {source["path"] for source in sources}
+    for path in [path for path in _repodata_indexes if path not in source_paths]:
+        _repodata_indexes.pop(path).close()
+    return RepodataIndexSet([_get_source_repodata_index(source) for source in sources])
+
+
+def _get_pending_env_size_entry(last_entry: Union[dict[str, int], None] = None) -> dict[str, int]:
+    """获取尚未统计的环境的大小信息，其中的 -1 表示待统计 (显示为 “…”)，0 的修改时间使下次启动时重新统计。
+
+    Args:
+        last_entry (dict, optional): 该环境上次的大小信息，其中的文件数与统计速度会被保留，用于估计下次统计的进度。
+    """
+    last_entry = last_entry or {}
+    return {
+        "real_usage": -1,
+        "total_size": -1,
+        "conda_mtime": 0,
+        "pip_mtime": 0,
+        "exclusive": 0,
+        "shared_pkgs": 0,
+        "shared_envs": 0,
+        "file_count": last_entry.get("file_count", 0),
+        "scan_rate": last_entry.get("scan_rate", 0),
+    }
+
+
+def _get_estimated_env_size_entry(estimate: tuple[int, int, int, int]) -> dict[str, Any]:
+    """获取抽样估计的环境大小信息 (见 estimate_paths_sizes)，其中 estimate_ci 为 [实际磁盘占用, 表观大小] 的 95%
+    置信区间半宽，显示时标记为 “≈”，在精确统计完成后被替换。"""
+    real_usage, total_size, real_usage_ci, total_size_ci = estimate
+    entry: dict[str, Any] = _get_pending_env_size_entry()
+    entry.update(real_usage=real_usage, total_size=total_size, estimate_ci=[real_usage_ci, total_size_ci])
+    return entry
+
+
+def _calc_env_sizes(
+    namelist: list[str],
+    pathlist: list[str],
+    pyverlist: list[str],
+    quiet: bool = False,
+    on_env_done: Union[Callable[[str, dict[str, int]], None], None] = None,
+    cancel_event: Union[Event, None] = None,
+) -> tuple[dict[str, dict[str, int]], int]:
+    """统计所有环境的大小 (按 CFG_ENV_SIZE_METHOD 遍历文件或根据包的元数据估计)，返回 get_home_sizes 格式的
+    (name_sizes_dict, disk_usage)。
+
+    Args:
+        quiet (bool): 是否不显示进度条。Linux下进度按上次保存的各环境文件数 (file_count) 与统计速度 (scan_rate，
+            文件数/秒) 估计。
+        on_env_done (Callable, optional): Linux下或按元数据估计时，每个环境统计完成时以 (环境名, 大小信息) 调用的回调函数；此时各环境的
+            共享情况 (exclusive 等) 尚未统计，待全部完成后才会写入返回的 name_sizes_dict。
+        cancel_event (Event, optional): Linux下被设置后尽快停止统计，此时 name_sizes_dict 仅包含已完成的环境，
+            disk_usage 为其实际磁盘占用之和。
+    """
+    # 修改时间在统计前获取，使统计期间发生的变化在下次仍会触发重新统计
+    mtimes_list = [_get_envpath_last_modified_time(path, pyver) for path, pyver in zip(pathlist, pyverlist)]
+    name_sizes_dict = {}
+    scan_start_time = time.time()
+
+    def _on_path_done(idx: int, real_usage: int, total_size: int, file_count: int = 0):
+        name_sizes_dict[namelist[idx]] = {
+            "real_usage": real_usage,
+            "total_size": total_size,
+            "conda_mtime": mtimes_list[idx][0],
+            "pip_mtime": mtimes_list[idx][1],
+            "exclusive": 0,
+            "shared_pkgs": 0,
+            "shared_envs": 0,
+            "file_count": file_count,
+            # 各环境并行统计，故以从开始统计到该环境完成的耗时计算速度，其倒数乘以文件数即为该环境完成的时刻
+            "scan_rate": file_count / max(time.time() - scan_start_time, 1e-3),
+        }
+        if on_env_done is not None:
+            on_env_done(namelist[idx], name_sizes_dict[namelist[idx]])
+
+    if _get_env_size_method() == "metadata" and (
+        metadata_sizes := _get_envsizes_metadata(pathlist, pyverlist, quiet)
+    ):
+        real_usage_list, total_size_list, disk_usage, sharing_list, file_count_list = metadata_sizes
+        for idx, (real_usage, total_size, file_count) in enumerate(
+            zip(real_usage_list, total_size_list, file_count_list)
+        ):
+            _on_path_done(idx, real_usage, total_size, file_count)
+        for name, (exclusive, shared_pkgs, shared_envs) in zip(namelist, sharing_list):
+            name_sizes_dict[name].update(exclusive=exclusive, shared_pkgs=shared_pkgs, shared_envs=shared_envs)
+    elif os.name == "posix":
+        # 由上次各环境的文件数与统计速度估计本次的总文件数与耗时
+        last_env_sizes = data_manager.get_data("envs_size_data").get("env_sizes", {})
+        history = [
+            (entry["file_count"], entry["file_count"] / entry["scan_rate"])
+            for name in namelist
+            if (entry := last_env_sizes.get(name, {})).get("scan_rate")
+        ]
+        scan_history = (sum(h[0] for h in history), max((h[1] for h in history), default=0))
+        _, _, disk_usage, sharing_list = _get_envsizes_linux(
+            pathlist, quiet, _on_path_done, cancel_event, scan_history
+        )
+        for name, (exclusive, shared_pkgs, shared_envs) in zip(namelist, sharing_list):
+            name_sizes_dict[name].update(exclusive=exclusive, shared_pkgs=shared_pkgs, shared_envs=shared_envs)
+    else:  # os.name == "nt":
+        real_usage_list, total_size_list, disk_usage = _get_envsizes_windows(pathlist, quiet)
+        for idx, (real_usage, total_size) in enumerate(zip(real_usage_list, total_size_list)):
+            _on_path_done(idx, real_usage, total_size)
+
+    return name_sizes_dict, disk_usage
+
+
+class EnvSizeCalculator(Thread):
+    """在后台统计所有环境大小的线程类，用于上次统计耗时过长时，使主界面无需等待统计完成即可使用。
+
+    Attributes:
+        name_sizes_dict (dict): 已统计完成的环境的大小信息，格式同 get_home_sizes。
+        estimated_sizes (dict): 统计完成前代替尚未完成的环境显示的估计值，格式同 _get_estimated_env_size_entry。
+        disk_usage (int): 总磁盘占用，统计完成前为 -1。
+        on_update (Callable, optional): 每个环境统计完成及全部完成时调用的回调函数 (在本线程中调用)。
+    """
+
+    def __init__(
+        self,
+        namelist: list[str],
+        pathlist: list[str],
+        pyverlist: list[str],
+        estimated_sizes: Union[dict[str, dict[str, Any]], None] = None,
+    ):
+        super().__init__(daemon=True)
+        self.namelist = namelist
+        self.pathlist = pathlist
+        self.pyverlist = pyverlist
+        self.estimated_sizes = estimated_sizes or {}
+        self.name_sizes_dict: dict[str, dict[str, int]] = {}
+        self.disk_usage = -1
+        self.on_update: Union[Callable[[], None], None] = None
+        self.cancel_event = Event()
+
+    def run(self):
+        def _on_env_done(name: str, size_entry: dict[str, int]):
+            self.name_sizes_dict[name] = size_entry
+            self._notify()
+
+        calc_start_time = time.time()
+        try:
+            name_sizes_dict, disk_usage = _calc_env_sizes(
+                self.namelist,
+                self.pathlist,
+                self.pyverlist,
+                quiet=True,
+                on_env_done=_on_env_done,
+                cancel_event=self.cancel_event,
+            )
+        except Exception:
+            return
+        calc_cost_time = data_manager.get_data("envs_size_data").get("calc_cost_time", 0)
+        if self.cancel_event.is_set():  # 保存已完成的部分，其余环境在下次启动时重新统计
+            last_env_sizes = data_manager.get_data("envs_size_data").get("env_sizes", {})
+            for name in self.namelist:
+                name_sizes_dict.setdefault(name, _get_pending_env_size_entry(last_env_sizes.get(name)))
+        else:
+            calc_cost_time = time.time() - calc_start_time
+        envs_size_data = {"env_sizes": name_sizes_dict, "disk_usage": disk_usage, "calc_cost_time": calc_cost_time}
+        data_manager.update_data("envs_size_data", envs_size_data)
+        if not self.cancel_event.is_set():
+            self.name_sizes_dict = name_sizes_dict
+            self.disk_usage = disk_usage
+            self._notify()
+
+    def _notify(self):
+        if self.on_update is not None:
+            try:
+                self.on_update()
+            except Exception:
+                pass
+
+    def get_env_sizes(self) -> tuple[dict[str, dict[str, int]], int]:
+        """返回当前的统计结果，格式同 get_home_sizes，尚未完成的环境为其估计值，没有估计值时大小为 -1。"""
+        name_sizes_dict = {
+            name: self.name_sizes_dict.get(name) or self.estimated_sizes.get(name) or _get_pending_env_size_entry()
+            for name in self.namelist
+        }
+        disk_usage = self.disk_usage
+        if disk_usage < 0 and all(entry["real_usage"] >= 0 for entry in name_sizes_dict.values()):
+            disk_usage = sum(entry["real_usage"] for entry in name_sizes_dict.values())  # 含估计值
+        return name_sizes_dict, disk_usage
+
+    def cancel(self):
+        """停止统计并等待已完成部分的结果保存完毕。"""
+        self.cancel_event.set()
+        self.join(timeout=5)
+
+
+env_size_calculator: Union[EnvSizeCalculator, None] = None
+
+
+def _get_background_env_sizes(
+    namelist: list[str],
+    pathlist: list[str],
+    pyverlist: list[str],
+    estimated_sizes: Union[dict[str, dict[str, Any]], None] = None,
+) -> tuple[dict[str, dict[str, int]], int]:
+    """确保后台统计线程正在统计当前的环境列表，并返回其已完成的部分，格式同 get_home_sizes，未完成的部分为
+    estimated_sizes 中的估计值或 -1。"""
+    global env_size_calculator
+    if (
+        env_size_calculator is None
+        or not env_size_calculator.is_alive()
+        or env_size_calculator.pathlist != pathlist
+    ):
+        if env_size_calculator is not None:
+            env_size_calculator.cancel()
+        env_size_calculator = EnvSizeCalculator(namelist, pathlist, pyverlist, estimated_sizes)
+        env_size_calculator.start()
+    return env_size_calculator.get_env_sizes()
+
+
+def cancel_env_size_calculation():
+    """若后台统计线程仍在运行，则停止统计并保存已完成的部分 (含已遍历目录的大小树节点)，在程序退出前调用。"""
+    if env_size_calculator is not None and env_size_calculator.is_alive():
+        env_size_calculator.cancel()
+
+
+def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str], quiet: bool = False):
     """获取环境的大小信息。
 
     Notes:
         1. 此函数是前面两个函数的高级封装版本，应该直接调用本函数。
         2. 因为同一conda包的多次安装只会在pkgs目录下创建一次，其余环境均为硬链接，故实际磁盘占用会远小于表观大小；
+        3. quiet 为 True 时不输出任何提示信息与进度条，用于在后台线程中调用。
+        4. 若需重新统计且上次统计耗时超过 CFG_MAX_ENV_SIZE_CALC_SECONDS，则交由 EnvSizeCalculator 在后台统计并立即
+           返回，尚未统计完成的环境及总磁盘使用量为 -1。
+        5. 首次统计时先由 estimate_paths_sizes 抽样估计，若预计遍历耗时超过 CFG_MAX_ENV_SIZE_CALC_SECONDS，同样在
+           后台统计，尚未统计完成的环境返回估计值 (含 estimate_ci 键)，总磁盘使用量为含估计值的总和。
+        6. 若后台统计线程正在统计同一环境列表，则直接返回其当前结果，不再重复估计。
 
     Returns:
         tuple: 包含以下信息的元组：
@@ -916,6 +3489,12 @@ def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str
                     - ("total_size", int): 环境表观总大小。
                     - ("conda_mtime", int): conda-meta 目录的最后修改时间。
                     - ("pip_mtime", int): site-packages 目录的最后修改时间。
+                    - ("exclusive", int): 仅该环境引用的文件的磁盘占用，即删除该环境实际可释放的空间。
+                    - ("shared_pkgs", int): 与 pkgs 等包缓存目录 (而非其他环境) 共享的文件的磁盘占用。
+                    - ("shared_envs", int): 与其他环境共享的文件的磁盘占用。
+                    以上三项在 Windows 下遍历文件统计时均为 0 (未统计)。
+                    - ("file_count", int): 环境中的文件数 (Linux下)。
+                    - ("scan_rate", float): 上次统计该环境时的速度 (文件数/秒，Linux下)，用于估计下次统计的进度。
             - disk_usage (int): 总磁盘使用量。
     """
     envs_size_data = data_manager.get_data("envs_size_data")
@@ -932,7 +3511,11 @@ def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str
     calc_all = False
     for name, path, pyver in zip(namelist, pathlist, pyverlist):
         c_conda_mtime, c_pip_mtime = _get_envpath_last_modified_time(path, pyver)
-        if name not in last_env_sizes or c_conda_mtime != last_env_sizes[name]["conda_mtime"]:
+        if (
+            name not in last_env_sizes
+            or c_conda_mtime != last_env_sizes[name]["conda_mtime"]
+            or (os.name == "posix" and "exclusive" not in last_env_sizes[name])  # 旧版数据未统计共享情况
+        ):
             calc_all = True
             break
         elif c_pip_mtime != last_env_sizes[name]["pip_mtime"]:
@@ -945,8 +3528,17 @@ def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str
                 "total_size": last_env_sizes[name]["total_size"],
                 "conda_mtime": c_conda_mtime,
                 "pip_mtime": c_pip_mtime,
+                "exclusive": last_env_sizes[name].get("exclusive", 0),
+                "shared_pkgs": last_env_sizes[name].get("shared_pkgs", 0),
+                "shared_envs": last_env_sizes[name].get("shared_envs", 0),
+                "file_count": last_env_sizes[name].get("file_count", 0),
+                "scan_rate": last_env_sizes[name].get("scan_rate", 0),
             }
 
+    # Linux下有目录大小树，完整重算也只需重新列出变化的目录，故直接重算以得到精确的实际磁盘占用
+    if os.name == "posix" and (namelist_changed or namelist_deleted):
+        calc_all = True
+
     c_pkgs_item_count, c_pkgs_mtime, c_cache_size = _get_base_env_modified_info()
     last_base_pkgs_info = data_manager.get_data("base_pkgs_info")
     base_pkgs_info = {"pkgs_item_count": c_pkgs_item_count, "pkgs_mtime": c_pkgs_mtime}
@@ -963,43 +3555,40 @@ def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str
     if not namelist_changed and not namelist_deleted and not calc_all:
         return name_sizes_dict, disk_usage
 
-    print(f"{LIGHT_YELLOW('[提示]')} 正在计算环境大小及磁盘占用情况，请稍等...")
+    global env_size_recalc_force_enable
+    if (
+        calc_all
+        and not env_size_recalc_force_enable
+        and env_size_calculator is not None
+        and env_size_calculator.is_alive()
+        and env_size_calculator.pathlist == pathlist
+    ):
+        # 后台正在统计同一环境列表 (首次统计时 calc_cost_time 在完成前一直为 0)，直接返回其结果，不再重复抽样估计
+        return env_size_calculator.get_env_sizes()
+    if calc_all and not env_size_recalc_force_enable and calc_cost_time > CFG_MAX_ENV_SIZE_CALC_SECONDS:
+        # 上次统计耗时过长，改为在后台统计，期间主界面可正常使用，尚未统计完的环境大小显示为 “…”
+        return _get_background_env_sizes(namelist, pathlist, pyverlist)
+    if calc_all and not env_size_recalc_force_enable and not calc_cost_time and _get_env_size_method() == "scan":
+        # 首次统计，没有耗时记录：先抽样估计，若按抽样的速度预计遍历耗时过长，则先显示估计值 (标记为 “≈”) 并在后台
+        # 精确统计，完成后替换
+        estimates, predicted_seconds = estimate_paths_sizes(
+            pathlist, [os.path.join(CONDA_HOME, "envs")], [os.path.join(CONDA_HOME, "pkgs")]
+        )
+        if predicted_seconds > CFG_MAX_ENV_SIZE_CALC_SECONDS:
+            estimated_sizes = {
+                name: _get_estimated_env_size_entry(estimate) for name, estimate in zip(namelist, estimates)
+            }
+            return _get_background_env_sizes(namelist, pathlist, pyverlist, estimated_sizes)
+
+    if not quiet:
+        print(f"{LIGHT_YELLOW('[提示]')} 正在计算环境大小及磁盘占用情况，请稍等...")
 
-    global env_size_recalc_need_confirm, env_size_recalc_force_enable
     if calc_all:
-        name_sizes_dict.clear()
-        if env_size_recalc_force_enable or calc_cost_time <= CFG_MAX_ENV_SIZE_CALC_SECONDS:
-            env_size_recalc_force_enable = False
-            env_size_recalc_need_confirm = False
-            calc_start_time = time.time()
-            if os.name == "posix":
-                real_usage_list, total_size_list, disk_usage = _get_envsizes_linux(pathlist)
-            else:  # os.name == "nt":
-                real_usage_list, total_size_list, disk_usage = _get_envsizes_windows(pathlist)
-
-            for name, real_usage, total_size in zip(namelist, real_usage_list, total_size_list):
-                c_conda_mtime, c_pip_mtime = _get_envpath_last_modified_time(
-                    pathlist[namelist.index(name)], pyverlist[namelist.index(name)]
-                )
-                name_sizes_dict[name] = {
-                    "real_usage": real_usage,
-                    "total_size": total_size,
-                    "conda_mtime": c_conda_mtime,
-                    "pip_mtime": c_pip_mtime,
-                }
-
-            calc_cost_time = time.time() - calc_start_time
-        else:  # 未获取磁盘使用量，重置所有环境的大小
-            env_size_recalc_need_confirm = True
-            disk_usage = 0
-            for name in namelist:
-                name_sizes_dict[name] = {
-                    "real_usage": 0,
-                    "total_size": 0,
-                    "conda_mtime": 0,
-                    "pip_mtime": 0,
-                }
-    else:  # 此分支仅在删除环境或环境的pip包时执行
+        env_size_recalc_force_enable = False
+        calc_start_time = time.time()
+        name_sizes_dict, disk_usage = _calc_env_sizes(namelist, pathlist, pyverlist, quiet)
+        calc_cost_time = time.time() - calc_start_time
+    else:  # 此分支仅在 Windows 下删除环境或环境的pip包时执行
         total_size_list = get_paths_totalsize_list(pathlist_changed)
 
         for idx, name in enumerate(namelist_changed):
@@ -1012,59 +3601,434 @@ def get_home_sizes(namelist: list[str], pathlist: list[str], pyverlist: list[str
                 "total_size": total_size,
                 "conda_mtime": timestamplist_changed[idx]["conda_mtime"],
                 "pip_mtime": timestamplist_changed[idx]["pip_mtime"],
+                "exclusive": 0,
+                "shared_pkgs": 0,
+                "shared_envs": 0,
+                "file_count": 0,
+                "scan_rate": 0,
             }
             disk_usage += diff_size
 
-        for name in namelist_deleted:
-            disk_usage -= last_env_sizes[name]["real_usage"]
+        for name in namelist_deleted:
+            disk_usage -= last_env_sizes[name]["real_usage"]
+
+    envs_size_data = {"env_sizes": name_sizes_dict, "disk_usage": disk_usage, "calc_cost_time": calc_cost_time}
+    data_manager.update_data("envs_size_data", envs_size_data)
+
+    if not quiet:
+        clear_lines_above(1)
+
+    return name_sizes_dict, disk_usage
+
+
+def _parse_conda_history(history_path: str, last_record: Union[dict[str, Any], None]) -> dict[str, Any]:
+    """增量解析 conda-meta/history 文件中的修订记录头 (形如 "==> 2024-01-01 12:00:00 <==")。
+
+    Args:
+        history_path (str): history 文件路径。
+        last_record (dict | None): 上次解析的记录，包含 key ([inode, size, mtime])、offset (已解析的字节数)、
+            install_time (首个修订时间)、last_transaction_time (最后一个修订时间) 与 revision_count (修订次数)。
+
+    Returns:
+        dict: 本次解析的记录，格式同 last_record；若文件不存在则 key 为 None 且修订次数为 0。
+
+    Note:
+        history 文件仅会被追加写入，故当 inode 不变且文件未变小时，仅需从上次的字节偏移处解析新追加的内容。
+    """
+    try:
+        st = os.stat(history_path)
+    except OSError:
+        return {"key": None, "offset": 0, "install_time": None, "last_transaction_time": None, "revision_count": 0}
+    key = [st.st_ino, st.st_size, st.st_mtime]
+    if last_record is not None and "revision_count" not in last_record:
+        last_record = None  # 旧版本的记录格式 (保存了全部 headers)，需重新解析
+    if last_record and last_record["key"] == key:
+        return last_record
+    if (
+        last_record
+        and last_record["key"]
+        and last_record["key"][0] == st.st_ino
+        and last_record["offset"] <= st.st_size
+    ):
+        offset = last_record["offset"]
+        install_time = last_record["install_time"]
+        last_transaction_time = last_record["last_transaction_time"]
+        revision_count = last_record["revision_count"]
+    else:
+        offset = 0
+        install_time = last_transaction_time = None
+        revision_count = 0
+    with open(history_path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    parsed_length = data.rfind(b"\n") + 1  # 只解析完整的行，末尾未写完的行留待下次解析
+    for line in data[:parsed_length].splitlines():
+        if line.startswith(b"==>") and (match := re.search(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", line)):
+            last_transaction_time = match.group(0).decode()
+            install_time = install_time or last_transaction_time
+            revision_count += 1
+    return {
+        "key": key,
+        "offset": offset + parsed_length,
+        "install_time": install_time,
+        "last_transaction_time": last_transaction_time,
+        "revision_count": revision_count,
+    }
+
+
+def get_conda_history_infos(env_pathlist: Iterable[str]) -> list[dict[str, Any]]:
+    """批量获取环境的 conda-meta/history 信息，解析结果保存在程序数据中以供增量更新。
+
+    Returns:
+        list[dict]: 每个环境的信息字典，包含以下键值对：
+            - ("install_time", str | None): 第一次修订 (即环境创建) 的时间，形如 "%Y-%m-%d %H:%M:%S"。
+            - ("last_transaction_time", str | None): 最后一次 conda 事务的时间。
+            - ("revision_count", int): 修订次数。
+    """
+    conda_history_data = data_manager.get_data("conda_history_data")
+    new_conda_history_data = {path: record for path, record in conda_history_data.items() if os.path.isdir(path)}
+    history_infos = []
+    for env_path in env_pathlist:
+        last_record = conda_history_data.get(env_path)
+        record = _parse_conda_history(os.path.join(env_path, "conda-meta", "history"), last_record)
+        if record["key"] is None:
+            new_conda_history_data.pop(env_path, None)
+        else:
+            new_conda_history_data[env_path] = record
+        history_infos.append(
+            {
+                "install_time": record["install_time"],
+                "last_transaction_time": record["last_transaction_time"],
+                "revision_count": record["revision_count"],
+            }
+        )
+    if new_conda_history_data != conda_history_data:
+        data_manager.update_data("conda_history_data", new_conda_history_data)
+
+    return history_infos
+
+
+def _get_env_last_updated_date(env_path: str, pyver: str, history_info: dict[str, Any]) -> str:
+    """通过检查 conda 及 pip 的安装行为，获取环境的最后更新日期。
+
+    Args:
+        history_info (dict): 该环境由 get_conda_history_infos 得到的 history 信息。
+
+    Returns:
+        str: 格式化的日期字符串 "%Y-%m-%d" 或 "Unknown"
+
+    Note:
+        用于 env_lastmodified_timelist
+    """
+    if os.name == "nt":
+        site_packages_path = os.path.join(env_path, "Lib", "site-packages")
+    else:  # os.name == "posix":
+        site_packages_path = os.path.join(
+            env_path, "lib", f"python{'.'.join(pyver.split('.')[:2])}", "site-packages"
+        )
+    if last_transaction_time := history_info["last_transaction_time"]:
+        t1 = time.mktime(time.strptime(last_transaction_time, "%Y-%m-%d %H:%M:%S"))
+    else:
+        meta_history_path = os.path.join(env_path, "conda-meta", "history")
+        t1 = os.path.getmtime(meta_history_path) if os.path.exists(meta_history_path) else 0
+    t2 = os.path.getmtime(site_packages_path) if os.path.exists(site_packages_path) else 0
+
+    if max(t1, t2) == 0:
+        return "Unknown"
+    return time.strftime("%Y-%m-%d", time.localtime(max(t1, t2)))
+
+
+def _get_env_installation_date(history_info: dict[str, Any]) -> str:
+    """获取环境的安装日期。
+
+    Args:
+        history_info (dict): 该环境由 get_conda_history_infos 得到的 history 信息。
+
+    Returns:
+        str: 格式化的日期字符串 "%Y-%m-%d" 或 "Unknown"
+    """
+    if install_time := history_info["install_time"]:
+        return install_time.split()[0]
+    return "Unknown"
+
+
+def _parse_condarc_file(condarc_path: str) -> Union[dict[str, Union[str, list[str], None]], None]:
+    """解析 .condarc 文件的顶层配置项（支持标量、块格式列表与行内格式列表）。
+
+    Returns:
+        dict | None: 配置项字典，值为 str 或 list[str]；无法确定解析结果的值 (如嵌套映射) 为 None。
+            若文件无法读取或解码则返回 None。
+    """
+    try:
+        with open(condarc_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    config: dict[str, Union[str, list[str], None]] = {}
+    key_pattern = re.compile(r"^([A-Za-z_][\w-]*)\s*:(?:\s+(.*?))?\s*$")
+    for idx, line in enumerate(lines):
+        if not (match := key_pattern.match(line)):
+            continue
+        key, value = match[1], re.sub(r"(?:^|\s+)#.*$", "", match[2] or "")
+        if value.startswith("[") and value.endswith("]"):
+            config[key] = [i.strip().strip("'\"") for i in value[1:-1].split(",") if i.strip()]
+        elif value.startswith("{"):
+            config[key] = None
+        elif value:
+            config[key] = value.strip("'\"")
+        else:
+            values: Union[list[str], None] = []
+            for next_line in lines[idx + 1 :]:
+                if not next_line.strip() or next_line.lstrip().startswith("#"):
+                    continue
+                if item_match := re.match(r"^\s*-\s+(.+?)\s*(?:\s#.*)?$", next_line):
+                    values.append(item_match[1].strip("'\""))  # type: ignore
+                elif next_line[0] in (" ", "\t"):
+                    values = None  # 嵌套映射等，无法确定 conda 的解析结果
+                    break
+                else:
+                    break
+            config[key] = values
+    return config
+
+
+def _get_condarc_paths(env_path: Union[str, None] = None) -> list[str]:
+    """按照 conda 的搜索路径 (由低到高的优先级) 返回所有存在的 .condarc 配置文件路径。
+
+    Args:
+        env_path (str, optional): 环境路径，其下的 .condarc 按激活该环境时的规则加载，默认为 $CONDA_PREFIX。
+    """
+    if os.name == "nt":
+        search_dirs = ["C:/ProgramData/conda"]
+    else:  # os.name == "posix":
+        search_dirs = ["/etc/conda", "/var/lib/conda"]
+    search_dirs.append(CONDA_HOME)
+    if "XDG_CONFIG_HOME" in os.environ:
+        search_dirs.append(os.path.join(os.environ["XDG_CONFIG_HOME"], "conda"))
+    search_dirs.extend([os.path.join(USER_HOME, ".config", "conda"), os.path.join(USER_HOME, ".conda")])
+    if env_path := env_path or os.environ.get("CONDA_PREFIX"):
+        search_dirs.append(env_path)
+
+    def is_condarc_file(path: str):
+        return os.path.basename(path) in (".condarc", "condarc") or path.endswith((".yml", ".yaml"))
+
+    condarc_paths = []
+    for search_dir in search_dirs:
+        condarc_paths.extend([os.path.join(search_dir, ".condarc"), os.path.join(search_dir, "condarc")])
+        if os.path.isdir(condarc_d := os.path.join(search_dir, "condarc.d")):
+            condarc_paths.extend(
+                sorted(entry.path for entry in os.scandir(condarc_d) if is_condarc_file(entry.path))
+            )
+        if search_dir == os.path.join(USER_HOME, ".conda"):
+            condarc_paths.append(os.path.join(USER_HOME, ".condarc"))
+    if (condarc_env := os.environ.get("CONDARC")) and is_condarc_file(condarc_env):
+        condarc_paths.append(condarc_env)
+
+    return [path for path in ordered_unique(condarc_paths) if os.path.isfile(path)]
+
+
+class CondarcConfig(TypedDict):
+    condarc_paths: list[str]
+    solver: Union[str, None]
+    channel_priority: Union[str, None]
+    channels: list[str]
+    envs_dirs: Union[list[str], None]
+    pkgs_dirs: Union[list[str], None]
+
+
+_condarc_config_cache: dict[tuple, CondarcConfig] = {}
+
+
+def load_condarc(env_path: Union[str, None] = None) -> CondarcConfig:
+    """按 conda 的优先级顺序 (系统 -> 用户 -> 环境 -> $CONDARC -> 环境变量) 合并所有 .condarc 配置。
+
+    Args:
+        env_path (str, optional): 同 _get_condarc_paths()。
+
+    Returns:
+        CondarcConfig: 合并后的配置，其中：
+            - 标量 (solver, channel_priority) 取优先级最高的定义，未定义则为 None；
+            - 列表 (channels, envs_dirs, pkgs_dirs) 按优先级由高到低合并去重；envs_dirs 与 pkgs_dirs 若存在无法
+              读取的配置文件，或在某个配置文件中无法解析 (如值不是列表) 则为 None (仅包含配置的值，不含 conda 的
+              默认目录)。
+
+    Note:
+        结果按各配置文件的路径与修改时间及相关环境变量缓存，故配置未变化时不会重复读取文件。
+    """
+    condarc_paths = _get_condarc_paths(env_path)
+    env_vars = ("CONDA_SOLVER", "CONDA_EXPERIMENTAL_SOLVER", "CONDA_CHANNEL_PRIORITY", "CONDA_ENVS_DIRS")
+    env_vars += ("CONDA_ENVS_PATH", "CONDA_PKGS_DIRS")
+    cache_key = (
+        tuple((path, os.path.getmtime(path)) for path in condarc_paths),
+        tuple(os.environ.get(env_var) for env_var in env_vars),
+    )
+    if (config := _condarc_config_cache.get(cache_key)) is not None:
+        return config
+
+    layers = [_parse_condarc_file(path) for path in condarc_paths[::-1]]
+
+    def get_scalar(keys: Iterable[str]) -> Union[str, None]:
+        for key in keys:
+            if value := os.environ.get(f"CONDA_{key.upper()}"):
+                return value
+        for layer in layers:
+            if layer is None:
+                continue
+            for key in keys:
+                if isinstance(value := layer.get(key), str):
+                    return value
+        return None
+
+    def get_list(keys: Iterable[str], env_vars: Iterable[str] = ()) -> Union[list[str], None]:
+        values = []
+        for env_var in env_vars:
+            if os.environ.get(env_var):
+                values.extend(i for i in os.environ[env_var].split(os.pathsep) if i)
+        for layer in layers:
+            if layer is None:
+                return None  # 存在无法读取的配置文件，无法确定合并结果
+            for key in keys:
+                if key not in layer:
+                    continue
+                if not isinstance(value := layer[key], list):
+                    return None
+                values.extend(value)
+        return ordered_unique(values)
+
+    config = {
+        "condarc_paths": condarc_paths,
+        "solver": get_scalar(("solver", "experimental_solver")),
+        "channel_priority": get_scalar(("channel_priority",)),
+        "channels": get_list(("channels",)) or [],
+        "envs_dirs": get_list(("envs_dirs", "envs_path"), ("CONDA_ENVS_DIRS", "CONDA_ENVS_PATH")),
+        "pkgs_dirs": get_list(("pkgs_dirs",), ("CONDA_PKGS_DIRS",)),
+    }
+    _condarc_config_cache.clear()
+    _condarc_config_cache[cache_key] = config  # type: ignore
+    return config  # type: ignore
+
+
+def _get_conda_envs_dirs() -> Union[list[str], None]:
+    """按照 conda 的规则获取 envs_dirs 列表（.condarc 与环境变量中的设置 + 默认的环境目录）。
+
+    Returns:
+        list[str] | None: 去重的 envs_dirs 列表；若存在无法解析的 envs_dirs 配置则返回 None。
+    """
+    if (envs_dirs := load_condarc()["envs_dirs"]) is None:
+        return None
+    envs_dirs = list(envs_dirs)
+
+    user_envs_dir = os.path.join(USER_HOME, ".conda", "envs")
+    if os.access(CONDA_HOME, os.W_OK):
+        envs_dirs.extend([os.path.join(CONDA_HOME, "envs"), user_envs_dir])
+    else:
+        envs_dirs.extend([user_envs_dir, os.path.join(CONDA_HOME, "envs")])
+
+    return ordered_unique([os.path.normpath(os.path.expandvars(os.path.expanduser(i))) for i in envs_dirs])
 
-    envs_size_data = {"env_sizes": name_sizes_dict, "disk_usage": disk_usage, "calc_cost_time": calc_cost_time}
-    data_manager.update_data("envs_size_data", envs_size_data)
 
-    clear_lines_above(1)
+def _get_conda_pkgs_dirs() -> list[str]:
+    """按照 conda 的规则获取 pkgs_dirs 列表（.condarc 与环境变量中的设置 + 默认的包缓存目录）。
 
-    return name_sizes_dict, disk_usage
+    Returns:
+        list[str]: 去重的 pkgs_dirs 列表 (不检查是否存在)；若 pkgs_dirs 配置无法解析，则只含默认的包缓存目录。
+    """
+    pkgs_dirs = list(load_condarc()["pkgs_dirs"] or [])
 
+    user_pkgs_dir = os.path.join(USER_HOME, ".conda", "pkgs")
+    if os.access(CONDA_HOME, os.W_OK):
+        pkgs_dirs.extend([os.path.join(CONDA_HOME, "pkgs"), user_pkgs_dir])
+    else:
+        pkgs_dirs.extend([user_pkgs_dir, os.path.join(CONDA_HOME, "pkgs")])
 
-def _get_env_last_updated_date(env_path: str, pyver: str) -> str:
-    """通过检查 conda 及 pip 的安装行为，获取环境的最后更新日期。
+    return ordered_unique([os.path.normpath(os.path.expandvars(os.path.expanduser(i))) for i in pkgs_dirs])
 
-    Returns:
-        str: 格式化的日期字符串 "%Y-%m-%d" 或 "Unknown"
 
-    Note:
-        用于 env_lastmodified_timelist
-    """
-    meta_history_path = os.path.join(env_path, "conda-meta", "history")
+def _is_admin() -> bool:
+    """判断当前用户是否为管理员（与 conda 的判断逻辑一致）。"""
     if os.name == "nt":
-        site_packages_path = os.path.join(env_path, "Lib", "site-packages")
+        try:
+            return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        except Exception:
+            return False
     else:  # os.name == "posix":
-        site_packages_path = os.path.join(
-            env_path, "lib", f"python{'.'.join(pyver.split('.')[:2])}", "site-packages"
-        )
-    t1 = os.path.getmtime(meta_history_path) if os.path.exists(meta_history_path) else 0
-    t2 = os.path.getmtime(site_packages_path) if os.path.exists(site_packages_path) else 0
-
-    if max(t1, t2) == 0:
-        return "Unknown"
-    return time.strftime("%Y-%m-%d", time.localtime(max(t1, t2)))
+        return os.geteuid() == 0 or os.getegid() == 0
 
 
-def _get_env_installation_date(env_path: str) -> str:
-    """获取环境的安装日期。
+def _list_conda_envs_native() -> Union[list[tuple[Union[str, None], str]], None]:
+    """不调用 conda 子进程，直接读取 environments.txt 与 envs_dirs 以列出所有已知的 conda 环境。
 
     Returns:
-        str: 格式化的日期字符串 "%Y-%m-%d" 或 "Unknown"
+        list[tuple[str | None, str]] | None: 与 `conda env list` 输出一致的 (环境名, 环境路径) 列表，
+            无名环境的环境名为 None；若相关文件无法读取或相互矛盾，则返回 None 以回退到子进程。
     """
-    meta_history_path = os.path.join(env_path, "conda-meta", "history")
-    if os.path.exists(meta_history_path):
-        with open(meta_history_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            for line in lines:
-                if line.startswith("==>"):
-                    if match := re.search(r"\d{4}-\d{2}-\d{2}", line):
-                        return match.group(0)
-    return "Unknown"
+    if (envs_dirs := _get_conda_envs_dirs()) is None:
+        return None
+    envs_dirs_normcase = {os.path.normcase(i) for i in envs_dirs}
+
+    if _is_admin():
+        if os.name == "nt":
+            user_homes = [entry.path for entry in os.scandir(os.path.dirname(USER_HOME)) if entry.is_dir()]
+        else:  # os.name == "posix":
+            import pwd
+
+            user_homes = [pw.pw_dir for pw in pwd.getpwall()] or [USER_HOME]
+    else:
+        user_homes = [USER_HOME]
+
+    env_paths = set()
+    for user_home in ordered_unique(user_homes):
+        environments_txt_path = os.path.join(user_home, ".conda", "environments.txt")
+        if not os.path.isfile(environments_txt_path):
+            continue
+        try:
+            with open(environments_txt_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            if user_home == USER_HOME:
+                return None
+            continue  # 与 conda 一致，忽略其他用户的无权限文件
+        for line in lines:
+            if (path := line.strip()) and is_valid_env(path):
+                env_paths.add(os.path.normpath(path))
+
+    for envs_dir in envs_dirs:
+        if os.path.isdir(envs_dir):
+            with os.scandir(envs_dir) as entries:
+                env_paths.update(entry.path for entry in entries if is_valid_env(entry.path))
+    env_paths.add(os.path.normpath(CONDA_HOME))
+
+    envs = []
+    for env_path in sorted(env_paths):
+        envs_dir, env_name = os.path.split(env_path)
+        if os.path.normcase(env_path) == os.path.normcase(CONDA_HOME):
+            envs.append(("base", env_path))
+        elif os.path.normcase(envs_dir) in envs_dirs_normcase:
+            envs.append((env_name, env_path))
+        elif os.path.basename(envs_dir) == "envs" and not is_valid_env(os.path.dirname(envs_dir)):
+            return None  # 位于非发行版的 envs 目录下，可能由未读取到的配置命名，交由 conda 判断
+        else:
+            envs.append((None, env_path))
+
+    return envs
+
+
+def _list_conda_envs_subprocess() -> list[tuple[Union[str, None], str]]:
+    """通过 `conda env list` 子进程列出所有已知的 conda 环境，返回值同 _list_conda_envs_native。"""
+    env_output = subprocess.check_output([CONDA_EXE_PATH, "env", "list"], text=True)
+
+    envs = []
+    for line in env_output.splitlines()[2:]:
+        items = line.split()
+        if len(items) == 0 or items[0] == "#":
+            continue
+        elif len(items) == 1 or items[0] == "*":
+            envs.append((None, items[-1]))
+        else:
+            envs.append((items[0], items[-1]))
+
+    return envs
 
 
 def _get_env_basic_infos():
@@ -1081,6 +4045,7 @@ def _get_env_basic_infos():
         2. 失效的环境为 CONDA_HOME/envs 和 .condarc 文件定义的 envs_dirs (但必须以 envs 结尾) 中的
            不包含 conda-meta/history 的目录；
         3. env_...list 的内容组成：CONDA_HOME/envs 下的环境 + (可能的)其它受支持的环境 + (可能的)已经失效的环境；
+        4. 环境列表优先由 _list_conda_envs_native 直接读取得到，仅在其失败时才调用 `conda env list` 子进程。
     """
     env_namelist = []
     env_pathlist = []
@@ -1094,25 +4059,18 @@ def _get_env_basic_infos():
     if os.path.exists(os.path.join(CONDA_HOME, "envs")):
         conda_env_homes.append(os.path.join(CONDA_HOME, "envs"))
 
-    env_output = subprocess.check_output([CONDA_EXE_PATH, "env", "list"], text=True)
-    env_list_lines = env_output.splitlines()[2:]
+    if (envs := _list_conda_envs_native()) is None:
+        envs = _list_conda_envs_subprocess()
 
-    for line in env_list_lines:
-        items = line.split()
-        if len(items) == 0:
-            continue
-        elif len(items) == 1:
-            others_env_pathlist.append(items[0])
-        else:
-            if items[0] != "*":
-                if items[-1].startswith(CONDA_HOME):
-                    env_namelist.append(items[0])
-                    env_pathlist.append(items[-1])
-                else:  # 不独属于当前发行版的envs，位于公共区域，但仍能够受此发行版的正常管辖
-                    env_namelist_users.append(items[0])
-                    env_pathlist_users.append(items[-1])
-            else:
-                others_env_pathlist.append(items[-1])
+    for env_name, env_path in envs:
+        if env_name is None:
+            others_env_pathlist.append(env_path)
+        elif env_path.startswith(CONDA_HOME):
+            env_namelist.append(env_name)
+            env_pathlist.append(env_path)
+        else:  # 不独属于当前发行版的envs，位于公共区域，但仍能够受此发行版的正常管辖
+            env_namelist_users.append(env_name)
+            env_pathlist_users.append(env_path)
 
     conda_env_homes.extend(
         ordered_unique(
@@ -1146,12 +4104,39 @@ class EnvInfosDict(TypedDict):
     env_pyverlist: list[str]
     env_realusage_list: list[int]
     env_totalsize_list: list[int]
+    env_sharing_list: list[list[int]]
+    env_size_ci_list: list[Union[list[int], None]]
     others_env_pathlist: list[str]
     env_validity_list: list[bool]
 
 
-def get_env_infos() -> EnvInfosDict:
-    """获取 Conda 环境的所有基本信息组成的字典类 EnvInfosDict。
+def _get_env_size_lists(
+    env_namelist: list[str], name_sizes_dict: dict[str, dict[str, Any]]
+) -> tuple[list[int], list[int], list[list[int]], list[Union[list[int], None]], int]:
+    """由 get_home_sizes 格式的 name_sizes_dict 获取 EnvInfosDict 中的 (env_realusage_list, env_totalsize_list,
+    env_sharing_list, env_size_ci_list, total_apparent_size)，有环境尚未统计完成时 total_apparent_size 为 -1；
+    env_size_ci_list 中估计值的环境为其置信区间半宽 [实际磁盘占用, 表观大小]，精确值的环境为 None。"""
+    env_realusage_list = [name_sizes_dict[i]["real_usage"] for i in env_namelist]
+    env_totalsize_list = [name_sizes_dict[i]["total_size"] for i in env_namelist]
+    env_sharing_list = [
+        [name_sizes_dict[i]["exclusive"], name_sizes_dict[i]["shared_pkgs"], name_sizes_dict[i]["shared_envs"]]
+        for i in env_namelist
+    ]
+    env_size_ci_list = [name_sizes_dict[i].get("estimate_ci") for i in env_namelist]
+    total_apparent_size = -1 if -1 in env_totalsize_list else sum(env_totalsize_list)
+    return env_realusage_list, env_totalsize_list, env_sharing_list, env_size_ci_list, total_apparent_size
+
+
+def get_env_infos(quiet: bool = False) -> EnvInfosDict:
+    """获取 Conda 环境的所有基本信息组成的字典类 EnvInfosDict，并将其保存以供下次启动时立即显示。
+
+    Args:
+        quiet (bool): 是否不输出任何提示信息与进度条（用于在后台线程中调用），默认为 False。
+
+    Note:
+        各环境的 Python 版本与日期信息按环境指纹 (见 _get_env_fingerprint) 缓存，仅在指纹变化时重新获取；
+        环境大小则由 get_home_sizes 按 conda-meta、site-packages 及 pkgs 的修改时间决定是否重新计算。
+        因此在执行只读操作后重新获取环境信息几乎没有开销。
 
     Attention:
         * * * * * 注意 * * * * *
@@ -1160,21 +4145,42 @@ def get_env_infos() -> EnvInfosDict:
     env_namelist, env_pathlist, env_validity_list, others_env_pathlist = _get_env_basic_infos()
     env_num = len(env_namelist)
     valid_env_num = sum(env_validity_list)
-    # 获取所有环境的Python版本并存入env_pyverlist
-    _env_pypathlist = [
-        os.path.join(i, "python.exe") if os.name == "nt" else os.path.join(i, "bin", "python")
-        for i in env_pathlist
-    ]
-    env_pyverlist = [i if i else "-" for i in get_pyvers_from_paths(_env_pypathlist)]
-    env_lastmodified_timelist = [
-        _get_env_last_updated_date(path, pyver) for path, pyver in zip(env_pathlist, env_pyverlist)
-    ]
-    env_installation_time_list = [_get_env_installation_date(path) for path in env_pathlist]
 
-    name_sizes_dict, disk_usage = get_home_sizes(env_namelist, env_pathlist, env_pyverlist)
-    env_realusage_list = [name_sizes_dict[i]["real_usage"] for i in env_namelist]
-    env_totalsize_list = [name_sizes_dict[i]["total_size"] for i in env_namelist]
-    total_apparent_size = sum(env_totalsize_list)
+    # 仅对指纹有变化的环境重新获取 Python 版本、最后更新日期与安装日期
+    last_env_fingerprints = data_manager.get_data("env_fingerprints_data")
+    env_fingerprints = {}
+    changed_env_pathlist = []
+    for env_path in env_pathlist:
+        fingerprint = _get_env_fingerprint(env_path)
+        if (last_record := last_env_fingerprints.get(env_path)) and last_record["fingerprint"] == fingerprint:
+            env_fingerprints[env_path] = last_record
+        else:
+            env_fingerprints[env_path] = {"fingerprint": fingerprint}
+            changed_env_pathlist.append(env_path)
+    if changed_env_pathlist:
+        history_infos = get_conda_history_infos(changed_env_pathlist)  # 一次性增量解析各环境的 history 并保存
+        _env_pypathlist = [
+            os.path.join(i, "python.exe") if os.name == "nt" else os.path.join(i, "bin", "python")
+            for i in changed_env_pathlist
+        ]
+        for env_path, pyver, history_info in zip(
+            changed_env_pathlist, get_pyvers_from_paths(_env_pypathlist), history_infos
+        ):
+            pyver = pyver if pyver else "-"
+            env_fingerprints[env_path]["pyver"] = pyver
+            env_fingerprints[env_path]["last_updated"] = _get_env_last_updated_date(env_path, pyver, history_info)
+            env_fingerprints[env_path]["installation_time"] = _get_env_installation_date(history_info)
+    if env_fingerprints != last_env_fingerprints:
+        data_manager.update_data("env_fingerprints_data", env_fingerprints)
+
+    env_pyverlist = [env_fingerprints[path]["pyver"] for path in env_pathlist]
+    env_lastmodified_timelist = [env_fingerprints[path]["last_updated"] for path in env_pathlist]
+    env_installation_time_list = [env_fingerprints[path]["installation_time"] for path in env_pathlist]
+
+    name_sizes_dict, disk_usage = get_home_sizes(env_namelist, env_pathlist, env_pyverlist, quiet)
+    env_realusage_list, env_totalsize_list, env_sharing_list, env_size_ci_list, total_apparent_size = (
+        _get_env_size_lists(env_namelist, name_sizes_dict)
+    )
 
     env_infos_dict: EnvInfosDict = {
         "env_num": env_num,  # int
@@ -1188,13 +4194,45 @@ def get_env_infos() -> EnvInfosDict:
         "env_pyverlist": env_pyverlist,  # list[str]
         "env_realusage_list": env_realusage_list,  # list[int]
         "env_totalsize_list": env_totalsize_list,  # list[int]
+        "env_sharing_list": env_sharing_list,  # list[list[int]]
+        "env_size_ci_list": env_size_ci_list,  # list[list[int] | None]
         "others_env_pathlist": others_env_pathlist,  # list[str]
         "env_validity_list": env_validity_list,  # list[bool]
     }
+    data_manager.update_data("env_infos_data", dict(env_infos_dict))
 
     return env_infos_dict
 
 
+def get_last_env_infos() -> Union[EnvInfosDict, None]:
+    """获取上次保存的环境信息字典，若不存在或与当前的 EnvInfosDict 格式不符则返回 None。"""
+    last_env_infos = data_manager.get_data("env_infos_data")
+    if not last_env_infos or set(last_env_infos) != set(EnvInfosDict.__annotations__):
+        return None
+    return last_env_infos  # type: ignore
+
+
+class EnvInfosRefresher(Thread):
+    """在后台重新获取环境信息的线程类，使启动时可以先显示上次保存的环境表格，而无需等待。"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.env_infos_dict: Union[EnvInfosDict, None] = None
+
+    def run(self):
+        try:
+            self.env_infos_dict = get_env_infos(quiet=True)
+        except Exception:
+            self.env_infos_dict = None
+
+    def get_env_infos(self) -> EnvInfosDict:
+        """等待后台刷新完成并返回最新的环境信息；若后台刷新失败，则在当前线程中重新获取。"""
+        self.join()
+        if self.env_infos_dict is None:
+            return get_env_infos()
+        return self.env_infos_dict
+
+
 def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
     """获取环境信息的 PrettyTable 表格对象。
 
@@ -1211,6 +4249,9 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
     env_pyverlist = env_infos_dict["env_pyverlist"]
     env_realusage_list = env_infos_dict["env_realusage_list"]
     env_totalsize_list = env_infos_dict["env_totalsize_list"]
+    env_sharing_list = env_infos_dict["env_sharing_list"]
+    env_size_ci_list = env_infos_dict["env_size_ci_list"]
+    show_sharing = main_display_mode == 3 and any(any(sharing) for sharing in env_sharing_list)
 
     _max_name_length = max((len_to_print(i) for i in env_namelist), default=0)
     _max_name_length = max(_max_name_length, len("Env Name") + 7)  # 让length过短时也能正常显示
@@ -1229,6 +4270,8 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
 
     fieldstr_Usage = ("+Usage" if main_display_mode == 3 else "+  Usage") + " " * 2 + "(%)"
     fieldstr_Size = "Size" + " " * 2 + "(%)"
+    fieldstr_Exclusive = "Excl."
+    fieldstr_Shared = "Shared pkgs/envs"
 
     field_names = [
         fieldstr_Number,
@@ -1241,6 +4284,8 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
         field_names.append(fieldstr_Size)
     else:
         field_names.extend([fieldstr_Usage, fieldstr_Size])
+    if show_sharing:
+        field_names.extend([fieldstr_Exclusive, fieldstr_Shared])
 
     table.field_names = field_names
     table.align = "l"
@@ -1249,6 +4294,9 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
         table.align[fieldstr_Usage] = "r"  # type: ignore
     if fieldstr_Size in table.field_names:
         table.align[fieldstr_Size] = "r"  # type: ignore
+    if show_sharing:
+        table.align[fieldstr_Exclusive] = "r"  # type: ignore
+        table.align[fieldstr_Shared] = "c"  # type: ignore
     table.border = False
     table.padding_width = 1
     # table.hrules = HEADER
@@ -1260,19 +4308,20 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
         except:
             return pyver
 
-    def _format_size_info(size: int, total_size: int):
+    def _format_size_info(size: int, total_size: int, is_estimated: bool = False):
+        # 大小为 -1 表示正在后台统计；总大小为 -1 表示尚有环境未统计完，暂不显示百分比；估计值标记为 “≈”
+        percentage_str = f"{size/total_size*100:>2.0f}" if total_size > 0 else f"{'…':>2}"
+        approx_mark = "≈" if is_estimated else ""
         if main_display_mode == 3:
-            return (
-                f"{format_size(size,sig_digits=2,B_suffix=False):>5} ({size/total_size*100:>2.0f})"
-                if size > 0
-                else f"{'-':^10}"
-            )
+            if size < 0:
+                return f"{'…':^10}"
+            size_str = approx_mark + format_size(size, sig_digits=2, B_suffix=False)
+            return f"{size_str:>5} ({percentage_str})" if size > 0 else f"{'-':^10}"
         else:
-            return (
-                f"{format_size(size,B_suffix=False):>6} ({size/total_size*100:>2.0f})"
-                if size > 0
-                else f"{'-':^11}"
-            )
+            if size < 0:
+                return f"{'…':^11}"
+            size_str = approx_mark + format_size(size, B_suffix=False)
+            return f"{size_str:>6} ({percentage_str})" if size > 0 else f"{'-':^11}"
 
     for i in range(env_num):
         boundarys = ["", ""] if valid_env_num > 9 else ["[", "]"]
@@ -1286,31 +4335,49 @@ def get_envs_prettytable(env_infos_dict: EnvInfosDict) -> PrettyTable:
             row.extend(
                 [
                     f"{env_lastmodified_timelist[i]}",
-                    "+ " + _format_size_info(env_realusage_list[i], disk_usage),
+                    "+ " + _format_size_info(env_realusage_list[i], disk_usage, env_size_ci_list[i] is not None),
                 ]
             )
         elif main_display_mode == 2:
             row.extend(
                 [
                     f"{env_installation_time_list[i]}",
-                    _format_size_info(env_totalsize_list[i], total_apparent_size),
+                    _format_size_info(env_totalsize_list[i], total_apparent_size, env_size_ci_list[i] is not None),
                 ]
             )
         else:
             row.extend(
                 [
                     f"{env_lastmodified_timelist[i]:^10} / {env_installation_time_list[i]:^10}",
-                    "+" + _format_size_info(env_realusage_list[i], disk_usage),
-                    _format_size_info(env_totalsize_list[i], total_apparent_size),
+                    "+" + _format_size_info(env_realusage_list[i], disk_usage, env_size_ci_list[i] is not None),
+                    _format_size_info(env_totalsize_list[i], total_apparent_size, env_size_ci_list[i] is not None),
                 ]
             )
+        if show_sharing:
+            row.extend(_format_sharing_info(env_sharing_list[i]))
         table.add_row(row)
 
     return table
 
 
-def _print_header(table_rstrip_width: int, env_infos_dict: EnvInfosDict):
-    """打印主界面的标题信息。"""
+def _format_sharing_info(sharing: list[int]) -> list[str]:
+    """将环境的 [独占, 仅与 pkgs 共享, 与其他环境共享] 磁盘占用格式化为 [Excl., Shared pkgs/envs] 两列。"""
+
+    def _format(size: int):
+        return f"{format_size(size, sig_digits=2, B_suffix=False):>5}" if size > 0 else f"{'-':^5}"
+
+    exclusive, shared_pkgs, shared_envs = sharing
+    return [_format(exclusive), f"{_format(shared_pkgs)} / {_format(shared_envs)}"]
+
+
+def _get_header_line(table_rstrip_width: int, env_infos_dict: EnvInfosDict, is_refreshing: bool = False) -> str:
+    """获取主界面的标题信息行。
+
+    Args:
+        table_rstrip_width (int): 环境表格去除右侧空白后的宽度，用于右对齐大小信息。
+        env_infos_dict (dict): 环境信息字典。
+        is_refreshing (bool): 环境信息是否为正在后台刷新的旧数据，若是则添加提示标记，默认为 False。
+    """
 
     def _get_header_str():
         header_str = " ("
@@ -1349,20 +4416,37 @@ def _print_header(table_rstrip_width: int, env_infos_dict: EnvInfosDict):
         return header_str
 
     print_str = "# " + BOLD(os.path.split(CONDA_HOME)[1].capitalize()) + _get_header_str()
+
+    def _format_total_size(size: int, ci_idx: int):
+        if size < 0:
+            return "…"
+        # 含估计值时标记为 “≈”，并显示由各环境的置信区间合成的总置信区间
+        cis = [ci[ci_idx] for ci in env_infos_dict["env_size_ci_list"] if ci is not None]
+        if not cis:
+            return format_size(size)
+        return f"≈{format_size(size)} ±{sum(ci**2 for ci in cis) ** 0.5 / size if size else 0:.0%}"
+
     print_sizeinfo = (
-        BOLD(f"[Apparent Size: {format_size(env_infos_dict['total_apparent_size'])}]")
+        BOLD(f"[Apparent Size: {_format_total_size(env_infos_dict['total_apparent_size'], 1)}]")
         if main_display_mode == 2
-        else BOLD(f"[Disk Usage: {format_size(env_infos_dict['disk_usage'])}]")
+        else BOLD(f"[Disk Usage: {_format_total_size(env_infos_dict['disk_usage'], 0)}]")
     )
-    print(
+    if is_refreshing:
+        print_sizeinfo = DIM(LIGHT_YELLOW("(刷新中...) ")) + print_sizeinfo
+    return (
         print_str
         + " " * (table_rstrip_width - len_to_print(print_str) - len_to_print(print_sizeinfo))
         + print_sizeinfo
     )
 
 
-def _print_envs_table(table: PrettyTable, env_infos_dict: EnvInfosDict):
-    """打印环境表格。"""
+def _print_header(table_rstrip_width: int, env_infos_dict: EnvInfosDict):
+    """打印主界面的标题信息。"""
+    print(_get_header_line(table_rstrip_width, env_infos_dict))
+
+
+def _get_envs_table_lines(table: PrettyTable, env_infos_dict: EnvInfosDict) -> list[str]:
+    """获取环境表格待打印的所有行（含着色与分隔行）。"""
 
     def colorstr_interval(s, i):
         return LIGHT_YELLOW(s) if i % 2 == 0 else LIGHT_CYAN(s)
@@ -1371,27 +4455,35 @@ def _print_envs_table(table: PrettyTable, env_infos_dict: EnvInfosDict):
     env_pathlist = env_infos_dict["env_pathlist"]
     env_validity_list = env_infos_dict["env_validity_list"]
 
+    lines = []
     last_envpath_prefix = ""
     passed_first_invalid_env = False
     for i, line in enumerate(table.get_string().splitlines()):
         if i == 0:
-            print(BOLD(line))
+            lines.append(BOLD(line))
             continue
 
         if not env_validity_list[i - 1] and not passed_first_invalid_env:
-            print(LIGHT_RED((DIM(f"{' * Invalid * ':-^{table_width}}"))))
+            lines.append(LIGHT_RED((DIM(f"{' * Invalid * ':-^{table_width}}"))))
             passed_first_invalid_env = True
         if not env_pathlist[i - 1].startswith(CONDA_HOME) and not passed_first_invalid_env:
             envpath_prefix = os.path.split(env_pathlist[i - 1])[0]
             if envpath_prefix != last_envpath_prefix:
                 last_envpath_prefix = envpath_prefix
                 prompt_str = f" {replace_user_path(envpath_prefix)} "
-                print(DIM(f"{prompt_str:-^{table_width}}"))
+                lines.append(DIM(f"{prompt_str:-^{table_width}}"))
 
         if env_validity_list[i - 1]:
-            print(colorstr_interval(line, i))
+            lines.append(colorstr_interval(line, i))
         else:
-            print(LIGHT_RED(line))
+            lines.append(LIGHT_RED(line))
+
+    return lines
+
+
+def _print_envs_table(table: PrettyTable, env_infos_dict: EnvInfosDict):
+    """打印环境表格。"""
+    print("\n".join(_get_envs_table_lines(table, env_infos_dict)))
 
 
 def _print_other_envs(others_env_pathlist: list[str]):
@@ -1434,19 +4526,13 @@ def _get_main_prompt_str(valid_env_num: int) -> str:
 
     main_prompt_str += f"""
   - 删除环境按{BOLD(RED("[-]"))};新建环境按{BOLD(LIGHT_GREEN("[+]"))};重命名环境按{BOLD(LIGHT_BLUE("[R]"))};复制环境按{BOLD(LIGHT_CYAN("[P]"))};
-  - 显示并回退至环境的历史版本按{BOLD(LIGHT_MAGENTA("[V]"))};
+  - 显示并回退至环境的历史版本按{BOLD(LIGHT_MAGENTA("[V]"))};查看环境中各包的大小排行按{BOLD(LIGHT_CYAN("[T]"))};
   - 更新环境的所有 Conda 包按{BOLD(GREEN("[U]"))};
   - 查看及清空 Conda/pip 缓存按{BOLD(LIGHT_RED("[C]"))};
   - 注册 Jupyter 内核按{BOLD(CYAN("[I]"))};显示、管理及清理 Jupyter 内核按{BOLD(LIGHT_BLUE("[J]"))};
   - 检查环境完整性并显示健康报告按{BOLD(LIGHT_GREEN("[H]"))};
   - 搜索 Conda 软件包按{BOLD(LIGHT_YELLOW("[S]"))};"""
 
-    # a. Extras
-    if env_size_recalc_need_confirm:
-        calc_cost_time = data_manager.get_data("envs_size_data").get("calc_cost_time", 0)
-        cost_prompt = f"(约 {calc_cost_time:.0f} 秒)" if calc_cost_time > 0 else ""
-        main_prompt_str += f"\n  * {cost_prompt} 统计环境大小及磁盘占用情况按{BOLD(LIGHT_GREEN('[D]'))};"
-
     main_prompt_str += "\n"
 
     return main_prompt_str
@@ -1547,21 +4633,32 @@ def _prompt_and_validate_command(allowed_inputs: list[str], immediately_returned
     return inp
 
 
-def show_info_and_get_input(env_infos_dict: EnvInfosDict) -> str:
+def show_info_and_get_input(
+    env_infos_dict: EnvInfosDict, env_infos_refresher: Union["EnvInfosRefresher", None] = None
+) -> str:
     """显示主界面信息并获取用户的操作指令以供 do_action 函数执行相应操作。
 
+    Args:
+        env_infos_dict (EnvInfosDict): 环境信息字典。
+        env_infos_refresher (EnvInfosRefresher, optional): 若提供，则 env_infos_dict 被视为上次保存的旧信息，
+            先立即绘制并标记为“刷新中”，待后台刷新完成后原位更新 env_infos_dict，并仅重绘有变化的行。
+
+    Note:
+        若环境大小正在后台统计 (见 EnvSizeCalculator)，则在等待用户输入期间，每个环境统计完成时原位重绘表格中
+        有变化的行；用户输入完成后不再重绘。
+
     Attention:
         * * * * * 注意 * * * * *
         此函数是整个脚本的三个主函数其二，负责主循环中 “显示主界面信息和获取用户指令” 功能。
     """
     global main_display_mode
 
-    env_num = env_infos_dict["env_num"]
-    valid_env_num = env_infos_dict["valid_env_num"]
-    others_env_pathlist = env_infos_dict["others_env_pathlist"]
-
-    # 1.1 输出<可能的>其他发行版与不受支持的环境
-    _print_other_envs(others_env_pathlist)
+    def get_header_and_table_lines(is_refreshing=False) -> list[str]:
+        table = get_envs_prettytable(env_infos_dict)
+        table_rstrip_width = len_to_print(table.get_string().splitlines()[0].rstrip())
+        return [_get_header_line(table_rstrip_width, env_infos_dict, is_refreshing)] + _get_envs_table_lines(
+            table, env_infos_dict
+        )
 
     def printRegularTransactionSet(cls=False):
         table = get_envs_prettytable(env_infos_dict)
@@ -1574,16 +4671,79 @@ def show_info_and_get_input(env_infos_dict: EnvInfosDict) -> str:
         _print_envs_table(table, env_infos_dict)
 
         # 2. 输出主界面提示信息
-        main_prompt_str = _get_main_prompt_str(valid_env_num)
+        main_prompt_str = _get_main_prompt_str(env_infos_dict["valid_env_num"])
         print(main_prompt_str)
 
-    printRegularTransactionSet()
+    # 1.1 输出<可能的>其他发行版与不受支持的环境
+    _print_other_envs(env_infos_dict["others_env_pathlist"])
+
+    if env_infos_refresher is None:
+        printRegularTransactionSet()
+    else:
+        # 先绘制上次保存的旧信息，待后台刷新完成后仅重绘有变化的行
+        stale_others_env_pathlist = env_infos_dict["others_env_pathlist"]
+        stale_lines = get_header_and_table_lines(is_refreshing=True)
+        print("\n".join(stale_lines), flush=True)
+        env_infos_dict.update(env_infos_refresher.get_env_infos())
+        if env_infos_dict["others_env_pathlist"] == stale_others_env_pathlist and redraw_changed_lines(
+            stale_lines, get_header_and_table_lines()
+        ):
+            print(_get_main_prompt_str(env_infos_dict["valid_env_num"]))
+        else:
+            clear_screen(hard=CFG_FULL_TERMINAL_CLEAR)
+            _print_other_envs(env_infos_dict["others_env_pathlist"])
+            printRegularTransactionSet()
+
+    env_num = env_infos_dict["env_num"]
+    valid_env_num = env_infos_dict["valid_env_num"]
+
+    # 后台统计环境大小时，在等待输入期间原位填入统计结果；drawn_lines 为已绘制的抬头与表格行，None 表示停止重绘
+    drawn_lines: Union[list[str], None] = None
+    screen_lock = Lock()
+    size_calculator = env_size_calculator
+    if size_calculator is not None and size_calculator.pathlist != env_infos_dict["env_pathlist"]:
+        size_calculator = None
+
+    def start_live_sizes():
+        nonlocal drawn_lines
+        if size_calculator is not None and size_calculator.is_alive():
+            drawn_lines = get_header_and_table_lines()
+            size_calculator.on_update = update_live_sizes
+            update_live_sizes()  # 填入绘制期间已完成的部分
+
+    def update_live_sizes():
+        nonlocal drawn_lines
+        with screen_lock:
+            if drawn_lines is None:
+                return
+            name_sizes_dict, disk_usage = size_calculator.get_env_sizes()  # type: ignore
+            env_realusage_list, env_totalsize_list, env_sharing_list, env_size_ci_list, total_apparent_size = (
+                _get_env_size_lists(env_infos_dict["env_namelist"], name_sizes_dict)
+            )
+            env_infos_dict["disk_usage"] = disk_usage
+            env_infos_dict["total_apparent_size"] = total_apparent_size
+            env_infos_dict["env_realusage_list"] = env_realusage_list
+            env_infos_dict["env_totalsize_list"] = env_totalsize_list
+            env_infos_dict["env_sharing_list"] = env_sharing_list
+            env_infos_dict["env_size_ci_list"] = env_size_ci_list
+            new_lines = get_header_and_table_lines()
+            # 光标位于输入行，其与表格之间相隔主界面提示信息及 “请按下指令键...” 一行
+            lines_below = get_printed_line_count(_get_main_prompt_str(valid_env_num)) + 1
+            if redraw_changed_lines(drawn_lines, new_lines, lines_below=lines_below):
+                drawn_lines = new_lines
+
+    def stop_live_sizes():
+        nonlocal drawn_lines
+        with screen_lock:
+            drawn_lines = None
+            if size_calculator is not None:
+                size_calculator.on_update = None
+
+    start_live_sizes()
 
     # 3. 提示用户按下或输入对应指令
     _CYCLE_DISP = "\t"
-    allowed_commands = ["-", "_", "+", "=", "I", "R", "J", "C", "V", "U", "S", "Q", "P", "H", _CYCLE_DISP]
-    if env_size_recalc_need_confirm:
-        allowed_commands.append("D")
+    allowed_commands = ["-", "_", "+", "=", "I", "R", "J", "C", "V", "T", "U", "S", "Q", "P", "H", _CYCLE_DISP]
     allowed_commands += [char.lower() for char in allowed_commands if char.isupper()]
     allowed_inputs = [f"@{str(i)}" for i in range(1, env_num + 1)]
     valid_env_numbers = [str(i) for i in range(1, valid_env_num + 1)]
@@ -1595,9 +4755,12 @@ def show_info_and_get_input(env_infos_dict: EnvInfosDict) -> str:
     while True:  # 设置了immediately_returned_chars后，inp最多只能接受一行内的字符
         inp = _prompt_and_validate_command(allowed_inputs, allowed_commands)
         if inp == _CYCLE_DISP:
+            stop_live_sizes()
             main_display_mode = main_display_mode % 3 + 1
             printRegularTransactionSet(cls=True)
+            start_live_sizes()
         else:
+            stop_live_sizes()
             clear_lines_above(get_printed_line_count(_get_main_prompt_str(valid_env_num)))
             return inp
 
@@ -1627,25 +4790,39 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
     env_installation_time_list = env_infos_dict["env_installation_time_list"]
     env_pyverlist = env_infos_dict["env_pyverlist"]
     env_totalsize_list = env_infos_dict["env_totalsize_list"]
+    env_sharing_list = env_infos_dict["env_sharing_list"]
 
-    def _print_table(env_names: list[str], field_name_env="Env Name", body_color: ColorType = None) -> bool:
-        """验证 env_names 环境名称列表是否为空；若为空则返回 False；否则打印表格并返回 True。"""
+    def _print_table(
+        env_names: list[str], field_name_env="Env Name", body_color: ColorType = None, show_sharing: bool = False
+    ) -> bool:
+        """验证 env_names 环境名称列表是否为空；若为空则返回 False；否则打印表格并返回 True。
+
+        show_sharing 为 True 且已统计环境的共享情况时，额外显示独占 (即删除后可释放) 与共享的磁盘占用。
+        """
         if not env_names:
             print(LIGHT_RED("[错误] 未检测到有效的环境编号！"))
             return False
-        table = PrettyTable([field_name_env, "PyVer", "Last Updated/Installation"])
+        show_sharing = show_sharing and any(any(env_sharing_list[env_namelist.index(i)]) for i in env_names)
+        field_names = [field_name_env, "PyVer", "Last Updated/Installation"]
+        if show_sharing:
+            field_names.extend(["Excl.", "Shared pkgs/envs"])
+        table = PrettyTable(field_names)
         table.align = "l"
         table.border = False
+        if show_sharing:
+            table.align["Excl."] = "r"  # type: ignore
+            table.align["Shared pkgs/envs"] = "c"  # type: ignore
         for name in env_names:
-            table.add_row(
-                [
-                    name,
-                    env_pyverlist[env_namelist.index(name)],
-                    env_lastmodified_timelist[env_namelist.index(name)]
-                    + " / "
-                    + env_installation_time_list[env_namelist.index(name)],
-                ]
-            )
+            row = [
+                name,
+                env_pyverlist[env_namelist.index(name)],
+                env_lastmodified_timelist[env_namelist.index(name)]
+                + " / "
+                + env_installation_time_list[env_namelist.index(name)],
+            ]
+            if show_sharing:
+                row.extend(_format_sharing_info(env_sharing_list[env_namelist.index(name)]))
+            table.add_row(row)
         print(three_line_table(table, body_color=body_color))
         return True
 
@@ -1694,7 +4871,9 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
             env_delete_names = [
                 env_namelist[i] for i in env_delete_nums if env_namelist[i] not in illegal_env_namelist
             ]
-        if not _print_table(env_delete_names, field_name_env="Env to Delete", body_color="LIGHT_RED"):
+        if not _print_table(
+            env_delete_names, field_name_env="Env to Delete", body_color="LIGHT_RED", show_sharing=True
+        ):
             return
         print("(2) 确认删除以上环境吗？")
         inp = input_strip("[(Y)/n] >>> ")
@@ -1868,11 +5047,11 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
             jup_disp_name = input_strip(f"[{name}] >>> ")
             if jup_disp_name == "":
                 jup_disp_name = name
-            command = [CONDA_EXE_PATH, "list", "-n", name, "--json"]
-            result_text = subprocess.run(command, stdout=subprocess.PIPE, text=True).stdout
-
             _command = [f'conda activate "{name}"']
-            if result_text.find("ipykernel") == -1:
+            package_index = PackageIndex.of(env_pathlist[env_namelist.index(name)])
+            if "ipykernel" not in package_index and all(
+                record["name"] != "ipykernel" for record in package_index.get_pip_records()
+            ):
                 print(LIGHT_YELLOW("[提示] 该环境中未检测到 ipykernel 包，正在为环境安装 ipykernel 包..."))
                 _command.append("conda install ipykernel --no-update-deps --yes --quiet")
             _command.append(
@@ -2158,134 +5337,197 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
             )
             subprocess.run(command, shell=True)
 
+    # 如果按下的是[T]，则根据包的元数据显示环境中占用空间最大的包
+    elif inp.upper() == "T":
+        print(f"(1) 请输入想要查看{BOLD(LIGHT_CYAN('包大小排行'))}的环境编号：")
+        inp = get_valid_input(
+            f"[1-{valid_env_num}] >>> ",
+            condition_func=lambda x: x.isdigit() and 1 <= int(x) <= valid_env_num,
+            error_msg_func=lambda input_str: f"输入的环境编号 {LIGHT_YELLOW(input_str)} 无效，请重新输入：",
+        )
+        name = env_namelist[int(inp) - 1]
+        packages = get_env_package_sizes(env_pathlist[int(inp) - 1], env_pyverlist[int(inp) - 1])
+        if not packages:
+            print(LIGHT_YELLOW(f"[提示] 未在环境 {name} 中找到包的元数据！"))
+            return
+        env_size = sum(pkg["size"] for pkg in packages)
+        table = PrettyTable(["No.", "Package", "Version", "Source", "Size", "(%)", "Copied"])
+        table.align = "l"
+        table.border = False
+        for column in ("Size", "(%)", "Copied"):
+            table.align[column] = "r"  # type: ignore
+        for idx, pkg in enumerate(packages[:20], 1):
+            table.add_row(
+                [
+                    idx,
+                    pkg["name"],
+                    pkg["version"],
+                    pkg["source"],
+                    format_size(pkg["size"]),
+                    f"{pkg['size'] / env_size:.0%}" if env_size else "-",
+                    format_size(pkg["copied"]),
+                ]
+            )
+        print(three_line_table(table, title=f" 环境 {name} 中最大的 {min(20, len(packages))} 个包 "))
+        print(
+            f"共 {len(packages)} 个包，合计 {format_size(env_size)}；"
+            + DIM("Copied 为安装时复制或改写、而非硬链接自 pkgs 的部分")
+        )
+        input_strip("请按<回车键>继续...")
+
     # 如果按下的是[C]，则运行pip cache purge和mamba clean --all -y来清空所有pip与conda缓存
     elif inp.upper() == "C":
-        print(LIGHT_YELLOW("[提示] 加载缓存信息中，请稍等..."))
-        command = get_cmd(["conda clean --all --dry-run --json --quiet", "pip cache dir"])
-        result_text = subprocess.run(
-            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
-        ).stdout
-        clear_lines_above(1)
-        try:
-            if match := re.search(r"(\{.*\})(.*)", result_text, re.DOTALL):
-                result_text_conda = match.group(1)
-                result_text_pip = match.group(2)
-            result_json_dic = json.loads(result_text_conda)
-            index_cache_size = 0
-            for folder_path in result_json_dic["index_cache"]["files"]:
-                if os.path.exists(folder_path):
-                    index_cache_size += get_folder_size(folder_path)
-            index_cache_row = [
-                "1",
-                "Conda Index Caches",
-                format_size(index_cache_size),
-                os.path.join("$CONDA_HOME", "pkgs", "cache", "*.json"),
-            ]
-            tarballs_cache_row = [
-                "2",
-                "Conda Unused Tarballs",
-                format_size(tarballs_cache_size := result_json_dic["tarballs"]["total_size"]),
-                os.path.join("$CONDA_HOME", "pkgs", "(*.tar.bz2|*.conda)"),
-            ]
-            pkgs_cache_row = [
-                "3",
-                "Conda Unused Packages",
-                format_size(pkgs_cache_size := result_json_dic["packages"]["total_size"]),
-                os.path.join("$CONDA_HOME", "pkgs", "(包文件夹)"),
-            ]
-            logs_and_temps_size = 0
-            for _path in result_json_dic["logfiles"] + result_json_dic["tempfiles"]:
-                if os.path.isdir(_path):
-                    logs_and_temps_size += get_folder_size(_path)
-                elif os.path.isfile(_path):
-                    logs_and_temps_size += os.path.getsize(_path)
-            logs_and_temps_row = [
-                "4",
-                "Conda Logs & Temps",
-                format_size(logs_and_temps_size),
-                "Conda logfiles & tempfiles",
-            ]
-            if os.path.isdir(result_text_pip):
-                pip_cache_size = get_folder_size(result_text_pip)
-                pip_cache_Description = "Pip index cache & local built wheels"
-            else:
-                pip_cache_size = 0
-                pip_cache_Description = "* DISABLED *"
-            pip_cache_row = [
-                "5",
-                "Pip Cache",
-                format_size(pip_cache_size),
-                pip_cache_Description,
-            ]
-            total_size = (
-                index_cache_size + tarballs_cache_size + pkgs_cache_size + logs_and_temps_size + pip_cache_size
+
+        def shrink_pkgs_dir():
+            print(f"(2) 请输入 pkgs 目录的目标大小 (GiB)，将按最近最少使用的顺序{BOLD(LIGHT_RED('删除'))}：")
+            inp = get_valid_input(
+                "[GiB] >>> ",
+                condition_func=lambda x: re.fullmatch(r"\d+(\.\d*)?", x) is not None,
+                error_msg_func=lambda x: f"输入 {LIGHT_YELLOW(x)} 应为非负数，请重新输入：",
             )
-            table = PrettyTable(["No.", "Items to Clean", "Size", "Description"])
-            table.add_row(index_cache_row)
-            table.add_row(tarballs_cache_row)
-            table.add_row(pkgs_cache_row)
-            table.add_row(logs_and_temps_row)
-            table.add_row(pip_cache_row)
+            budget = int(float(inp) * 1024**3)
+            plan, pkgs_size = plan_pkgs_eviction(env_pathlist, budget)
+            if not plan:
+                print(
+                    LIGHT_GREEN(f"[提示] pkgs 目录当前大小为 {format_size(pkgs_size)}，未超过目标大小，无需删除")
+                )
+                return
+            table = PrettyTable(["No.", "Item", "Last Used", "Size (Bytes)"])
+            for i, (path, last_used, size) in enumerate(plan, 1):
+                last_used_str = (
+                    time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used)) if last_used else "Unknown"
+                )
+                table.add_row([i, os.path.basename(path), last_used_str, f"{size:,}"])
             table.align = "l"
+            table.align["Size (Bytes)"] = "r"
             table.border = False
+            freed_size = sum(size for _, _, size in plan)
             print(
                 three_line_table(
                     table,
-                    title=f" {'Mamba' if IS_MAMBA else 'Conda'} 及 Pip 缓存情况 ",
-                    footer=f" 总缓存大小：{format_size(total_size)} ",
-                    top_bottom_line_char="=",
+                    title=f" pkgs: {pkgs_size:,} → {pkgs_size - freed_size:,} 字节 ",
+                    footer=f" 共删除 {len(plan)} 项，释放 {freed_size:,} 字节 ({format_size(freed_size)}) ",
                 )
             )
-            print()
-            print(f"(1) 请输入Y(回车:全部清理)/N，或想要{BOLD(LIGHT_RED('清理'))}的缓存项编号，多个以空格隔开：")
-
-            def _valid_input_condition(x: str):
-                if x in ["Y", "y", "N", "n", "\r", "\n", ""]:
-                    return True
-                for i in x.split():
-                    if not (i.isdigit() and 1 <= int(i) <= 5):
-                        return False
-                return True
-
-            inp = get_valid_input(
-                "[(Y:All)/n | 1-5] >>> ",
-                condition_func=_valid_input_condition,
-                error_msg_func=lambda x: f"输入 {LIGHT_YELLOW(x)} "
-                + "应为空或Y或N或数字 (1-5) 的以空格隔开的组合，请重新输入：",
-            )
-            if ResponseChecker(inp, default="yes").is_no():
+            if pkgs_size - freed_size > budget:
+                print(LIGHT_YELLOW("[警告] 删除所有压缩包与未使用的包后仍超过目标大小"))
+            print("(3) 确认按上述计划删除吗？")
+            if not ResponseChecker(input_strip("[(Y)/n] >>> "), default="yes").is_yes():
                 return
-            elif ResponseChecker(inp, default="yes").is_yes():
-                command = get_cmd(["conda clean --all -y", "pip cache purge"])
-            else:
-                command_list = []
-                for i in inp.split():
-                    if i == "1":
-                        command_list.append("conda clean --index-cache -y")
-                    elif i == "2":
-                        command_list.append("conda clean --tarballs -y")
-                    elif i == "3":
-                        command_list.append("conda clean --packages -y")
-                    elif i == "4":
-                        command_list.append("conda clean --logfiles --tempfiles -y")
-                    elif i == "5":
-                        command_list.append("pip cache purge")
-                command = get_cmd(command_list)
-            subprocess.run(command, shell=True)
-        except Exception as e:
-            print(
-                LIGHT_RED(LIGHT_RED("[错误] ") + str(e)),
-                LIGHT_RED("[错误] conda clean --all --dry-run --json 命令输出有误！无法解析，输出如下："),
-                result_text,
-                LIGHT_YELLOW("[提示] 已启动默认清理程序"),
-                sep="\n",
+            freed_size = evict_pkgs(plan)
+            print(LIGHT_GREEN(f"[提示] 已释放 {freed_size:,} 字节 ({format_size(freed_size)})"))
+
+        print(LIGHT_YELLOW("[提示] 加载缓存信息中，请稍等..."))
+        inventory = get_cache_inventory(env_pathlist)
+        orphaned_pkgs = inventory["orphaned_pkgs"]
+        clear_lines_above(1)
+        index_cache_row = [
+            "1",
+            "Conda Index Caches",
+            format_size(index_cache_size := inventory["index_cache_size"]),
+            os.path.join("$CONDA_HOME", "pkgs", "cache", "*.json"),
+        ]
+        tarballs_cache_row = [
+            "2",
+            "Conda Unused Tarballs",
+            format_size(tarballs_cache_size := inventory["tarballs_size"]),
+            os.path.join("$CONDA_HOME", "pkgs", "(*.tar.bz2|*.conda)"),
+        ]
+        pkgs_cache_row = [
+            "3",
+            "Conda Unused Packages",
+            format_size(pkgs_cache_size := sum(size for _, size in orphaned_pkgs)),
+            os.path.join("$CONDA_HOME", "pkgs", "(包文件夹)"),
+        ]
+        logs_and_temps_row = [
+            "4",
+            "Conda Logs & Temps",
+            format_size(logs_and_temps_size := inventory["logs_and_temps_size"]),
+            "Conda logfiles & tempfiles",
+        ]
+        pip_cache_size = inventory["pip_cache_size"]
+        if inventory["pip_cache_dir"] is not None:
+            pip_cache_Description = "Pip index cache & local built wheels"
+        else:
+            pip_cache_Description = "* DISABLED *"
+        pip_cache_row = [
+            "5",
+            "Pip Cache",
+            format_size(pip_cache_size),
+            pip_cache_Description,
+        ]
+        total_size = (
+            index_cache_size + tarballs_cache_size + pkgs_cache_size + logs_and_temps_size + pip_cache_size
+        )
+        table = PrettyTable(["No.", "Items to Clean", "Size", "Description"])
+        table.add_row(index_cache_row)
+        table.add_row(tarballs_cache_row)
+        table.add_row(pkgs_cache_row)
+        table.add_row(logs_and_temps_row)
+        table.add_row(pip_cache_row)
+        table.align = "l"
+        table.border = False
+        print(
+            three_line_table(
+                table,
+                title=f" {'Mamba' if IS_MAMBA else 'Conda'} 及 Pip 缓存情况 ",
+                footer=f" 总缓存大小：{format_size(total_size)} ",
+                top_bottom_line_char="=",
             )
-            print("(1) 确认清空所有 Conda/pip 缓存吗？")
-            inp = input_strip("[(Y)/n] >>> ")
-            if not ResponseChecker(inp, default="yes").is_yes():
-                return
-            command = get_cmd(["conda clean --all -y", "pip cache purge"])
-            subprocess.run(command, shell=True)
+        )
+        if orphaned_pkgs:
+            num_shown = 10
+            pkgs_table = PrettyTable(["No.", "Unused Package", "Reclaimable"])
+            for i, (pkg_path, pkg_size) in enumerate(orphaned_pkgs[:num_shown], 1):
+                pkgs_table.add_row([f"3.{i}", os.path.basename(pkg_path), format_size(pkg_size)])
+            pkgs_table.align = "l"
+            pkgs_table.border = False
+            footer = f" 共 {len(orphaned_pkgs)} 个未使用的包"
+            if len(orphaned_pkgs) > num_shown:
+                footer += f"，其余 {len(orphaned_pkgs) - num_shown} 个共 "
+                footer += format_size(sum(size for _, size in orphaned_pkgs[num_shown:]))
+            print(three_line_table(pkgs_table, title=" 可回收的包 (按大小排序) ", footer=footer + " "))
+        print()
+        print(f"(1) 请输入Y(回车:全部清理)/N，或想要{BOLD(LIGHT_RED('清理'))}的缓存项编号，多个以空格隔开：")
+        print(DIM("[提示] 输入 S 可按最近使用时间删除 pkgs 中的压缩包与未使用的包，直至其不超过指定大小"))
+
+        def _valid_input_condition(x: str):
+            if x in ["Y", "y", "N", "n", "S", "s", "\r", "\n", ""]:
+                return True
+            for i in x.split():
+                if not (i.isdigit() and 1 <= int(i) <= 5):
+                    return False
+            return True
+
+        inp = get_valid_input(
+            "[(Y:All)/n | 1-5 | S:Shrink] >>> ",
+            condition_func=_valid_input_condition,
+            error_msg_func=lambda x: f"输入 {LIGHT_YELLOW(x)} "
+            + "应为空或Y或N或S或数字 (1-5) 的以空格隔开的组合，请重新输入：",
+        )
+        if ResponseChecker(inp, default="yes").is_no():
+            return
+        elif inp.upper() == "S":
+            shrink_pkgs_dir()
+            return
+        elif ResponseChecker(inp, default="yes").is_yes():
+            inp = "1 2 3 4 5"
+        command_list = []
+        for i in inp.split():
+            if i == "1":
+                command_list.append("conda clean --index-cache -y")
+            elif i == "2":
+                command_list.append("conda clean --tarballs -y")
+            elif i == "3":
+                # 不使用 conda clean --packages，其仅凭 st_nlink 判断，会误删以软链接或复制方式安装的包
+                freed_size = evict_pkgs([(pkg_path, 0.0, pkg_size) for pkg_path, pkg_size in orphaned_pkgs])
+                print(LIGHT_GREEN(f"[提示] 已释放 {freed_size:,} 字节 ({format_size(freed_size)})"))
+            elif i == "4":
+                command_list.append("conda clean --logfiles --tempfiles -y")
+            elif i == "5" and inventory["pip_cache_dir"] is not None:
+                command_list.append("pip cache purge")
+        if command_list:
+            subprocess.run(get_cmd(command_list), shell=True)
 
     # 如果按下的是[U]，则更新指定环境的所有包
     elif inp.upper() == "U":
@@ -2352,9 +5594,7 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
                 (LIGHT_GREEN("True") + ")" if strict_channel_priority else LIGHT_RED("False") + ")"),
             )
 
-            command = [CONDA_EXE_PATH, "list", "-n", name, "--json"]
-            result_text = subprocess.run(command, capture_output=True, text=True).stdout
-            result_json_list: list[dict] = json.loads(result_text)
+            result_json_list = PackageIndex.of(env_pathlist[env_namelist.index(name)]).list_packages()
 
             pinned_pkgs = get_pinned_pkgs(name)
             if pinned_pkgs:
@@ -3029,27 +6269,46 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
                 return list(merged_pkginfos_dict.values())
 
         def get_pkginfos_list_raw(
-            use_cache: bool, search_pkg_info: str, total_channels: list
+            search_pkg_info: str, total_channels: list, channel_refresh_times: dict[str, float]
         ) -> list[dict[str, Any]]:
-            """根据指定是否使用缓存和查询字符串，获取原始的包信息列表。
+            """根据查询字符串，获取原始的包信息列表。
 
-            该函数将根据 is_legacy_solver: bool 决定是否使用 repoquery 命令以加速搜索。
+            索引缓存仍有效的源直接由本地的 repodata 索引 (见 RepodataIndex) 搜索；仅对缓存已过期或不存在的源调用
+            conda 搜索 (同时刷新其索引缓存)，并根据 is_legacy_solver: bool 决定是否使用 repoquery 命令以加速搜索。
 
             Args:
-                use_cache (bool): 是否使用缓存。如果为 True，则使用缓存的索引数据。
                 search_pkg_info (str): 需要搜索的包信息字符串。
                 total_channels (list[str]): 需要搜索的源列表。
+                channel_refresh_times (dict[str, float]): 各源上次通过 conda 刷新的时间，将被原地更新。
 
             Returns:
-                list[dict[str, Any]]: 原始包信息列表。如果解析失败，或结果为空，则返回空列表。
+                list[dict[str, Any]]: 原始包信息列表 (conda repoquery search 的格式)。如果结果为空，则返回空列表。
             """
+            sources = list_repodata_sources()
+            fresh_channels, stale_channels = split_repodata_channels(
+                total_channels, sources, channel_refresh_times
+            )
+            local_pkginfos_list = []
+            if fresh_channels:
+                # 只索引要搜索的有效源的缓存，过期的源随后由 conda 刷新，其余的源不参与本次搜索
+                fresh_channel_names = [_normalize_channel_name(channel) for channel in fresh_channels]
+                fresh_sources = [
+                    source
+                    for source in sources
+                    if any(_channel_matches(name, source["channel"]) for name in fresh_channel_names)
+                ]
+                local_pkginfos_list = get_repodata_index(fresh_sources).search(search_pkg_info, fresh_channels)
+            if not stale_channels:
+                return local_pkginfos_list
+
             if is_legacy_solver:
                 head_cmd = "conda search"
             else:
                 head_cmd = "conda repoquery search"
 
-            query_option = f'"{search_pkg_info}" {" ".join(["-c "+i for i in total_channels])}'
-            cmd_str = f'{head_cmd} {query_option} --json --quiet {"--use-index-cache" if use_cache else ""}'
+            query_option = f'"{search_pkg_info}" {" ".join(["-c "+i for i in stale_channels])}'
+            # 其余的源已由本地索引搜索，故不再附带 .condarc 中配置的源
+            cmd_str = f"{head_cmd} {query_option} --override-channels --json --quiet"
 
             command = get_cmd([cmd_str])
 
@@ -3092,9 +6351,11 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
             if is_error:
                 print(LIGHT_RED("[错误] 搜索结果解析失败！原始结果如下："))
                 print("-" * 10 + "\n" + result_text + "\n" + "-" * 10)
-                return []
+                return local_pkginfos_list
 
-            return pkginfos_list_raw
+            for channel in stale_channels:
+                channel_refresh_times[_normalize_channel_name(channel)] = time.time()
+            return local_pkginfos_list + pkginfos_list_raw
 
         def search_pkgs_main(target_py_version: str):
             """搜索Conda包任务的主函数"""
@@ -3136,27 +6397,14 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
             print(f"正在搜索 ({LIGHT_CYAN(search_pkg_info)})...")
             t0_search = time.time()
 
-            total_channels = add_channels + CFG_DEFAULT_SEARCH_CHANNELS.split()
+            # 与 conda search 一致，总是附带 .condarc 中配置的源
+            total_channels = add_channels + CFG_DEFAULT_SEARCH_CHANNELS.split() + load_condarc()["channels"]
             total_channels = ordered_unique(total_channels)
 
             search_meta_data = data_manager.get_data("search_meta_data")
-            last_update_time = search_meta_data.get("last_update_time", 0)
-            if _get_base_env_modified_info()[2] <= 0:  # 如果pkgs/cache目录为空，不使用缓存
-                last_update_time = 0
-            if last_update_time >= (time.time() - CFG_SEARCH_CACHE_EXPIRE_MINUTES * 60) and set(
-                total_channels
-            ).issubset(search_meta_data.get("total_channels", [])):
-                use_cache = True
-                search_meta_data["total_channels"] = list(
-                    set(total_channels) | set(search_meta_data.get("total_channels", []))
-                )
-            else:
-                use_cache = False
-                search_meta_data["total_channels"] = total_channels
-            search_meta_data["last_update_time"] = time.time()
-            data_manager.update_data("search_meta_data", search_meta_data)
-
-            pkginfos_list_raw = get_pkginfos_list_raw(use_cache, search_pkg_info, total_channels)
+            channel_refresh_times = dict(search_meta_data.get("channel_refresh_times", {}))
+            pkginfos_list_raw = get_pkginfos_list_raw(search_pkg_info, total_channels, channel_refresh_times)
+            data_manager.update_data("search_meta_data", {"channel_refresh_times": channel_refresh_times})
 
             if not pkginfos_list_raw:
                 print(LIGHT_YELLOW(f"[警告] 未搜索到任何相关包 ({round(time.time() - t0_search, 2)} s)！"))
@@ -4393,6 +7641,7 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
                     print(f"{LIGHT_RED('[×]')}")
                 print("-" * (fast_get_terminal_size().columns - 5))
         else:
+            import asyncio
 
             async def check_environment_health(name: str):
                 try:
@@ -4446,12 +7695,6 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
 
         input_strip(f"{LIGHT_GREEN('[完成]')} 检查完毕，请按<回车键>继续...")
 
-    # 如果按下的是[D]，则计算所有环境的大小及真实磁盘占有量
-    elif inp.upper() == "D":
-        global env_size_recalc_force_enable
-        env_size_recalc_force_enable = True
-        clear_screen(hard=CFG_FULL_TERMINAL_CLEAR)
-
     # 如果输入的是[=编号]，则浏览环境主目录
     elif inp.find("@") != -1:
         inp = int(inp[1:])
@@ -4489,23 +7732,125 @@ def do_action(inp, env_infos_dict: EnvInfosDict):
         subprocess.run(command)
 
 
+def _get_import_timings() -> list[tuple[str, float]]:
+    """在新的解释器中以 -X importtime 导入本模块，返回本模块直接导入的各模块及其累计耗时 (秒)。"""
+    module_dir, module_file = os.path.split(os.path.abspath(__file__))
+    module_name = os.path.splitext(module_file)[0]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=module_dir,
+        capture_output=True,
+        text=True,
+    )
+    import_timings = []
+    for line in result.stderr.splitlines():
+        if (
+            not line.startswith("import time:")
+            or len(items := line.split("|")) != 3
+            or not items[1].strip().isdigit()
+        ):
+            continue
+        name = items[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == 0:
+            if name.strip() == module_name:
+                break
+            import_timings.clear()
+        elif level == 1:
+            import_timings.append((name.strip(), int(items[1]) / 1e6))
+    return import_timings
+
+
+def print_startup_profile(phase_timings: list[tuple[str, float]]):
+    """打印各启动阶段与各模块导入的耗时，并与启动耗时预算 STARTUP_BUDGET_SECONDS 对照。
+
+    Args:
+        phase_timings (list[tuple[str, float]]): 已完成的启动阶段及其耗时 (秒)，此后的阶段在本函数中继续计时。
+
+    Note:
+        计时的阶段与交互模式下显示主界面前实际执行的阶段一致；后台刷新环境信息不阻塞主界面，故单独列出且不计入预算。
+    """
+    phase_timings = list(phase_timings)
+    refresh_time = None
+
+    t0 = time.perf_counter()
+    data_manager.get_data("env_infos_data")
+    phase_timings.append(("加载程序数据", time.perf_counter() - t0))
+
+    if CONDA_HOME != "error":  # 未检测到发行版时，仅统计至此
+        t0 = time.perf_counter()
+        if (env_infos_dict := get_last_env_infos()) is not None:
+            phase_timings.append(("读取上次的环境信息", time.perf_counter() - t0))
+        else:
+            env_infos_dict = get_env_infos(quiet=True)
+            phase_timings.append(("获取环境信息", time.perf_counter() - t0))
+
+        t0 = time.perf_counter()
+        table = get_envs_prettytable(env_infos_dict)
+        table_rstrip_width = len_to_print(table.get_string().splitlines()[0].rstrip())
+        _get_header_line(table_rstrip_width, env_infos_dict)
+        _get_envs_table_lines(table, env_infos_dict)
+        phase_timings.append(("生成主界面", time.perf_counter() - t0))
+
+        t0 = time.perf_counter()
+        get_env_infos(quiet=True)
+        refresh_time = time.perf_counter() - t0
+    total_time = sum(t for _, t in phase_timings)
+
+    table = PrettyTable(["Startup Phase", "Time (ms)"])
+    for phase, t in phase_timings:
+        table.add_row([phase, f"{t * 1000:.1f}"])
+    if refresh_time is not None:
+        table.add_row([DIM("后台刷新环境信息 (不计入)"), DIM(f"{refresh_time * 1000:.1f}")])
+    table.align = "l"
+    table.align["Time (ms)"] = "r"
+    table.border = False
+    print(three_line_table(table, title=" 启动各阶段耗时 "))
+    budget_str = f"启动总耗时 {total_time * 1000:.1f} ms，预算 {STARTUP_BUDGET_SECONDS * 1000:.0f} ms"
+    if total_time <= STARTUP_BUDGET_SECONDS:
+        print(LIGHT_GREEN(f"[提示] {budget_str}，符合预算。"))
+    else:
+        print(LIGHT_RED(f"[警告] {budget_str}，超出预算！"))
+    print()
+
+    table = PrettyTable(["Imported Module", "Cumulative Time (ms)"])
+    for name, t in sorted(_get_import_timings(), key=lambda x: x[1], reverse=True):
+        table.add_row([name, f"{t * 1000:.1f}"])
+    table.align = "l"
+    table.align["Cumulative Time (ms)"] = "r"
+    table.border = False
+    print(three_line_table(table, title=" 各模块导入耗时 (新解释器中) "))
+
+
 def main(workdir):
     os.chdir(workdir)
-    while action_status:
-        env_infolist_dict = get_env_infos()
-        inp = show_info_and_get_input(env_infolist_dict)
-        print()
-        try:
-            do_action(inp, env_infolist_dict)
-        except KeyboardInterrupt:  # 捕获Ctrl+C中断信号,自定义其功能为中断当前事务，重启主循环
-            if action_status:
-                cancel_msg = " * CANCLED BY USER * "
-                half_width = (fast_get_terminal_size().columns - len(cancel_msg)) // 2
-                print("\n" + DIM(LIGHT_YELLOW(">" * half_width + cancel_msg + "<" * half_width)))
-        print()
+    # 首次启动时先显示上次保存的环境信息，同时在后台刷新
+    env_infos_refresher = None
+    if (env_infolist_dict := get_last_env_infos()) is not None:
+        env_infos_refresher = EnvInfosRefresher()
+        env_infos_refresher.start()
+    try:
+        while action_status:
+            if env_infos_refresher is None:
+                env_infolist_dict = get_env_infos()
+            inp = show_info_and_get_input(env_infolist_dict, env_infos_refresher)
+            env_infos_refresher = None
+            print()
+            try:
+                do_action(inp, env_infolist_dict)
+            except KeyboardInterrupt:  # 捕获Ctrl+C中断信号,自定义其功能为中断当前事务，重启主循环
+                if action_status:
+                    cancel_msg = " * CANCLED BY USER * "
+                    half_width = (fast_get_terminal_size().columns - len(cancel_msg)) // 2
+                    print("\n" + DIM(LIGHT_YELLOW(">" * half_width + cancel_msg + "<" * half_width)))
+            print()
+            data_manager.flush()  # 每轮主循环合并写入一次数据文件
+    finally:
+        cancel_env_size_calculation()  # 退出前停止后台统计，并保存已完成的部分
 
 
 if __name__ == "__main__":
+    _main_t0 = time.perf_counter()
     parser = argparse.ArgumentParser(description=f"Conda/Mamba 发行版环境管理工具 v{PROGRAM_VERSION}")
     parser.add_argument(
         "-d",
@@ -4547,7 +7892,13 @@ if __name__ == "__main__":
         action="store_true",
         help="仅打印 Conda 环境信息，不进入交互界面",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="打印程序启动各阶段与各模块导入的耗时，并与启动耗时预算对照",
+    )
     args = parser.parse_args()
+    _args_parsed_t = time.perf_counter()
     if args.delete_data_files:
         if os.path.exists(data_manager.program_data_home):
             rmtree(data_manager.program_data_home)
@@ -4558,6 +7909,8 @@ if __name__ == "__main__":
     if args.detect_distribution:
         print("计算机中所有受支持的 Conda/Mamba 发行版如下：")
         available_conda_homes = get_conda_homes(detect_mode=True)
+        with ThreadPoolExecutor() as executor:  # 并行检测各发行版，每个发行版至多扫描一次 conda-meta
+            conda_infos_list = list(executor.map(detect_conda_mamba_infos, available_conda_homes))
         table = PrettyTable()
         table.field_names = [
             "No.",
@@ -4569,47 +7922,32 @@ if __name__ == "__main__":
             "conda-libmamba-solver",
         ]
         for i in range(len(available_conda_homes)):
+            _, _, mamba_version, libmamba_solver_version, conda_version = conda_infos_list[i]
             table.add_row(
                 [
                     i + 1,
                     os.path.split(available_conda_homes[i])[1],
                     "*" if i == 0 else "",
                     available_conda_homes[i],
-                    (
-                        LIGHT_GREEN(detect_conda_mamba_infos(available_conda_homes[i])[-1])
-                        if detect_conda_mamba_infos(available_conda_homes[i])[-1]
-                        else LIGHT_RED("NO")
-                    ),
-                    (
-                        LIGHT_GREEN(detect_conda_mamba_infos(available_conda_homes[i])[2])
-                        if detect_conda_mamba_infos(available_conda_homes[i])[2]
-                        else LIGHT_RED("NOT supported".upper())
-                    ),
-                    (
-                        LIGHT_GREEN(detect_conda_mamba_infos(available_conda_homes[i])[3])
-                        if detect_conda_mamba_infos(available_conda_homes[i])[3]
-                        else "-"
-                    ),
+                    LIGHT_GREEN(conda_version) if conda_version else LIGHT_RED("NO"),
+                    LIGHT_GREEN(mamba_version) if mamba_version else LIGHT_RED("NOT supported".upper()),
+                    LIGHT_GREEN(libmamba_solver_version) if libmamba_solver_version else "-",
                 ]
             )
         table.align = "l"
         table.border = False
         print(three_line_table(table))
         sys.exit(0)
-    if args.prefix is not None:
-        if is_valid_env(args.prefix):
-            CONDA_HOME = os.path.realpath(args.prefix)
-            CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION = (
-                detect_conda_mamba_infos(CONDA_HOME)
-            )
-        else:
-            print(YELLOW(f'[提示] 未在指定路径"{args.prefix}"检测到对应发行版，将使用默认发行版'))
-    elif args.distribution_name is not None:
-        CONDA_HOME, CONDA_EXE_PATH, IS_MAMBA, MAMBA_VERSION, LIBMAMBA_SOLVER_VERSION, CONDA_VERSION = (
-            detect_conda_installation(args.distribution_name)
+    init_conda_installation(args.prefix, args.distribution_name)
+    if args.profile_startup:
+        print_startup_profile(
+            [
+                ("模块导入", _main_t0 - _startup_t0),
+                ("参数解析", _args_parsed_t - _main_t0),
+                ("发行版检测", time.perf_counter() - _args_parsed_t),
+            ]
         )
-        if os.path.split(CONDA_HOME)[1].lower() != args.distribution_name.lower():
-            print(YELLOW(f"[提示] 未检测到指定的发行版 ({args.distribution_name})，将使用默认发行版"))
+        sys.exit(0)
     if args.print_only:
         env_size_recalc_force_enable = True
         main_display_mode = 3
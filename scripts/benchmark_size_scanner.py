@@ -0,0 +1,106 @@
+"""在合成的 Conda 目录树上对比 get_paths_sizes_linux 的线程模式与进程模式的耗时 (仅限 Linux)。
+
+用法: python scripts/benchmark_size_scanner.py [--pkgs 200] [--files-per-pkg 500] [--envs 3] [--repeat 3]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import conda_env_manager as cem
+
+
+def make_synthetic_tree(root: str, num_pkgs: int, files_per_pkg: int, num_envs: int) -> list[str]:
+    """模拟 Conda 的目录结构：pkgs 中为已解压的包，base 与各环境中的文件均为 pkgs 中文件的硬链接，另有少量独立文件。
+
+    Returns:
+        list[str]: [base 路径, 各环境路径...]
+    """
+    pkgs_path = os.path.join(root, "pkgs")
+    env_paths = [root] + [os.path.join(root, "envs", f"env{i}") for i in range(num_envs)]
+    for pkg_idx in range(num_pkgs):
+        pkg_name = f"pkg{pkg_idx}-1.0-0"
+        for file_idx in range(files_per_pkg):
+            # 每个包分为若干层子目录，使目录深度与真实的包相近
+            rel_dir = os.path.join("lib", f"pkg{pkg_idx}", f"sub{file_idx % 10}", f"sub{file_idx % 3}")
+            os.makedirs(os.path.join(pkgs_path, pkg_name, rel_dir), exist_ok=True)
+            src = os.path.join(pkgs_path, pkg_name, rel_dir, f"file{file_idx}.py")
+            with open(src, "wb") as f:
+                f.write(b"x" * (100 + file_idx % 4000))
+            for env_idx, env_path in enumerate(env_paths):
+                if (pkg_idx + env_idx) % 2:  # 每个环境只安装一半的包
+                    continue
+                os.makedirs(os.path.join(env_path, rel_dir), exist_ok=True)
+                os.link(src, os.path.join(env_path, rel_dir, f"file{file_idx}.py"))
+    for env_path in env_paths:  # 安装时改写的文件不是硬链接
+        os.makedirs(os.path.join(env_path, "bin"), exist_ok=True)
+        for i in range(files_per_pkg):
+            with open(os.path.join(env_path, "bin", f"script{i}"), "wb") as f:
+                f.write(b"#!" + b"y" * (200 + i))
+    return env_paths
+
+
+def run_scan(env_paths: list[str], root: str, use_processes: bool):
+    # 清空目录大小树，使每次都完整遍历
+    cem._size_tree_cache = None
+    if os.path.exists(cem.SIZE_TREE_FILE):
+        os.remove(cem.SIZE_TREE_FILE)
+    start_time = time.perf_counter()
+    result = cem.get_paths_sizes_linux(
+        env_paths,
+        exclude_paths=[os.path.join(root, "envs")],
+        pkgs_paths=[os.path.join(root, "pkgs")],
+        use_processes=use_processes,
+    )
+    return time.perf_counter() - start_time, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="对比环境大小统计的线程模式与进程模式")
+    parser.add_argument("--pkgs", type=int, default=200, help="合成的包数")
+    parser.add_argument("--files-per-pkg", type=int, default=500, help="每个包的文件数")
+    parser.add_argument("--envs", type=int, default=3, help="base 以外的环境数")
+    parser.add_argument("--repeat", type=int, default=3, help="每种模式的重复次数，取最短耗时")
+    parser.add_argument("--workdir", default=None, help="在此目录下创建合成目录树 (默认为系统临时目录)")
+    args = parser.parse_args()
+
+    if os.name != "posix":
+        print("该基准测试仅支持 Linux")
+        sys.exit(1)
+
+    root = tempfile.mkdtemp(prefix="cem_bench_", dir=args.workdir)
+    cem.SIZE_TREE_FILE = os.path.join(root, "size_tree.json")  # 不影响用户的数据文件
+    try:
+        print(f"正在生成合成目录树: {root}")
+        env_paths = make_synthetic_tree(os.path.join(root, "conda"), args.pkgs, args.files_per_pkg, args.envs)
+        print(
+            f"包数: {args.pkgs}, 每包文件数: {args.files_per_pkg}, 环境数: {len(env_paths)}, CPU 数: {os.cpu_count()}"
+        )
+
+        timings = {}
+        results = {}
+        for mode, use_processes in (("threads", False), ("processes", True)):
+            run_scan(env_paths, os.path.join(root, "conda"), use_processes)  # 预热页缓存与进程池的导入
+            elapsed_list = []
+            for _ in range(args.repeat):
+                elapsed, results[mode] = run_scan(env_paths, os.path.join(root, "conda"), use_processes)
+                elapsed_list.append(elapsed)
+            timings[mode] = min(elapsed_list)
+            print(f"{mode:>9}: {timings[mode]:.3f} s (min of {args.repeat})")
+
+        print(f"speedup (threads / processes): {timings['threads'] / timings['processes']:.2f}x")
+        if results["threads"] == results["processes"]:
+            print("两种模式的结果一致")
+        else:
+            print("两种模式的结果不一致！")
+            sys.exit(1)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
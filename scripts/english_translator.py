@@ -56,11 +56,7 @@ translation_dict = {
     " 及 Pip 缓存情况": " and Pip cache situation",
     "总缓存大小：": "Total cache size: ",
     "(1) 请输入Y(回车:全部清理)/N，或想要{BOLD(LIGHT_RED('清理'))}的缓存项编号，多个以空格隔开：": "(1) Please enter Y(<Enter>: clean all)/N, or the number(s) of the cache item(s) you want to {BOLD(LIGHT_RED('clean'))}, separated by spaces: ",
-    "应为空或Y或N或数字 (1-5) 的以空格隔开的组合，请重新输入：": "should be a combination of empty, Y, N, or numbers (1-5) separated by spaces, please re-enter: ",
-    "[错误] ": "[Error] ",
-    "[错误] mamba clean --all --dry-run --json 命令输出有误！无法解析，输出如下：": "[Error] The mamba clean --all --dry-run --json command output is incorrect! Unable to parse, the output is as follows:",
-    "[提示] 已启动默认清理程序": "[Tip] The default cleaning program has been started",
-    "(1) 确认清空所有 Conda/pip 缓存吗？": "(1) Are you sure you want to clear all Conda/pip caches? ",
+    "应为空或Y或N或S或数字 (1-5) 的以空格隔开的组合，请重新输入：": "should be a combination of empty, Y, N, S, or numbers (1-5) separated by spaces, please re-enter: ",
     "[提示] 慎用，请仔细检查更新前后的包对应源的变化！": "[Tip] Use with caution, please carefully check the changes in the corresponding sources of the package before and after the update!",
     "(1) 请输入想要{BOLD(GREEN('更新'))}的环境的编号（或all=全部），多个以空格隔开：": "(1) Please enter the number(s) of environment(s) you want to {BOLD(GREEN('update'))} (or all for all envs), separated by spaces: ",
     "(2) 确认更新以上环境吗？": "(2) Are you sure you want to update the above environment(s)? ",
@@ -133,8 +129,8 @@ translation_dict = {
     "发行版的名称，支持miniforge3, anaconda3, miniconda3, mambaforge, miniforge-pypy3, mambaforge-pypy3，默认顺序如前": "The name of the distribution, supports miniforge3, anaconda3, miniconda3, mambaforge, miniforge-pypy3, mambaforge-pypy3, the default order is as before",
     "探测并列出计算机中所有受支持的 Conda/Mamba 发行版": "Detect and list all supported Conda/Mamba distributions on the computer",
     "计算机中所有受支持的 Conda/Mamba 发行版如下：": "All supported Conda/Mamba distributions on the computer are as follows:",
-    '[提示] 未在指定路径"{args.prefix}"检测到对应发行版，将使用默认发行版': '[Tip] The corresponding distribution was NOT detected in the specified path "{args.prefix}", and the default distribution will be used',
-    "[提示] 未检测到指定的发行版 ({args.distribution_name})，将使用默认发行版": "[Tip] The specified distribution ({args.distribution_name}) was NOT detected, and the default distribution will be used",
+    '[提示] 未在指定路径"{prefix}"检测到对应发行版，将使用默认发行版': '[Tip] The corresponding distribution was NOT detected in the specified path "{prefix}", and the default distribution will be used',
+    "[提示] 未检测到指定的发行版 ({distribution_name})，将使用默认发行版": "[Tip] The specified distribution ({distribution_name}) was NOT detected, and the default distribution will be used",
     "[错误] 传入的参数不是一个目录！": "[Error] The passed parameter is NOT a directory!",
     "输入错误 {LIGHT_RED(error_count)} 次，请重新输入：": "Input error {LIGHT_RED(error_count)} times, please re-enter: ",
     "输入错误达到最大次数 ({max_errors})，程序退出。": "The maximum number of input errors ({max_errors}) has been reached, and the program exits.",
@@ -143,18 +139,17 @@ translation_dict = {
     "[提示] 检测到多个发行版安装：": "[Tip] Multiple distributions are detected:",
     "[{i}]\\t{os.path.split(condapath)[1]}\\t{condapath} (当前)": "[{i}]\\\\t{os.path.split(condapath)[1]}\\\\t{condapath} (Current)",
     "[提示] 检测到如下其它发行版的环境，或未安装在规范目录下的环境，将不会被显示与管理：": "[Tip] The following environments from other distributions or those NOT installed in the standard directory will NOT be displayed or managed:",
+    "(刷新中...) ": "(refreshing...) ",
     "{' 以上信息仅在不受支持的环境有变化时显示 ':*^55}": "{' This information is displayed only when unsupported environments change ':*^55}",
     '允许的操作指令如下 (按{BOLD(YELLOW("[Q]"))}以退出, 按{BOLD("[Tab]")}切换当前显示模式 {BOLD(LIGHT_CYAN(main_display_mode))}):': 'Allowed commands (press {BOLD(YELLOW("[Q]"))} to quit, {BOLD("[Tab]")} to switch the current display mode {BOLD(LIGHT_CYAN(main_display_mode))}):',
     '激活环境对应命令行{_s}编号{boundarys[0]}{BOLD(LIGHT_YELLOW(f"1-{valid_env_num}"))}{boundarys[1]};浏览环境主目录输入<{BOLD(LIGHT_GREEN("@编号"))}>;': 'Activate environment by number {boundarys[0]}{BOLD(LIGHT_YELLOW(f"1-{valid_env_num}"))}{boundarys[1]}; Browse the env directory by <{BOLD(LIGHT_GREEN("@Number"))}>;',
     '删除环境按{BOLD(RED("[-]"))};新建环境按{BOLD(LIGHT_GREEN("[+]"))};重命名环境按{BOLD(LIGHT_BLUE("[R]"))};复制环境按{BOLD(LIGHT_CYAN("[P]"))};': '{BOLD("For env(s)")}: Delete by {BOLD(RED("[-]"))}; Create new by {BOLD(LIGHT_GREEN("[+]"))}; Rename by {BOLD(LIGHT_BLUE("[R]"))}; Copy by {BOLD(LIGHT_CYAN("[P]"))};',
-    '显示并回退至环境的历史版本按{BOLD(LIGHT_MAGENTA("[V]"))};': 'View and roll back to historical version of the environment by {BOLD(LIGHT_MAGENTA("[V]"))};',
+    '显示并回退至环境的历史版本按{BOLD(LIGHT_MAGENTA("[V]"))};查看环境中各包的大小排行按{BOLD(LIGHT_CYAN("[T]"))};': 'View and roll back to historical version of the environment by {BOLD(LIGHT_MAGENTA("[V]"))}; View the largest packages in an environment by {BOLD(LIGHT_CYAN("[T]"))};',
     '更新环境的所有 Conda 包按{BOLD(GREEN("[U]"))};': 'Update all Conda packages of environment(s) by {BOLD(GREEN("[U]"))};',
     '查看及清空 Conda/pip 缓存按{BOLD(LIGHT_RED("[C]"))};': 'Clean or view Conda/pip cache by {BOLD(LIGHT_RED("[C]"))};',
     '注册 Jupyter 内核按{BOLD(CYAN("[I]"))};显示、管理及清理 Jupyter 内核按{BOLD(LIGHT_BLUE("[J]"))};': '{BOLD("For Jupyter kernel(s)")}: Register by {BOLD(CYAN("[I]"))}; Display, manage, and clean by {BOLD(LIGHT_BLUE("[J]"))};',
     '检查环境完整性并显示健康报告按{BOLD(LIGHT_GREEN("[H]"))};': 'Check the integrity of env(s) and display health report by {BOLD(LIGHT_GREEN("[H]"))};',
     '搜索 Conda 软件包按{BOLD(LIGHT_YELLOW("[S]"))};': 'Search for Conda packages by {BOLD(LIGHT_YELLOW("[S]"))};',
-    "(约 {calc_cost_time:.0f} 秒)": "(about {calc_cost_time:.0f} seconds)",
-    "统计环境大小及磁盘占用情况按{BOLD(LIGHT_GREEN('[D]'))};": "Statistics of the size and disk usage of envs by {BOLD(LIGHT_GREEN('[D]'))};",
     "[警告] base 环境未安装 Jupyter，无法管理相关环境的 Jupyter 内核注册，请在主界面按[J]以安装": "[Warning] The base environment is NOT installed with Jupyter, and cannot manage the Jupyter kernel registration of related environments. Please press [J] on the main interface to install",
     "[提示] 已清除卸载的环境 {LIGHT_CYAN(name)} 的 Jupyter 内核注册": "[Tip] The Jupyter kernel registration of the uninstalled environment {LIGHT_CYAN(name)} has been cleared.",
     "(2) [提示] 根据环境名称 {LIGHT_CYAN(new_name)} 已自动确定 Python 版本为 {LIGHT_GREEN(py_version)}": "(2) [Tip] According to the environment name {LIGHT_CYAN(new_name)}, the Python version has been automatically determined as {LIGHT_GREEN(py_version)}",
@@ -213,7 +208,7 @@ translation_dict = {
 # <提示> 这些全局设置以CFG_开头，用于控制程序的默认行为，且在程序运行时*不可*更改。
 # [设置 1] 控制[S]搜索功能在这期间内使用缓存搜索，而不重新联网下载索引（单位：分钟）。
 CFG_SEARCH_CACHE_EXPIRE_MINUTES = 60
-# [设置 2] 如果上次重新统计环境大小的耗时超过此设定，则下次需要手动按[D]以重新统计环境大小（单位：秒）。
+# [设置 2] 如果上次重新统计环境大小的耗时超过此设定，则改为在后台统计环境大小，期间主界面可正常使用（单位：秒）。
 CFG_MAX_ENV_SIZE_CALC_SECONDS = 3
 # [设置 3] 控制 DISPLAY_MODE (int) 的初始值: 主界面环境表格显示模式，主界面按[Tab]键可切换，可以是以下值之一：
 #   1: 显示环境的 最后更新时间 和 磁盘实际使用量。
@@ -227,7 +222,7 @@ CFG_CMD_TRIGGERED_PKGS: str = "matplotlib scikit-learn numba pandas ipykernel"
 # [设置 6] 在[S]搜索功能时，默认启用的 Channel 源，即 Conda 包的搜索范围""": """# <Hint> These global settings, prefixed with CFG_, control the default behavior of the program and *cannot* be changed during runtime.
 # [Setting 1] Controls the [S] search function to use cached search results within this period instead of downloading new indexes (unit: minutes).
 CFG_SEARCH_CACHE_EXPIRE_MINUTES = 60
-# [Setting 2] If the time taken to recalculate the environment size last time exceeded this setting, the next recalculation requires manually pressing [D] (unit: seconds).
+# [Setting 2] If the time taken to recalculate the environment size last time exceeded this setting, the sizes are recalculated in the background while the main interface stays usable (unit: seconds).
 CFG_MAX_ENV_SIZE_CALC_SECONDS = 3
 # [Setting 3] Controls the initial value of DISPLAY_MODE (int): the display mode of the main interface environment table. You can toggle it by pressing [Tab] on the main interface. It can be one of the following values:
 #   1: Display the last update time and actual disk usage of the environment.
@@ -239,6 +234,42 @@ CFG_FULL_TERMINAL_CLEAR = True
 # [Setting 5] During the [+] install environment function, the shortcut command "--+" represents a collection of Conda packages (if ipykernel is present, it will be automatically registered to the user's Jupyter).
 CFG_CMD_TRIGGERED_PKGS: str = "matplotlib scikit-learn numba pandas ipykernel"
 # [Setting 6] The default enabled Channel source during the [S] search function, i.e., the search scope of Conda packages""",
+    "打印程序启动各阶段与各模块导入的耗时，并与启动耗时预算对照": "Print the time spent in each startup phase and on each module import, compared against the startup time budget",
+    "模块导入": "Module import",
+    "参数解析": "Argument parsing",
+    "发行版检测": "Distribution detection",
+    "加载程序数据": "Program data loading",
+    "读取上次的环境信息": "Last environment info reading",
+    "获取环境信息": "Environment info collection",
+    "生成主界面": "Main interface rendering",
+    "后台刷新环境信息 (不计入)": "Background environment info refresh (not counted)",
+    " 启动各阶段耗时 ": " Startup Phase Timings ",
+    "启动总耗时 {total_time * 1000:.1f} ms，预算 {STARTUP_BUDGET_SECONDS * 1000:.0f} ms": "Total startup time {total_time * 1000:.1f} ms, budget {STARTUP_BUDGET_SECONDS * 1000:.0f} ms",
+    "[提示] {budget_str}，符合预算。": "[Tip] {budget_str}, within budget.",
+    "[警告] {budget_str}，超出预算！": "[Warning] {budget_str}, over budget!",
+    " 各模块导入耗时 (新解释器中) ": " Module Import Timings (in a fresh interpreter) ",
+    "# [设置 7] 统计环境大小的方式，可以是以下值之一：\n#   \"auto\": Conda 主目录位于网络文件系统 (NFS、SMB 等) 上时使用 \"metadata\"，否则使用 \"scan\"。\n#   \"scan\": 遍历环境中的所有文件统计，结果精确。\n#   \"metadata\": 根据 conda-meta/*.json 与 pip 的 RECORD 中记录的文件大小估计，只需读取每个包的元数据，适合遍历文件\n#       很慢的网络文件系统；不含包以外的文件，实际磁盘占用按表观大小估计。": "# [Setting 7] How environment sizes are computed, one of the following values:\n#   \"auto\": use \"metadata\" when the Conda home is on a network filesystem (NFS, SMB, etc.), otherwise \"scan\".\n#   \"scan\": walk every file in the environments; the result is exact.\n#   \"metadata\": estimate from the file sizes recorded in conda-meta/*.json and pip RECORD files, reading only each\n#       package's metadata; suited to network filesystems where walking files is slow. Files outside packages are not\n#       counted and the actual disk usage is estimated from the apparent size.",
+    "(1) 请输入想要查看{BOLD(LIGHT_CYAN('包大小排行'))}的环境编号：": "(1) Please enter the number of the environment whose {BOLD(LIGHT_CYAN('largest packages'))} you want to view: ",
+    "[提示] 未在环境 {name} 中找到包的元数据！": "[Tip] No package metadata found in environment {name}!",
+    " 环境 {name} 中最大的 {min(20, len(packages))} 个包 ": " Largest {min(20, len(packages))} packages in environment {name} ",
+    "共 {len(packages)} 个包，合计 {format_size(env_size)}；": "{len(packages)} packages, {format_size(env_size)} in total; ",
+    "Copied 为安装时复制或改写、而非硬链接自 pkgs 的部分": "Copied is the part copied or rewritten at install time rather than hardlinked from pkgs",
+    "请按<回车键>继续...": "Please press <Enter> to continue...",
+    "[警告] 抽样核对的 {len(samples)} 个文件中有 {num_mismatches} 个与元数据记录的大小不符，改为遍历文件统计": "[Warning] {num_mismatches} of {len(samples)} sampled files do not match the sizes recorded in the metadata, falling back to walking the files",
+    " 共 {len(orphaned_pkgs)} 个未使用的包": " {len(orphaned_pkgs)} unused packages",
+    "，其余 {len(orphaned_pkgs) - num_shown} 个共 ": ", the other {len(orphaned_pkgs) - num_shown} take ",
+    " 可回收的包 (按大小排序) ": " Reclaimable Packages (by Size) ",
+    "[提示] 输入 S 可按最近使用时间删除 pkgs 中的压缩包与未使用的包，直至其不超过指定大小": "[Tip] Enter S to delete tarballs and unused packages in pkgs by last use until it fits within a given size",
+    "(2) 请输入 pkgs 目录的目标大小 (GiB)，将按最近最少使用的顺序{BOLD(LIGHT_RED('删除'))}：": "(2) Please enter the target size of the pkgs directory (GiB); items will be {BOLD(LIGHT_RED('deleted'))} least recently used first: ",
+    "输入 {LIGHT_YELLOW(x)} 应为非负数，请重新输入：": "Input {LIGHT_YELLOW(x)} should be a non-negative number, please re-enter: ",
+    "[提示] pkgs 目录当前大小为 {format_size(pkgs_size)}，未超过目标大小，无需删除": "[Tip] The pkgs directory is currently {format_size(pkgs_size)}, within the target size; nothing to delete",
+    " pkgs: {pkgs_size:,} → {pkgs_size - freed_size:,} 字节 ": " pkgs: {pkgs_size:,} → {pkgs_size - freed_size:,} bytes ",
+    " 共删除 {len(plan)} 项，释放 {freed_size:,} 字节 ({format_size(freed_size)}) ": " {len(plan)} items to delete, freeing {freed_size:,} bytes ({format_size(freed_size)}) ",
+    "[警告] 删除所有压缩包与未使用的包后仍超过目标大小": "[Warning] pkgs will still exceed the target size after deleting all tarballs and unused packages",
+    "(3) 确认按上述计划删除吗？": "(3) Confirm deletion according to the plan above?",
+    "[提示] 已释放 {freed_size:,} 字节 ({format_size(freed_size)})": "[Tip] Freed {freed_size:,} bytes ({format_size(freed_size)})",
+    "[错误] 删除 {path} 失败：{e}": "[Error] Failed to delete {path}: {e}",
+    "# [设置 8] 程序数据的存储方式，可以是以下值之一：\n#   \"json\": 存储于 data.json 与 size_tree.json，写入时整体替换文件。\n#   \"sqlite\": 存储于 SQLite 数据库 data.db (WAL 模式)，每个 (发行版, 数据键) 及目录大小树的每个节点各占一行，适合\n#       同时运行多个本程序 (如多个终端窗格、定时任务中的 --print-only) 的情况。首次使用时自动导入 data.json 中的数据。": "# [Setting 8] How program data is stored, one of the following values:\n#   \"json\": stored in data.json and size_tree.json; each write replaces the whole file.\n#   \"sqlite\": stored in the SQLite database data.db (WAL mode), one row per (distribution, data key) and per node of the\n#       directory size tree; suited to running several instances at once (e.g. multiple terminal panes, --print-only in\n#       cron jobs). Data in data.json is imported automatically on first use.",
 }
 sorted_keys = sorted(translation_dict.keys(), key=lambda x: len(x), reverse=True)
 sorted_dict = {key: translation_dict[key] for key in sorted_keys}